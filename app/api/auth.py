@@ -1,26 +1,48 @@
+from anyio import to_thread
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from app.database import get_db
-from app.security import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.security import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from app.models.user import User
 from app.schemas.user import Token, UserResponse
+from app.services.password_hash import verify_password_in_pool
 
 router = APIRouter()
 
+# 查询用户，结束事务归还数据库连接，避免校验密码期间占用连接池
+def _find_user(db: Session, username: str):
+    user = db.query(User).filter(User.username == username).first()
+    if user is not None:
+        db.expunge(user)
+    db.rollback()
+    return user
+
+# 按当前哈希参数更新密码哈希
+def _update_password_hash(db: Session, user_id: int, password_hash: str):
+    db.query(User).filter(User.id == user_id).update({"password_hash": password_hash})
+    db.commit()
+
 # 用户登录接口
 @router.post("/login", response_model=Token)
 async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    # 查询用户
-    user = db.query(User).filter(User.username == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # 数据库访问在接口线程池中执行，密码校验在独立的有界线程池中执行，等待期间不占用接口线程
+    user = await to_thread.run_sync(_find_user, db, form_data.username)
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await verify_password_in_pool(form_data.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # 哈希迭代次数已调整时，按新参数重新保存
+    if new_hash:
+        await to_thread.run_sync(_update_password_hash, db, user.id, new_hash)
+    
     # 创建访问令牌
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -1,51 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, or_
 from datetime import datetime
 from typing import List, Optional
-from functools import lru_cache
 from app.database import get_db
 from app.security import get_current_user, check_admin_permission
 from app.models.root_word import RootWord, RootWordStatus
-from app.models.operation_log import RootWordOperationLog, OperationType
+from app.models.operation_log import OperationType
+from app.services.root_word_dictionary import get_root_word_dictionary, refresh_root_word_dictionary
+from app.services.root_word_search import get_root_word_search_index, sync_root_word_search, sync_root_word_search_by_ids
+from app.services.unit_of_work import add_operation_log, mark_effective_unchanged, mark_unchanged, unit_of_work
+from app.services.root_word_batch import BatchConflictError, batch_transition
+from app.services.root_word_import import FAILED, SKIPPED, import_root_words, parse_import_file
+from app.services.check_cache import ddl_check_cache, ddl_digest, normalize_ddl
+from app.services.ddl_check import check_fields, resolve_field
+from app.services.parse_executor import parse_ddl, parse_ddl_columns, iter_tables
+from app.utils.ddl_parser import replace_spans, unwrap_type_span
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.schemas.root_word import (
     RootWordCreate, RootWordResponse, RootWordAudit, RootWordUpdate,
-    DDLCheckRequest, DDLCheckResponse, RootWordListRequest
+    DDLCheckRequest, DDLCheckResponse, DDLBatchCheckRequest, RootWordListRequest,
+    RootWordBatchRequest, RootWordBatchAudit
 )
 import sqlparse
-import re
+import json
+import orjson
 
 router = APIRouter()
 
-# 缓存：获取所有词根（用于DDL校验）
-@lru_cache(maxsize=1)
-def get_all_root_words_cached():
-    """缓存所有词根，5分钟过期"""
-    from app.database import SessionLocal
-    db = SessionLocal()
-    try:
-        root_words = db.query(RootWord).filter(
-            and_(
-                RootWord.delete_flag == 0,
-                RootWord.status == RootWordStatus.EFFECTIVE
-            )
-        ).all()
-        return [
-            {
-                "word_name": rw.word_name,
-                "mysql_type": rw.mysql_type,
-                "doris_type": rw.doris_type,
-                "clickhouse_type": rw.clickhouse_type,
-                "remark": rw.remark
-            }
-            for rw in root_words
-        ]
-    finally:
-        db.close()
+# 列表接口可返回的字段
+LIST_FIELDS = tuple(RootWordResponse.model_fields)
 
 # 创建词根申请
 @router.post("/apply", response_model=dict)
-async def apply_root_word(
+def apply_root_word(
     root_word_data: RootWordCreate,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -58,28 +47,28 @@ async def apply_root_word(
     if existing_root_word:
         # 如果词根已废弃（delete_flag=1），则恢复并更新为待审核状态
         if existing_root_word.delete_flag == 1 or existing_root_word.status == RootWordStatus.DISCARDED:
-            existing_root_word.mysql_type = root_word_data.mysql_type
-            existing_root_word.doris_type = root_word_data.doris_type
-            existing_root_word.clickhouse_type = root_word_data.clickhouse_type
-            existing_root_word.remark = root_word_data.remark
-            existing_root_word.status = RootWordStatus.PENDING_AUDIT
-            existing_root_word.apply_user = current_user.get("username")
-            existing_root_word.apply_time = datetime.utcnow()
-            existing_root_word.delete_flag = 0
-            existing_root_word.audit_user = None
-            existing_root_word.audit_time = None
-            existing_root_word.audit_remark = None
-            db.commit()
+            # 词根变更与操作日志在同一事务中提交
+            with unit_of_work(db):
+                existing_root_word.mysql_type = root_word_data.mysql_type
+                existing_root_word.doris_type = root_word_data.doris_type
+                existing_root_word.clickhouse_type = root_word_data.clickhouse_type
+                existing_root_word.remark = root_word_data.remark
+                existing_root_word.status = RootWordStatus.PENDING_AUDIT
+                existing_root_word.apply_user = current_user.get("username")
+                existing_root_word.apply_time = datetime.utcnow()
+                existing_root_word.delete_flag = 0
+                existing_root_word.audit_user = None
+                existing_root_word.audit_time = None
+                existing_root_word.audit_remark = None
+                add_operation_log(
+                    db, existing_root_word.id, OperationType.CREATE, current_user.get("username"),
+                    f"重新申请已废弃词根：{root_word_data.word_name}"
+                )
+                # 待审核词根不影响词典快照
+                mark_effective_unchanged(db)
             
-            # 插入操作日志
-            operation_log = RootWordOperationLog(
-                word_id=existing_root_word.id,
-                operation_type=OperationType.CREATE,
-                operation_user=current_user.get("username"),
-                operation_content=f"重新申请已废弃词根：{root_word_data.word_name}"
-            )
-            db.add(operation_log)
-            db.commit()
+            # 同步检索索引
+            sync_root_word_search(db, existing_root_word)
             
             return {
                 "code": 200,
@@ -98,30 +87,30 @@ async def apply_root_word(
     # 校验类型格式是否符合各引擎规范
     # 这里可以添加更详细的类型校验逻辑
     
-    # 插入词根表
-    new_root_word = RootWord(
-        word_name=root_word_data.word_name,
-        mysql_type=root_word_data.mysql_type,
-        doris_type=root_word_data.doris_type,
-        clickhouse_type=root_word_data.clickhouse_type,
-        remark=root_word_data.remark,
-        status=RootWordStatus.PENDING_AUDIT,
-        apply_user=current_user.get("username"),
-        apply_time=datetime.utcnow()
-    )
-    db.add(new_root_word)
-    db.commit()
-    db.refresh(new_root_word)
-    
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=new_root_word.id,
-        operation_type=OperationType.CREATE,
-        operation_user=current_user.get("username"),
-        operation_content=f"创建词根：{root_word_data.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 插入词根表
+        new_root_word = RootWord(
+            word_name=root_word_data.word_name,
+            mysql_type=root_word_data.mysql_type,
+            doris_type=root_word_data.doris_type,
+            clickhouse_type=root_word_data.clickhouse_type,
+            remark=root_word_data.remark,
+            status=RootWordStatus.PENDING_AUDIT,
+            apply_user=current_user.get("username"),
+            apply_time=datetime.utcnow()
+        )
+        db.add(new_root_word)
+        db.flush()
+        add_operation_log(
+            db, new_root_word.id, OperationType.CREATE, current_user.get("username"),
+            f"创建词根：{root_word_data.word_name}"
+        )
+        # 待审核词根不影响词典快照
+        mark_effective_unchanged(db)
+    
+    # 同步检索索引
+    sync_root_word_search(db, new_root_word)
     
     return {
         "code": 200,
@@ -131,9 +120,41 @@ async def apply_root_word(
         }
     }
 
+# 批量导入词根（管理员）
+@router.post("/import", response_model=dict)
+def import_root_word(
+    file: UploadFile = File(..., description="CSV（首行为列名）或 JSON（对象数组）文件"),
+    overwrite: bool = Form(False, description="已存在的词根是否覆盖类型和注释"),
+    current_user: dict = Depends(check_admin_permission),
+    db: Session = Depends(get_db)
+):
+    try:
+        rows = parse_import_file(file.filename or "", file.file.read())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    # 查询、插入、更新、写日志在同一事务中完成，失败整体回滚
+    with unit_of_work(db):
+        result = import_root_words(db, rows, current_user.get("username"), overwrite)
+    
+    # 刷新词典快照与检索索引
+    refresh_root_word_dictionary(db)
+    sync_root_word_search_by_ids(db, [
+        item["word_id"] for item in result["results"] if item["result"] not in (FAILED, SKIPPED)
+    ])
+    
+    return {
+        "code": 200,
+        "msg": "词根批量导入完成",
+        "data": result
+    }
+
 # 删除待审核词根
 @router.delete("/delete-pending/{word_id}", response_model=dict)
-async def delete_pending_root_word(
+def delete_pending_root_word(
     word_id: int,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -165,19 +186,18 @@ async def delete_pending_root_word(
             detail="只能删除自己申请的词根"
         )
     
-    # 逻辑删除词根
-    root_word.delete_flag = 1
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 逻辑删除词根
+        root_word.delete_flag = 1
+        add_operation_log(
+            db, word_id, OperationType.DELETE, current_user.get("username"),
+            f"删除待审核词根：{root_word.word_name}"
+        )
+        mark_effective_unchanged(db)
     
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=word_id,
-        operation_type=OperationType.DELETE,
-        operation_user=current_user.get("username"),
-        operation_content=f"删除待审核词根：{root_word.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 同步检索索引
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -185,283 +205,177 @@ async def delete_pending_root_word(
         "data": {}
     }
 
-# 识别数据库引擎
-def identify_database_engine(ddl_content: str) -> str:
-    """识别DDL语句所属的数据库引擎"""
-    ddl_lower = ddl_content.lower()
-    
-    # ClickHouse 特征 - 特定的MergeTree引擎类型
-    if 'replacingmergetree' in ddl_lower or 'mergetree(' in ddl_lower or 'summingmergetree' in ddl_lower:
-        return 'clickhouse'
-    # Doris 特征
-    elif 'doris' in ddl_lower or 'duplicate key' in ddl_lower or 'engine = olap' in ddl_lower or 'distributed by' in ddl_lower:
-        return 'doris'
-    # MySQL 特征（默认）
-    else:
-        return 'mysql'
-
-# 提取字段信息
-def extract_fields(ddl_content: str) -> list:
-    """从DDL语句中提取字段信息，返回 (字段名, 字段类型, 字段注释) 的列表"""
-    fields = []
-    debug_info = {"steps": []}
-    
-    # 清理DDL内容，移除多余的空白和注释
-    clean_ddl = re.sub(r'--.*$', '', ddl_content, flags=re.MULTILINE)
-    clean_ddl = re.sub(r'/\*.*?\*/', '', clean_ddl, flags=re.DOTALL)
-    clean_ddl = clean_ddl.strip()
-    debug_info["steps"].append(f"清理后的DDL长度: {len(clean_ddl)}")
-    
-    # 查找CREATE TABLE语句中的字段定义部分
-    # 匹配 CREATE TABLE table_name ( 后的内容，支持反引号包裹的表名
-    table_match = re.search(
-        r'create\s+table\s+(?:`?[^`\(]+`?\s*)\((.*)',
-        clean_ddl, 
-        re.DOTALL | re.IGNORECASE
-    )
-    
-    if not table_match:
-        debug_info["steps"].append("未匹配到CREATE TABLE语句")
-        # 尝试更宽松的匹配
-        table_match = re.search(
-            r'create\s+table\s+.*\((.*)',
-            clean_ddl, 
-            re.DOTALL | re.IGNORECASE
-        )
-    
-    if table_match:
-        table_body = table_match.group(1)
-        debug_info["steps"].append(f"提取到表体内容，长度: {len(table_body)}")
-        debug_info["table_body_preview"] = table_body[:200] + "..." if len(table_body) > 200 else table_body
-        
-        # 找到最后一个闭合括号之前的所有内容（排除表级约束和引擎定义）
-        # 找到 ENGINE、PARTITION BY、ORDER BY、SETTINGS 等关键字之前的部分
-        # 注意：COMMENT 在字段级别使用，不应该作为结束标记
-        end_keywords = ['ENGINE', 'PARTITION BY', 'ORDER BY', 'SETTINGS', 'DISTRIBUTED BY']
-        end_pos = len(table_body)
-        for keyword in end_keywords:
-            # 匹配 ') KEYWORD' 或 ')\nKEYWORD' 模式（表级关键字）
-            pattern = re.compile(r'\s*\)\s*' + keyword, re.IGNORECASE)
-            match = pattern.search(table_body)
-            if match:
-                end_pos = min(end_pos, match.start())
-        
-        if end_pos < len(table_body):
-            table_body = table_body[:end_pos]
-            debug_info["steps"].append(f"截断到引擎定义前，新长度: {len(table_body)}")
-        
-        # 分割字段定义，考虑括号内的逗号
-        field_defs = []
-        depth = 0
-        current_field = ""
-        
-        for char in table_body:
-            if char == '(':
-                depth += 1
-                current_field += char
-            elif char == ')':
-                if depth > 0:
-                    depth -= 1
-                current_field += char
-            elif char == ',' and depth == 0:
-                if current_field.strip():
-                    field_defs.append(current_field.strip())
-                current_field = ""
-            else:
-                current_field += char
-        
-        # 添加最后一个字段
-        if current_field.strip():
-            field_defs.append(current_field.strip())
-        
-        debug_info["steps"].append(f"分割得到 {len(field_defs)} 个字段定义")
-        if field_defs:
-            debug_info["first_field_preview"] = field_defs[0][:100] if len(field_defs[0]) > 100 else field_defs[0]
-        
-        # 解析每个字段定义
-        for i, field_def in enumerate(field_defs):
-            field_def = field_def.strip()
-            if not field_def:
-                continue
-            
-            debug_info["steps"].append(f"处理字段 {i+1}: {field_def[:50]}...")
-            
-            # 跳过约束定义
-            if field_def.lower().startswith(('primary key', 'unique', 'foreign key', 'key', 'index', 'constraint')):
-                debug_info["steps"].append(f"  跳过约束定义")
-                continue
-            
-            # 匹配字段名和类型
-            # 字段名可以是：字母数字下划线，或者被反引号包裹
-            # 类型可能包含括号，如 varchar(32)，或者不带括号如 DateTime
-            # ClickHouse 类型可能包含 Nullable() 包装
-            # 需要处理 COMMENT 注释
-            
-            # 提取 COMMENT 内容（支持单引号、双引号、反引号包裹的注释）
-            comment_match = re.search(r"\s+COMMENT\s+(['\"`])(.*?)\1", field_def, flags=re.IGNORECASE)
-            field_comment = comment_match.group(2) if comment_match else ""
-            
-            # 移除 COMMENT 部分用于匹配字段名和类型
-            field_def_no_comment = re.sub(r"\s+COMMENT\s+(['\"`]).*?\1", '', field_def, flags=re.IGNORECASE)
-            
-            field_match = re.match(
-                r'^`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+(Nullable\()?([a-zA-Z][a-zA-Z0-9_]*(?:\([^)]*\))?)(\))?',
-                field_def_no_comment,
-                re.IGNORECASE
-            )
-            
-            if field_match:
-                field_name = field_match.group(1)
-                # 组合类型，包括 Nullable 包装
-                nullable_prefix = field_match.group(2) or ""
-                base_type = field_match.group(3)
-                nullable_suffix = field_match.group(4) or ""
-                field_type = f"{nullable_prefix}{base_type}{nullable_suffix}"
-                # 返回三元组：(字段名, 字段类型, 字段注释)
-                fields.append((field_name, field_type, field_comment))
-                debug_info["steps"].append(f"  成功匹配: {field_name} - {field_type} - 注释: {field_comment[:20] if field_comment else '无'}")
-            else:
-                debug_info["steps"].append(f"  未匹配到字段名和类型")
-    else:
-        debug_info["steps"].append("未能提取表体内容")
-    
-    # 将调试信息附加到函数上，供调用者使用
-    extract_fields.debug_info = debug_info
-    return fields
-
 # DDL 词根校验
 @router.post("/ddl/check", response_model=DDLCheckResponse)
-async def check_ddl_root_word(
+def check_ddl_root_word(
     ddl_request: DDLCheckRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: dict = Depends(get_current_user)
 ):
-    # 识别数据库引擎
-    db_engine = identify_database_engine(ddl_request.ddl_content)
+    # 相同 DDL 在词典未变化时直接返回缓存结果（调试请求不走缓存）
+    dictionary = get_root_word_dictionary()
+    ddl_content = normalize_ddl(ddl_request.ddl_content)
+    digest = ddl_digest(ddl_content)
+    if not ddl_request.debug:
+        cached = ddl_check_cache.get(digest, dictionary.version)
+        if cached is not None:
+            return cached
     
-    # 提取表字段
-    fields = extract_fields(ddl_request.ddl_content)
+    # 识别数据库引擎并提取表字段（大输入在进程池中解析），仅在请求调试时收集解析过程
+    db_engine, fields, debug_info = parse_ddl(ddl_content, ddl_request.debug)
     
-    # 校验词根
-    compliant_fields = []
-    non_compliant_fields = []
-    missing_root_words = []
-    
-    for field_name, field_type, field_comment in fields:
-        # 直接查询词根表，匹配完整的字段名
-        root_word = db.query(RootWord).filter(
-            and_(
-                RootWord.word_name == field_name,
-                RootWord.status == RootWordStatus.EFFECTIVE,
-                RootWord.delete_flag == 0
-            )
-        ).first()
-        
-        if root_word:
-            # 根据数据库引擎选择对应的类型
-            if db_engine == 'mysql':
-                standard_type = root_word.mysql_type
-            elif db_engine == 'doris':
-                standard_type = root_word.doris_type
-            else:  # clickhouse
-                standard_type = root_word.clickhouse_type
-            
-            # 简单校验类型
-            if field_type.lower() == standard_type.lower():
-                compliant_fields.append({
-                    "field_name": field_name,
-                    "field_type": field_type,
-                    "field_comment": field_comment,
-                    "root_word": field_name,
-                    "standard_type": standard_type,
-                    "remark": root_word.remark
-                })
-            else:
-                non_compliant_fields.append({
-                    "field_name": field_name,
-                    "field_type": field_type,
-                    "field_comment": field_comment,
-                    "root_word": field_name,
-                    "standard_type": standard_type,
-                    "remark": root_word.remark,
-                    "reason": "类型不一致"
-                })
-        else:
-            # 词根不存在，添加到缺失列表
-            if field_name not in [word['word_name'] for word in missing_root_words]:
-                missing_root_words.append({
-                    "word_name": field_name,
-                    "suggested_type": field_type,
-                    "field_comment": field_comment
-                })
-            
-            non_compliant_fields.append({
-                "field_name": field_name,
-                "field_type": field_type,
-                "field_comment": field_comment,
-                "reason": "未找到匹配的词根"
-            })
+    # 校验词根（只读取内存词典快照，不查询数据库）
+    result = check_fields(fields, db_engine, dictionary)
     
     # 不记录 DDL 校验的操作日志，因为没有具体的词根 ID
     # 避免外键约束错误
     
-    # 获取调试信息
-    debug_info = getattr(extract_fields, 'debug_info', {})
-    
-    return DDLCheckResponse(
+    response = DDLCheckResponse(
         code=200,
         msg="DDL 校验完成" if len(fields) > 0 else "DDL 校验完成：未提取到字段信息",
         data={
-            "compliant_fields": compliant_fields,
-            "non_compliant_fields": non_compliant_fields,
-            "missing_root_words": missing_root_words,
+            "compliant_fields": result["compliant_fields"],
+            "non_compliant_fields": result["non_compliant_fields"],
+            "missing_root_words": result["missing_root_words"],
             "database_engine": db_engine,
             "parsed_fields": [{"field_name": f[0], "field_type": f[1], "field_comment": f[2]} for f in fields],
             "debug_info": debug_info
         }
     )
+    if not ddl_request.debug:
+        ddl_check_cache.put(digest, dictionary.version, response)
+    return response
+
+# DDL 校验结果缓存统计（管理员）
+@router.get("/ddl/cache-stats", response_model=dict)
+def get_ddl_check_cache_stats(
+    current_user: dict = Depends(check_admin_permission)
+):
+    return {
+        "code": 200,
+        "msg": "查询成功",
+        "data": ddl_check_cache.stats()
+    }
+
+# 批量 DDL 词根校验（多语句脚本，如 mysqldump --no-data 导出）
+@router.post("/ddl/check-batch", response_model=DDLCheckResponse)
+def check_ddl_batch(
+    ddl_request: DDLBatchCheckRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    # 所有表共用同一个词典快照
+    dictionary = get_root_word_dictionary()
+    tables = []
+    missing_root_words = []
+    missing_names = set()
+    compliant_table_count = 0
+    
+    for table in iter_tables(ddl_request.ddl_content):
+        result = check_fields(table.fields, table.database_engine, dictionary)
+        compliant = not result["non_compliant_fields"]
+        if compliant:
+            compliant_table_count += 1
+        
+        # 汇总所有表的缺失词根
+        for word in result["missing_root_words"]:
+            if word["word_name"] not in missing_names:
+                missing_names.add(word["word_name"])
+                missing_root_words.append(word)
+        
+        tables.append({
+            "table_name": table.table_name,
+            "database_engine": table.database_engine,
+            "field_count": len(table.fields),
+            "compliant": compliant,
+            **result
+        })
+    
+    return DDLCheckResponse(
+        code=200,
+        msg="批量 DDL 校验完成" if tables else "批量 DDL 校验完成：未提取到建表语句",
+        data={
+            "tables": tables,
+            "table_count": len(tables),
+            "compliant_table_count": compliant_table_count,
+            "missing_root_words": missing_root_words,
+            "dictionary_version": dictionary.version
+        }
+    )
+
+# 流式批量 DDL 词根校验（NDJSON，每解析校验完一张表即输出一行）
+@router.post("/ddl/check-stream")
+def check_ddl_stream(
+    ddl_request: DDLBatchCheckRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    dictionary = get_root_word_dictionary()
+    
+    def generate():
+        table_count = 0
+        compliant_table_count = 0
+        for table in iter_tables(ddl_request.ddl_content):
+            result = check_fields(table.fields, table.database_engine, dictionary)
+            compliant = not result["non_compliant_fields"]
+            table_count += 1
+            if compliant:
+                compliant_table_count += 1
+            yield json.dumps({
+                "type": "table",
+                "table_name": table.table_name,
+                "database_engine": table.database_engine,
+                "field_count": len(table.fields),
+                "compliant": compliant,
+                **result
+            }, ensure_ascii=False) + "\n"
+        
+        # 最后一行输出汇总信息
+        yield json.dumps({
+            "type": "summary",
+            "table_count": table_count,
+            "compliant_table_count": compliant_table_count,
+            "dictionary_version": dictionary.version
+        }, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 # 词根替换（DDL 属性替换）
 @router.post("/ddl/replace", response_model=dict)
-async def replace_ddl_root_word(
+def replace_ddl_root_word(
     ddl_request: DDLCheckRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: dict = Depends(get_current_user)
 ):
-    # 识别数据库引擎
-    db_engine = identify_database_engine(ddl_request.ddl_content)
-    ddl_content = ddl_request.ddl_content
-    
-    # 提取表字段并替换类型
-    fields = extract_fields(ddl_request.ddl_content)
-    
-    for field_name, old_type, field_comment in fields:
-        # 提取词根（简单按下划线拆分）
-        parts = field_name.split('_')
-        for part in parts:
-            # 查询词根
-            root_word = db.query(RootWord).filter(
-                and_(
-                    RootWord.word_name == part,
-                    RootWord.status == RootWordStatus.EFFECTIVE,
-                    RootWord.delete_flag == 0
-                )
-            ).first()
-            if root_word:
-                # 根据数据库引擎选择对应的类型
-                if db_engine == 'mysql':
-                    new_type = root_word.mysql_type
-                elif db_engine == 'doris':
-                    new_type = root_word.doris_type
-                else:  # clickhouse
-                    new_type = root_word.clickhouse_type
-                
-                # 替换类型
-                ddl_content = ddl_content.replace(
-                    f"{field_name} {old_type}",
-                    f"{field_name} {new_type}"
-                )
-                break
+    # 识别数据库引擎并提取表字段及类型偏移（大输入在进程池中解析）
+    db_engine, columns = parse_ddl_columns(ddl_request.ddl_content)
+    
+    # 收集需要替换的类型片段（只读取内存词典快照，不查询数据库）
+    dictionary = get_root_word_dictionary()
+    replacements = []
+    replaced_fields = []
+    for column in columns:
+        # 与 DDL 校验使用同一匹配规则，只有部分片段是词根的字段不替换
+        entry = resolve_field(column.field_name, dictionary).entry
+        if entry is None:
+            continue
+        
+        # 根据数据库引擎选择对应的类型
+        new_type = entry.standard_type(db_engine)
+        if not entry.type_matches(db_engine, column.field_type):
+            # 只改写 Nullable/LowCardinality 包装内的类型，保留可空性（标准类型自带包装时整体替换）
+            start, end = column.type_start, column.type_end
+            if unwrap_type_span(new_type, 0, len(new_type)) == (0, len(new_type)):
+                start, end = unwrap_type_span(ddl_request.ddl_content, start, end)
+            replacements.append((start, end, new_type))
+            replaced_fields.append({
+                "field_name": column.field_name,
+                "old_type": column.field_type,
+                "new_type": (
+                    ddl_request.ddl_content[column.type_start:start] + new_type
+                    + ddl_request.ddl_content[end:column.type_end]
+                ),
+                "root_word": entry.word_name
+            })
+    
+    # 按偏移一次性重建 DDL，只改写字段类型本身
+    ddl_content = replace_spans(ddl_request.ddl_content, replacements)
     
     # 不记录 DDL 替换的操作日志，因为没有具体的词根 ID
     # 避免外键约束错误
@@ -471,13 +385,14 @@ async def replace_ddl_root_word(
         "msg": "DDL 词根替换完成",
         "data": {
             "replaced_ddl": ddl_content,
+            "replaced_fields": replaced_fields,
             "database_engine": db_engine
         }
     }
 
 # 审核词根（管理员）
 @router.post("/audit", response_model=dict)
-async def audit_root_word(
+def audit_root_word(
     audit_data: RootWordAudit,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -502,32 +417,35 @@ async def audit_root_word(
             detail="只能审核待审核状态的词根"
         )
     
-    # 更新词根状态
-    if audit_data.audit_result == 1:
-        # 通过
-        root_word.status = RootWordStatus.EFFECTIVE
-        root_word.audit_user = current_user.get("username")
-        root_word.audit_time = datetime.utcnow()
-        root_word.audit_remark = audit_data.audit_remark
-        operation_content = f"审核通过词根：{root_word.word_name}"
-    else:
-        # 驳回
-        root_word.audit_user = current_user.get("username")
-        root_word.audit_time = datetime.utcnow()
-        root_word.audit_remark = audit_data.audit_remark
-        operation_content = f"审核驳回词根：{root_word.word_name}，原因：{audit_data.audit_remark}"
-    
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 更新词根状态
+        if audit_data.audit_result == 1:
+            # 通过
+            root_word.status = RootWordStatus.EFFECTIVE
+            root_word.audit_user = current_user.get("username")
+            root_word.audit_time = datetime.utcnow()
+            root_word.audit_remark = audit_data.audit_remark
+            operation_content = f"审核通过词根：{root_word.word_name}"
+        else:
+            # 驳回
+            root_word.audit_user = current_user.get("username")
+            root_word.audit_time = datetime.utcnow()
+            root_word.audit_remark = audit_data.audit_remark
+            operation_content = f"审核驳回词根：{root_word.word_name}，原因：{audit_data.audit_remark}"
+    
+        add_operation_log(
+            db, audit_data.word_id, OperationType.AUDIT, current_user.get("username"),
+            operation_content
+        )
+        # 驳回的词根仍未生效，不影响词典快照
+        if audit_data.audit_result != 1:
+            mark_effective_unchanged(db)
     
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=audit_data.word_id,
-        operation_type=OperationType.AUDIT,
-        operation_user=current_user.get("username"),
-        operation_content=operation_content
-    )
-    db.add(operation_log)
-    db.commit()
+    # 刷新词典快照与检索索引
+    if audit_data.audit_result == 1:
+        refresh_root_word_dictionary(db)
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -537,7 +455,7 @@ async def audit_root_word(
 
 # 废弃已生效词根（管理员）
 @router.post("/discard/{word_id}", response_model=dict)
-async def discard_root_word(
+def discard_root_word(
     word_id: int,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -562,19 +480,18 @@ async def discard_root_word(
             detail="只能废弃已生效状态的词根"
         )
     
-    # 更新状态为已废弃
-    root_word.status = RootWordStatus.DISCARDED
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 更新状态为已废弃
+        root_word.status = RootWordStatus.DISCARDED
+        add_operation_log(
+            db, word_id, OperationType.DISCARD, current_user.get("username"),
+            f"废弃词根：{root_word.word_name}"
+        )
     
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=word_id,
-        operation_type=OperationType.DISCARD,
-        operation_user=current_user.get("username"),
-        operation_content=f"废弃词根：{root_word.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 刷新词典快照与检索索引
+    refresh_root_word_dictionary(db)
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -584,7 +501,7 @@ async def discard_root_word(
 
 # 编辑词根（管理员）
 @router.put("/update", response_model=dict)
-async def update_root_word(
+def update_root_word(
     update_data: RootWordUpdate,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -602,43 +519,47 @@ async def update_root_word(
             detail="词根不存在"
         )
     
-    # 如果修改了词根名称，检查是否与其他词根冲突
-    if update_data.word_name and update_data.word_name != root_word.word_name:
-        existing = db.query(RootWord).filter(
-            and_(
-                RootWord.word_name == update_data.word_name,
-                RootWord.delete_flag == 0,
-                RootWord.id != update_data.word_id
-            )
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="词根名称已存在"
-            )
-        root_word.word_name = update_data.word_name
-    
-    # 更新其他字段
-    if update_data.mysql_type:
-        root_word.mysql_type = update_data.mysql_type
-    if update_data.doris_type:
-        root_word.doris_type = update_data.doris_type
-    if update_data.clickhouse_type:
-        root_word.clickhouse_type = update_data.clickhouse_type
-    if update_data.remark is not None:
-        root_word.remark = update_data.remark
-    
-    db.commit()
-    
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=update_data.word_id,
-        operation_type=OperationType.UPDATE,
-        operation_user=current_user.get("username"),
-        operation_content=f"编辑词根：{root_word.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 如果修改了词根名称，检查是否与其他词根冲突
+        if update_data.word_name and update_data.word_name != root_word.word_name:
+            existing = db.query(RootWord).filter(
+                and_(
+                    RootWord.word_name == update_data.word_name,
+                    RootWord.delete_flag == 0,
+                    RootWord.id != update_data.word_id
+                )
+            ).first()
+            if existing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="词根名称已存在"
+                )
+            root_word.word_name = update_data.word_name
+        
+        # 更新其他字段
+        if update_data.mysql_type:
+            root_word.mysql_type = update_data.mysql_type
+        if update_data.doris_type:
+            root_word.doris_type = update_data.doris_type
+        if update_data.clickhouse_type:
+            root_word.clickhouse_type = update_data.clickhouse_type
+        if update_data.remark is not None:
+            root_word.remark = update_data.remark
+        
+        add_operation_log(
+            db, update_data.word_id, OperationType.UPDATE, current_user.get("username"),
+            f"编辑词根：{root_word.word_name}"
+        )
+        # 编辑不改变状态，只有已生效词根的编辑影响词典快照
+        effective = root_word.status == RootWordStatus.EFFECTIVE
+        if not effective:
+            mark_effective_unchanged(db)
+    
+    # 刷新词典快照与检索索引
+    if effective:
+        refresh_root_word_dictionary(db)
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -655,7 +576,7 @@ async def update_root_word(
 
 # 强制删除词根（管理员）
 @router.delete("/force-delete/{word_id}", response_model=dict)
-async def force_delete_root_word(
+def force_delete_root_word(
     word_id: int,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -673,19 +594,22 @@ async def force_delete_root_word(
             detail="词根不存在"
         )
     
-    # 逻辑删除词根
-    root_word.delete_flag = 1
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 逻辑删除词根
+        root_word.delete_flag = 1
+        add_operation_log(
+            db, word_id, OperationType.DELETE, current_user.get("username"),
+            f"强制删除词根：{root_word.word_name}"
+        )
+        effective = root_word.status == RootWordStatus.EFFECTIVE
+        if not effective:
+            mark_effective_unchanged(db)
     
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=word_id,
-        operation_type=OperationType.DELETE,
-        operation_user=current_user.get("username"),
-        operation_content=f"强制删除词根：{root_word.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 刷新词典快照与检索索引
+    if effective:
+        refresh_root_word_dictionary(db)
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -695,7 +619,7 @@ async def force_delete_root_word(
 
 # 恢复废弃词根（管理员）
 @router.post("/recover/{word_id}", response_model=dict)
-async def recover_root_word(
+def recover_root_word(
     word_id: int,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -720,19 +644,18 @@ async def recover_root_word(
             detail="只能恢复已废弃状态的词根"
         )
     
-    # 更新状态为已生效
-    root_word.status = RootWordStatus.EFFECTIVE
-    db.commit()
+    # 词根变更与操作日志在同一事务中提交
+    with unit_of_work(db):
+        # 更新状态为已生效
+        root_word.status = RootWordStatus.EFFECTIVE
+        add_operation_log(
+            db, word_id, OperationType.RECOVER, current_user.get("username"),
+            f"恢复词根：{root_word.word_name}"
+        )
     
-    # 插入操作日志
-    operation_log = RootWordOperationLog(
-        word_id=word_id,
-        operation_type=OperationType.RECOVER,
-        operation_user=current_user.get("username"),
-        operation_content=f"恢复词根：{root_word.word_name}"
-    )
-    db.add(operation_log)
-    db.commit()
+    # 刷新词典快照与检索索引
+    refresh_root_word_dictionary(db)
+    sync_root_word_search(db, root_word)
     
     return {
         "code": 200,
@@ -740,61 +663,202 @@ async def recover_root_word(
         "data": {}
     }
 
+# 执行批量状态变更并提交（状态变更不涉及词根名称和注释，检索索引只需推进版本）
+def _commit_batch(db: Session, changes_effective: bool = True, **kwargs) -> dict:
+    """changes_effective 为 False 表示变更前后词根均未生效（如批量驳回），不影响词典快照"""
+    try:
+        with unit_of_work(db):
+            result = batch_transition(db, **kwargs)
+            if not result["succeeded"]:
+                # 全部失败时不递增版本号，避免各 worker 无谓地重新加载词典、清空校验缓存
+                mark_unchanged(db)
+            elif not changes_effective:
+                mark_effective_unchanged(db)
+    except BatchConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="词根状态已被其他操作修改，请刷新后重试"
+        )
+    
+    # 刷新词典快照，推进检索索引版本
+    if result["succeeded"]:
+        if changes_effective:
+            refresh_root_word_dictionary(db)
+        sync_root_word_search_by_ids(db, [])
+    return result
+
+# 批量审核词根（管理员）
+@router.post("/batch-audit", response_model=dict)
+def batch_audit_root_word(
+    audit_data: RootWordBatchAudit,
+    current_user: dict = Depends(check_admin_permission),
+    db: Session = Depends(get_db)
+):
+    values = {
+        "audit_user": current_user.get("username"),
+        "audit_time": datetime.utcnow(),
+        "audit_remark": audit_data.audit_remark
+    }
+    if audit_data.audit_result == 1:
+        values["status"] = RootWordStatus.EFFECTIVE
+        content = lambda word_name: f"审核通过词根：{word_name}"
+    else:
+        content = lambda word_name: f"审核驳回词根：{word_name}，原因：{audit_data.audit_remark}"
+    
+    result = _commit_batch(
+        db,
+        changes_effective=audit_data.audit_result == 1,
+        word_ids=audit_data.word_ids,
+        from_status=RootWordStatus.PENDING_AUDIT,
+        values=values,
+        operation_type=OperationType.AUDIT,
+        username=current_user.get("username"),
+        content=content,
+        status_message="只能审核待审核状态的词根"
+    )
+    return {
+        "code": 200,
+        "msg": "词根批量审核完成",
+        "data": result
+    }
+
+# 批量废弃已生效词根（管理员）
+@router.post("/batch-discard", response_model=dict)
+def batch_discard_root_word(
+    batch_data: RootWordBatchRequest,
+    current_user: dict = Depends(check_admin_permission),
+    db: Session = Depends(get_db)
+):
+    result = _commit_batch(
+        db,
+        word_ids=batch_data.word_ids,
+        from_status=RootWordStatus.EFFECTIVE,
+        values={"status": RootWordStatus.DISCARDED},
+        operation_type=OperationType.DISCARD,
+        username=current_user.get("username"),
+        content=lambda word_name: f"废弃词根：{word_name}",
+        status_message="只能废弃已生效状态的词根"
+    )
+    return {
+        "code": 200,
+        "msg": "词根批量废弃完成",
+        "data": result
+    }
+
+# 批量恢复废弃词根（管理员）
+@router.post("/batch-recover", response_model=dict)
+def batch_recover_root_word(
+    batch_data: RootWordBatchRequest,
+    current_user: dict = Depends(check_admin_permission),
+    db: Session = Depends(get_db)
+):
+    result = _commit_batch(
+        db,
+        word_ids=batch_data.word_ids,
+        from_status=RootWordStatus.DISCARDED,
+        values={"status": RootWordStatus.EFFECTIVE},
+        operation_type=OperationType.RECOVER,
+        username=current_user.get("username"),
+        content=lambda word_name: f"恢复词根：{word_name}",
+        status_message="只能恢复已废弃状态的词根"
+    )
+    return {
+        "code": 200,
+        "msg": "词根批量恢复完成",
+        "data": result
+    }
+
 # 词根列表查询
 @router.post("/list", response_model=dict)
-async def list_root_word(
+def list_root_word(
     query_data: RootWordListRequest,
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    # 构建查询
-    query = db.query(RootWord).filter(RootWord.delete_flag == 0)
+    # 只查询需要返回的列，id 始终返回（游标分页依赖）
+    fields = list(query_data.fields or LIST_FIELDS)
+    unknown = [field for field in fields if field not in LIST_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"不支持的字段: {', '.join(unknown)}"
+        )
+    if "id" not in fields:
+        fields.insert(0, "id")
+    query = db.query(*(getattr(RootWord, field) for field in fields)).filter(RootWord.delete_flag == 0)
     
     # 应用筛选条件
+    # 子串查询优先走内存检索索引，查询词过短、命中过多或索引正在重建时退回 LIKE
+    search_index = get_root_word_search_index(db) if query_data.word_name or query_data.keyword else None
     if query_data.word_name:
-        query = query.filter(RootWord.word_name.like(f"%{query_data.word_name}%"))
+        word_ids = search_index.search_word_name(query_data.word_name) if search_index else None
+        if word_ids is None:
+            query = query.filter(RootWord.word_name.like(f"%{query_data.word_name}%"))
+        else:
+            query = query.filter(RootWord.id.in_(word_ids))
+    if query_data.keyword:
+        word_ids = search_index.search_keyword(query_data.keyword) if search_index else None
+        if word_ids is None:
+            query = query.filter(or_(
+                RootWord.word_name.like(f"%{query_data.keyword}%"),
+                RootWord.remark.like(f"%{query_data.keyword}%")
+            ))
+        else:
+            query = query.filter(RootWord.id.in_(word_ids))
     if query_data.status:
         query = query.filter(RootWord.status == query_data.status)
     if query_data.apply_user:
         query = query.filter(RootWord.apply_user == query_data.apply_user)
     
-    # 计算总数
-    total = query.count()
-    
-    # 分页
-    offset = (query_data.page_num - 1) * query_data.page_size
-    root_words = query.offset(offset).limit(query_data.page_size).all()
-    
-    # 构建响应数据
-    items = []
-    for root_word in root_words:
-        items.append(
-            RootWordResponse(
-                id=root_word.id,
-                word_name=root_word.word_name,
-                mysql_type=root_word.mysql_type,
-                doris_type=root_word.doris_type,
-                clickhouse_type=root_word.clickhouse_type,
-                remark=root_word.remark,
-                status=root_word.status,
-                apply_user=root_word.apply_user,
-                apply_time=root_word.apply_time,
-                audit_user=root_word.audit_user,
-                audit_time=root_word.audit_time,
-                audit_remark=root_word.audit_remark,
-                delete_flag=root_word.delete_flag,
-                create_time=root_word.create_time,
-                update_time=root_word.update_time
-            )
-        )
+    # 总数仅在需要时统计，游标分页默认不统计
+    with_total = query_data.with_total if query_data.with_total is not None else query_data.cursor is None
+    total = query.count() if with_total else None
     
-    return {
+    # 排序：id 升序，或 update_time、id 降序
+    if query_data.order_by == "update_time":
+        query = query.order_by(RootWord.update_time.desc(), RootWord.id.desc())
+    else:
+        query = query.order_by(RootWord.id.asc())
+    
+    # 分页：传入游标时按上一页最后一条记录定位，深翻页开销与页码无关
+    if query_data.cursor:
+        try:
+            last_id = decode_cursor(query_data.cursor, query_data.order_by)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="无效的分页游标"
+            )
+        if query_data.order_by == "update_time":
+            # 以游标记录的 update_time 为锚点，列与列比较避免时间精度差异（词根只做逻辑删除，锚点记录始终存在）
+            anchor_time = db.query(RootWord.update_time).filter(RootWord.id == last_id).scalar_subquery()
+            query = query.filter(or_(
+                RootWord.update_time < anchor_time,
+                and_(RootWord.update_time == anchor_time, RootWord.id < last_id)
+            ))
+        else:
+            query = query.filter(RootWord.id > last_id)
+    else:
+        query = query.offset((query_data.page_num - 1) * query_data.page_size)
+    
+    # 多取一条判断是否还有下一页
+    rows = query.limit(query_data.page_size + 1).all()
+    has_more = len(rows) > query_data.page_size
+    rows = rows[:query_data.page_size]
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(query_data.order_by, rows[-1].id)
+    
+    # 行元组直接组装为字典，由 orjson 序列化（枚举、时间类型原生支持），跳过 Pydantic 逐行校验
+    return Response(orjson.dumps({
         "code": 200,
         "msg": "查询成功",
         "data": {
-            "list": items,
+            "list": [dict(zip(fields, row)) for row in rows],
             "total": total,
             "page_num": query_data.page_num,
-            "page_size": query_data.page_size
+            "page_size": query_data.page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }
-    }
+    }), media_type="application/json")
@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.database import get_db
-from app.security import get_password_hash, get_current_user
+from app.security import get_current_user, invalidate_user_cache
+from app.services.password_hash import hash_password_in_pool
 from app.models.user import User
 from pydantic import BaseModel, Field
 from typing import List, Optional
@@ -42,7 +43,7 @@ def check_admin_permission(current_user: dict = Depends(get_current_user)):
 
 # 创建用户
 @router.post("/create", response_model=dict)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -65,7 +66,7 @@ async def create_user(
     # 创建新用户
     new_user = User(
         username=user_data.username,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=hash_password_in_pool(user_data.password),
         role=user_data.role
     )
     
@@ -85,7 +86,7 @@ async def create_user(
 
 # 获取用户列表
 @router.get("/list", response_model=UserListResult)
-async def get_user_list(
+def get_user_list(
     page_num: int = 1,
     page_size: int = 10,
     username: str = None,
@@ -127,7 +128,7 @@ async def get_user_list(
 
 # 删除用户
 @router.delete("/delete/{user_id}", response_model=dict)
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user: dict = Depends(check_admin_permission),
     db: Session = Depends(get_db)
@@ -148,8 +149,10 @@ async def delete_user(
         )
     
     # 删除用户
+    username = user.username
     db.delete(user)
     db.commit()
+    invalidate_user_cache(username)
     
     return {
         "code": 200,
@@ -159,7 +162,7 @@ async def delete_user(
 
 # 重置用户密码
 @router.post("/reset-password/{user_id}", response_model=dict)
-async def reset_password(
+def reset_password(
     user_id: int,
     new_password: str,
     current_user: dict = Depends(check_admin_permission),
@@ -174,7 +177,7 @@ async def reset_password(
         )
     
     # 更新密码
-    user.password_hash = get_password_hash(new_password)
+    user.password_hash = hash_password_in_pool(new_password)
     db.commit()
     
     return {
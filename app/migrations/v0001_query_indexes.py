@@ -0,0 +1,11 @@
+from sqlalchemy.engine import Connection
+from app.services.migration import create_index
+
+DESCRIPTION = "按查询路径为词根表和操作日志表补建联合索引"
+
+
+def upgrade(conn: Connection):
+    create_index(conn, "root_word", "ix_root_word_flag_status_name", ["delete_flag", "status", "word_name"])
+    create_index(conn, "root_word", "ix_root_word_apply_user_flag", ["apply_user", "delete_flag"])
+    create_index(conn, "root_word", "ix_root_word_flag_update_time", ["delete_flag", "update_time", "id"])
+    create_index(conn, "root_word_operation_log", "ix_operation_log_word_time", ["word_id", "operation_time"])
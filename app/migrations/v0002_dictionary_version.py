@@ -0,0 +1,11 @@
+from sqlalchemy.engine import Connection
+from app.models.dictionary_version import DictionaryVersion
+
+DESCRIPTION = "新增词典版本表，用于多 worker 间词典缓存失效"
+
+
+def upgrade(conn: Connection):
+    table = DictionaryVersion.__table__
+    table.create(conn, checkfirst=True)
+    if conn.execute(table.select().where(table.c.id == 1)).first() is None:
+        conn.execute(table.insert().values(id=1, version=0))
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+# 词典版本表：id=1 为词典版本（已生效词根变化时递增），id=2 为检索版本（任意词根变更时递增），
+# 与词根变更在同一事务中递增，各 worker 据此判断本地词典和检索索引是否过期
+class DictionaryVersion(Base):
+    __tablename__ = "root_word_dictionary_version"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False, comment="1-词典版本，2-检索版本")
+    version = Column(BigInteger, nullable=False, default=0, comment="词典版本号")
+    update_time = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now(), comment="更新时间")
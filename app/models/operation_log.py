@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -16,6 +16,9 @@ class OperationType(str, enum.Enum):
 # 操作日志表模型
 class RootWordOperationLog(Base):
     __tablename__ = "root_word_operation_log"
+    __table_args__ = (
+        Index("ix_operation_log_word_time", "word_id", "operation_time"),  # 按词根查询操作历史
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     word_id = Column(Integer, ForeignKey("root_word.id"), nullable=False, comment="词根 ID")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -12,6 +12,12 @@ class RootWordStatus(str, enum.Enum):
 # 词根主表模型
 class RootWord(Base):
     __tablename__ = "root_word"
+    # 按实际查询路径设计的索引，已有库通过 python migrate.py 补建
+    __table_args__ = (
+        Index("ix_root_word_flag_status_name", "delete_flag", "status", "word_name"),  # 词典加载、状态筛选
+        Index("ix_root_word_apply_user_flag", "apply_user", "delete_flag"),  # 按申请人筛选
+        Index("ix_root_word_flag_update_time", "delete_flag", "update_time", "id"),  # 按更新时间游标分页
+    )
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     word_name = Column(String(64), nullable=False, unique=True, comment="词根名称")
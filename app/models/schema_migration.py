@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+# 数据库迁移版本记录表
+class SchemaMigration(Base):
+    __tablename__ = "schema_migration"
+    
+    version = Column(Integer, primary_key=True, autoincrement=False, comment="迁移版本号")
+    description = Column(String(256), nullable=False, comment="迁移说明")
+    applied_time = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="执行时间")
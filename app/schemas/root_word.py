@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 from enum import Enum
 
 # 词根状态枚举
@@ -44,9 +44,23 @@ class RootWordAudit(BaseModel):
     audit_result: int = Field(..., description="审核结果：1-通过，2-驳回")
     audit_remark: Optional[str] = Field(None, description="审核备注（驳回原因）", max_length=256)
 
+# 批量操作请求模型
+class RootWordBatchRequest(BaseModel):
+    word_ids: List[int] = Field(..., description="词根 ID 列表", min_length=1, max_length=1000)
+
+# 批量审核请求模型
+class RootWordBatchAudit(RootWordBatchRequest):
+    audit_result: int = Field(..., description="审核结果：1-通过，2-驳回")
+    audit_remark: Optional[str] = Field(None, description="审核备注（驳回原因）", max_length=256)
+
 # DDL 校验请求模型
 class DDLCheckRequest(BaseModel):
     ddl_content: str = Field(..., description="待校验 DDL")
+    debug: bool = Field(False, description="是否返回解析过程调试信息")
+
+# 批量 DDL 校验请求模型
+class DDLBatchCheckRequest(BaseModel):
+    ddl_content: str = Field(..., description="待校验的多语句 DDL 脚本（如 mysqldump --no-data 导出）")
 
 # DDL 校验响应模型
 class DDLCheckResponse(BaseModel):
@@ -59,8 +73,13 @@ class RootWordListRequest(BaseModel):
     page_num: int = Field(1, description="页码", ge=1)
     page_size: int = Field(10, description="每页大小", ge=1, le=100)
     word_name: Optional[str] = Field(None, description="词根名称模糊查询")
+    keyword: Optional[str] = Field(None, description="词根名称或注释模糊查询")
     status: Optional[str] = Field(None, description="状态筛选")
     apply_user: Optional[str] = Field(None, description="申请人筛选")
+    cursor: Optional[str] = Field(None, description="游标分页：上一页返回的 next_cursor，传入后忽略 page_num")
+    order_by: Literal["id", "update_time"] = Field("id", description="排序方式：id 升序或 update_time 降序")
+    with_total: Optional[bool] = Field(None, description="是否统计总数，默认仅页码分页时统计")
+    fields: Optional[List[str]] = Field(None, description="只返回指定字段（id 始终返回），默认返回全部字段")
 
 # 编辑词根请求模型（管理员）
 class RootWordUpdate(BaseModel):
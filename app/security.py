@@ -1,19 +1,44 @@
+import os
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from .database import get_db
+from .models.user import User
+from .utils.ttl_cache import TTLCache
 
 # 密钥和算法
 SECRET_KEY = "your-secret-key-here"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# 密码加密上下文
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# 已验证令牌的缓存条数（按令牌自身的 exp 过期），0 表示每次请求都验签
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+
+# 是否按令牌中的用户名查询用户表：用户删除后令牌失效，角色以数据库为准
+USER_LOOKUP = os.getenv("USER_LOOKUP", "0") == "1"
+
+# 用户查询结果缓存秒数（删除用户的 worker 立即失效，其他 worker 最多延迟该时间），0 表示每次请求都查询
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+
+_token_cache = TTLCache(TOKEN_CACHE_SIZE)
+_user_cache = TTLCache(4096)
+
+# 密码哈希迭代次数：调整后旧哈希在用户下次登录时按新次数重新计算
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "29000"))
+
+# 密码加密上下文（迭代次数不等于 PASSWORD_HASH_ROUNDS 的哈希视为需要更新）
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=PASSWORD_HASH_ROUNDS
+)
 
 # OAuth2 密码流
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -22,6 +47,10 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+# 验证密码，哈希参数已过时时一并返回按当前参数计算的新哈希（否则为 None）
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 # 获取密码哈希
 def get_password_hash(password: str) -> str:
     # 确保密码长度不超过 72 字节
@@ -39,19 +68,41 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-# 解码访问令牌
+# 解码访问令牌（验签通过的令牌缓存到过期时刻，同一令牌重复请求不再验签）
 def decode_access_token(token: str):
+    payload = _token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             return None
+        # 没有 exp 的令牌无法确定缓存期限，不缓存
+        if payload.get("exp") is not None:
+            _token_cache.put(token, payload, float(payload["exp"]))
         return payload
     except JWTError:
         return None
 
+# 查询令牌对应的用户（按 USER_CACHE_TTL 缓存，用户不存在时返回 None 且不缓存）
+def _lookup_user(db: Session, username: str) -> Optional[dict]:
+    user = _user_cache.get(username)
+    if user is None:
+        row = db.query(User.username, User.role).filter(User.username == username).first()
+        if row is None:
+            return None
+        user = {"username": row.username, "role": row.role}
+        if USER_CACHE_TTL > 0:
+            _user_cache.put(username, user, time.time() + USER_CACHE_TTL)
+    return dict(user)
+
+# 用户被删除或修改后清除缓存
+def invalidate_user_cache(username: str):
+    _user_cache.pop(username)
+
 # 获取当前用户
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -63,11 +114,13 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     username: str = payload.get("sub")
     if username is None:
         raise credentials_exception
-    # 这里需要根据实际用户模型查询用户
-    # user = db.query(User).filter(User.username == username).first()
-    # if user is None:
-    #     raise credentials_exception
-    # 暂时返回模拟用户
+    if USER_LOOKUP:
+        # 按用户表校验，角色以数据库为准
+        user = _lookup_user(db, username)
+        if user is None:
+            raise credentials_exception
+        return user
+    # 未开启用户查询时信任令牌中的角色
     user = {"username": username, "role": payload.get("role", "user")}
     return user
 
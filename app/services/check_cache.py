@@ -0,0 +1,80 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+# DDL 校验结果缓存条数，0 表示不缓存
+DDL_CHECK_CACHE_SIZE = int(os.getenv("DDL_CHECK_CACHE_SIZE", "1024"))
+
+
+# 规范化 DDL 文本（去掉首尾空白、统一换行符）
+def normalize_ddl(ddl_content: str) -> str:
+    return ddl_content.replace("\r\n", "\n").strip()
+
+
+# DDL 内容哈希
+def ddl_digest(normalized_ddl: str) -> str:
+    return hashlib.sha256(normalized_ddl.encode("utf-8")).hexdigest()
+
+
+# 按 (DDL 哈希, 词典版本) 缓存校验结果的 LRU 缓存
+class DDLCheckCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._version = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sync_version(self, version: int) -> bool:
+        # 词典版本前进后旧结果全部失效；请求携带更旧的版本时返回 False，不回退版本号、不清空新版本下的结果
+        if version > self._version:
+            self._entries.clear()
+            self._version = version
+        return version == self._version
+
+    def get(self, digest: str, version: int) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(digest) if self._sync_version(version) else None
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return value
+
+    def put(self, digest: str, version: int, value: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            # 旧版本词典得出的结果不写入缓存
+            if not self._sync_version(version):
+                return
+            self._entries[digest] = value
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "dictionary_version": self._version
+            }
+
+
+# 进程内的 DDL 校验结果缓存
+ddl_check_cache = DDLCheckCache(DDL_CHECK_CACHE_SIZE)
@@ -0,0 +1,88 @@
+from typing import List, NamedTuple, Optional, Tuple
+from app.services.root_word_dictionary import RootWordDictionary, RootWordEntry
+from app.utils.root_word_trie import Segment
+
+
+# 字段名匹配结果：条目为 None 表示字段名不能完整由词根组成
+class FieldMatch(NamedTuple):
+    entry: Optional[RootWordEntry]
+    root_words: List[str]
+    segments: Optional[List[Segment]]
+
+
+# 按字段名查找对应的词根条目（DDL 校验与替换共用同一规则）
+def resolve_field(field_name: str, dictionary: RootWordDictionary) -> FieldMatch:
+    """完整字段名是词根时直接使用；否则切分为词根序列，全部片段都是词根时以最后一个词根为准"""
+    entry = dictionary.get(field_name)
+    if entry is not None:
+        return FieldMatch(entry, [field_name], None)
+    segments = dictionary.segment(field_name)
+    if all(segment.entry for segment in segments):
+        return FieldMatch(segments[-1].entry, [segment.text for segment in segments], segments)
+    return FieldMatch(None, [field_name], segments)
+
+
+# 按词典快照校验字段列表
+def check_fields(fields: List[Tuple[str, str, str]], db_engine: str, dictionary: RootWordDictionary) -> dict:
+    """校验 (字段名, 字段类型, 字段注释) 列表，返回合规、不合规和缺失词根"""
+    compliant_fields = []
+    non_compliant_fields = []
+    missing_root_words = []
+    missing_names = set()
+    
+    for field_name, field_type, field_comment in fields:
+        entry, root_words, segments = resolve_field(field_name, dictionary)
+        
+        if entry:
+            # 根据数据库引擎选择对应的类型
+            standard_type = entry.standard_type(db_engine)
+            
+            # 简单校验类型
+            if entry.type_matches(db_engine, field_type):
+                compliant_fields.append({
+                    "field_name": field_name,
+                    "field_type": field_type,
+                    "field_comment": field_comment,
+                    "root_word": entry.word_name,
+                    "root_words": root_words,
+                    "standard_type": standard_type,
+                    "remark": entry.remark
+                })
+            else:
+                non_compliant_fields.append({
+                    "field_name": field_name,
+                    "field_type": field_type,
+                    "field_comment": field_comment,
+                    "root_word": entry.word_name,
+                    "root_words": root_words,
+                    "standard_type": standard_type,
+                    "remark": entry.remark,
+                    "reason": "类型不一致"
+                })
+        else:
+            # 词根不存在，添加到缺失列表
+            if field_name not in missing_names:
+                missing_names.add(field_name)
+                missing_root_words.append({
+                    "word_name": field_name,
+                    "suggested_type": field_type,
+                    "field_comment": field_comment,
+                    "similar_root_words": [
+                        {"word_name": suggestion.word, "distance": suggestion.distance}
+                        for suggestion in dictionary.suggest(field_name)
+                    ]
+                })
+            
+            non_compliant_fields.append({
+                "field_name": field_name,
+                "field_type": field_type,
+                "field_comment": field_comment,
+                "matched_root_words": [segment.text for segment in segments if segment.entry],
+                "reason": "未找到匹配的词根"
+            })
+    
+    return {
+        "compliant_fields": compliant_fields,
+        "non_compliant_fields": non_compliant_fields,
+        "missing_root_words": missing_root_words
+    }
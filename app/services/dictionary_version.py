@@ -0,0 +1,56 @@
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.dictionary_version import DictionaryVersion
+
+# 版本表中各版本行的主键：词典版本只在已生效词根集合变化时递增（各 worker 据此重新加载词典），
+# 检索版本在任意词根变更时递增（各 worker 据此同步列表检索索引）；检索版本行在首次变更时补建
+VERSION_ROW_ID = 1
+SEARCH_VERSION_ROW_ID = 2
+
+# 本事务提交后的词典版本号、检索版本号，由 unit_of_work 写入 Session.info
+COMMITTED_VERSION = "dictionary_version"
+COMMITTED_SEARCH_VERSION = "search_version"
+
+
+# 读取当前词典版本号（主键单行查询，版本行不存在时为 0）
+def read_dictionary_version(db: Session, row_id: int = VERSION_ROW_ID) -> int:
+    version = db.execute(
+        select(DictionaryVersion.version).where(DictionaryVersion.id == row_id)
+    ).scalar()
+    return version or 0
+
+
+# 读取当前检索版本号
+def read_search_version(db: Session) -> int:
+    return read_dictionary_version(db, SEARCH_VERSION_ROW_ID)
+
+
+# 在当前事务中递增版本号并返回新版本号
+def bump_dictionary_version(db: Session, row_id: int = VERSION_ROW_ID) -> int:
+    """版本行加行锁直到事务结束，并发的词根变更按提交顺序各得到一个版本号"""
+    updated = db.execute(
+        update(DictionaryVersion)
+        .where(DictionaryVersion.id == row_id)
+        .values(version=DictionaryVersion.version + 1)
+    ).rowcount
+    if not updated:
+        # 未执行迁移的库没有版本行，首次变更时补建
+        try:
+            with db.begin_nested():
+                db.add(DictionaryVersion(id=row_id, version=1))
+            return 1
+        except IntegrityError:
+            return bump_dictionary_version(db, row_id)
+    return read_dictionary_version(db, row_id)
+
+
+# 获取本会话最近一次提交的词典版本号（最近一次提交未改变已生效词根时为 None）
+def committed_dictionary_version(db: Session) -> Optional[int]:
+    return db.info.get(COMMITTED_VERSION)
+
+
+# 获取本会话最近一次提交的检索版本号
+def committed_search_version(db: Session) -> Optional[int]:
+    return db.info.get(COMMITTED_SEARCH_VERSION)
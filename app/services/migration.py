@@ -0,0 +1,72 @@
+import importlib
+import pkgutil
+import re
+from dataclasses import dataclass
+from types import ModuleType
+from typing import List, Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from app.models.schema_migration import SchemaMigration
+
+# 迁移脚本命名：app/migrations/v<版本号>_<说明>.py，模块内定义 DESCRIPTION 和 upgrade(conn)
+_MIGRATION_NAME_RE = re.compile(r"^v(\d+)_\w+$")
+
+
+# 一个待执行的迁移脚本
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    module: ModuleType
+
+
+# 按版本号顺序加载全部迁移脚本
+def load_migrations() -> List[Migration]:
+    from app import migrations as package
+    result = []
+    for info in pkgutil.iter_modules(package.__path__):
+        match = _MIGRATION_NAME_RE.match(info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{package.__name__}.{info.name}")
+        result.append(Migration(int(match.group(1)), module.DESCRIPTION, module))
+    result.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in result]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"迁移版本号重复: {versions}")
+    return result
+
+
+# 查询已执行的迁移版本
+def applied_versions(engine: Engine) -> List[int]:
+    with engine.begin() as conn:
+        SchemaMigration.__table__.create(conn, checkfirst=True)
+        rows = conn.execute(SchemaMigration.__table__.select().order_by(SchemaMigration.version))
+        return [row.version for row in rows]
+
+
+# 执行尚未执行的迁移，返回本次执行的迁移列表
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """每个迁移在独立事务中执行并记录版本号，已执行的版本跳过"""
+    done = set(applied_versions(engine))
+    applied = []
+    for migration in load_migrations():
+        if migration.version in done or (target is not None and migration.version > target):
+            continue
+        with engine.begin() as conn:
+            migration.module.upgrade(conn)
+            conn.execute(SchemaMigration.__table__.insert().values(
+                version=migration.version,
+                description=migration.description
+            ))
+        applied.append(migration)
+    return applied
+
+
+# 创建索引（已存在同名索引时跳过，新建库已由 create_all 建好模型上声明的索引）
+def create_index(conn: Connection, table_name: str, index_name: str, columns: List[str]):
+    existing = {index["name"] for index in inspect(conn).get_indexes(table_name)}
+    if index_name in existing:
+        return
+    column_list = ", ".join(columns)
+    conn.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({column_list})"))
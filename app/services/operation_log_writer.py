@@ -0,0 +1,141 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+from sqlalchemy import insert
+from app.models.operation_log import RootWordOperationLog
+
+logger = logging.getLogger(__name__)
+
+# 操作日志写入方式：sync-与词根变更同事务写入（严格审计），async-提交后入队由后台线程批量写入
+OPERATION_LOG_MODE = os.getenv("OPERATION_LOG_MODE", "sync")
+
+# 后台批量写入：攒满条数或距上次写入超过间隔秒数即写入一批
+OPERATION_LOG_BATCH_SIZE = int(os.getenv("OPERATION_LOG_BATCH_SIZE", "200"))
+OPERATION_LOG_FLUSH_INTERVAL = float(os.getenv("OPERATION_LOG_FLUSH_INTERVAL", "1.0"))
+
+# 队列容量，队列满时退回请求线程同步写入
+OPERATION_LOG_QUEUE_SIZE = int(os.getenv("OPERATION_LOG_QUEUE_SIZE", "10000"))
+
+# 一批日志最多尝试写入的次数，仍失败时逐条写入，写不进的记录日志后丢弃
+OPERATION_LOG_WRITE_ATTEMPTS = int(os.getenv("OPERATION_LOG_WRITE_ATTEMPTS", "3"))
+
+
+# 操作日志后台写入器：进程内队列 + 单个写入线程，按条数或时间批量插入
+class OperationLogWriter:
+    def __init__(self, batch_size: int = OPERATION_LOG_BATCH_SIZE, flush_interval: float = OPERATION_LOG_FLUSH_INTERVAL,
+                 queue_size: int = OPERATION_LOG_QUEUE_SIZE, session_factory=None,
+                 max_attempts: int = OPERATION_LOG_WRITE_ATTEMPTS):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max(1, max_attempts)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._session_factory = session_factory
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _session(self):
+        if self._session_factory is None:
+            from app.database import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def _write(self, rows: List[dict]):
+        with self._session() as db:
+            db.execute(insert(RootWordOperationLog), rows)
+            db.commit()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="operation-log-writer", daemon=True)
+                    self._thread.start()
+
+    def submit(self, rows: List[dict]):
+        """提交已落库事务的操作日志，队列满时在当前线程直接写入"""
+        if self._stopping.is_set():
+            self._write(rows)
+            return
+        self._ensure_started()
+        for i, row in enumerate(rows):
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._write(rows[i:])
+                return
+
+    def _take_batch(self) -> List[dict]:
+        """攒满一批或等到间隔结束；停止后不再等待，直接取出队列中已有的日志凑满一批"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                if self._stopping.is_set():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[dict]):
+        # 失败的批次留在写入线程内重试（不放回队列，队列满时不会阻塞唯一的消费者）
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self._write(batch)
+                return
+            except Exception:
+                logger.exception("操作日志批量写入失败（第 %s/%s 次），共 %s 条", attempt, self.max_attempts, len(batch))
+            if attempt < self.max_attempts:
+                time.sleep(self.flush_interval * attempt)
+        
+        # 多次失败多为个别记录的数据错误（如外键），逐条写入，只丢弃写不进的记录
+        for row in batch:
+            try:
+                self._write([row])
+            except Exception:
+                logger.exception("操作日志写入失败，丢弃: %s", row)
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._take_batch()
+            if not batch:
+                continue
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self):
+        """等待已入队的操作日志全部写入"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def shutdown(self, timeout: float = 30.0):
+        """停止接收新日志并写完队列中剩余日志"""
+        self._stopping.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.error("操作日志写入线程未能在 %s 秒内退出，剩余 %s 条未写入", timeout, self._queue.qsize())
+
+
+operation_log_writer = OperationLogWriter()
+
+
+# 关闭后台写入器（应用退出时调用，会写完队列中剩余日志）
+def shutdown_operation_log_writer():
+    operation_log_writer.shutdown()
+
+
+atexit.register(shutdown_operation_log_writer)
@@ -0,0 +1,114 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from app.utils.ddl_parser import (
+    ColumnDefinition, TableDefinition, extract_columns, extract_fields, identify_database_engine,
+    iter_create_tables, split_script
+)
+
+# 超过该字符数的 DDL 交给进程池解析，0 表示始终在当前线程解析
+PARSE_PROCESS_THRESHOLD = int(os.getenv("DDL_PARSE_PROCESS_THRESHOLD", str(256 * 1024)))
+
+# 解析进程数，默认与 CPU 核数相同
+PARSE_WORKERS = int(os.getenv("DDL_PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+# 获取解析进程池（首次使用时创建）
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                # 使用 spawn 避免在多线程的 worker 进程中 fork
+                _executor = ProcessPoolExecutor(
+                    max_workers=PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _executor
+
+
+# 关闭解析进程池
+def shutdown_parse_executor():
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+atexit.register(shutdown_parse_executor)
+
+
+def _use_process_pool(ddl_content: str) -> bool:
+    return PARSE_PROCESS_THRESHOLD > 0 and PARSE_WORKERS > 0 and len(ddl_content) >= PARSE_PROCESS_THRESHOLD
+
+
+# 解析单条 DDL（进程池中执行的函数需定义在模块顶层）
+def _parse_ddl(ddl_content: str, debug: bool = False) -> Tuple[str, list, Optional[dict]]:
+    debug_info = {"steps": []} if debug else None
+    db_engine = identify_database_engine(ddl_content)
+    fields = extract_fields(ddl_content, debug_info)
+    return db_engine, fields, debug_info
+
+
+# 解析单条 DDL 的字段定义及类型偏移
+def _parse_ddl_columns(ddl_content: str) -> Tuple[str, List[ColumnDefinition]]:
+    return identify_database_engine(ddl_content), extract_columns(ddl_content)
+
+
+# 解析脚本中的一块语句
+def _parse_chunk(chunk: str) -> List[TableDefinition]:
+    return list(iter_create_tables(chunk))
+
+
+# 解析单条 DDL，返回 (数据库引擎, 字段列表, 调试信息)，debug 为 False 时调试信息为 None
+def parse_ddl(ddl_content: str, debug: bool = False) -> Tuple[str, list, Optional[dict]]:
+    """小输入在当前线程解析，大输入交给进程池，结果与当前线程解析完全一致"""
+    if not _use_process_pool(ddl_content):
+        return _parse_ddl(ddl_content, debug)
+    return _get_executor().submit(_parse_ddl, ddl_content, debug).result()
+
+
+# 解析单条 DDL，返回 (数据库引擎, 带类型偏移的字段定义列表)
+def parse_ddl_columns(ddl_content: str) -> Tuple[str, List[ColumnDefinition]]:
+    """与 parse_ddl 相同的执行策略，用于需要按位置改写 DDL 的场景"""
+    if not _use_process_pool(ddl_content):
+        return _parse_ddl_columns(ddl_content)
+    return _get_executor().submit(_parse_ddl_columns, ddl_content).result()
+
+
+# 逐表解析多语句脚本
+def iter_tables(sql: str) -> Iterator[TableDefinition]:
+    """小输入在当前线程逐表解析；大输入按语句边界分块，由进程池多核并行解析并按原顺序产出
+
+    块大小固定，最早的一块解析完成即产出；同时在途的块数不超过 PARSE_WORKERS 的两倍，
+    首个结果的等待时间和内存占用均与脚本大小无关
+    """
+    if not _use_process_pool(sql):
+        yield from iter_create_tables(sql)
+        return
+    
+    # 块太小时进程间传输开销占比过高，太大时首个结果等待时间变长
+    chunk_size = max(1, PARSE_PROCESS_THRESHOLD // 4)
+    executor = _get_executor()
+    chunks = split_script(sql, chunk_size)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, chunk))
+            # 最早的块已完成时立即产出，窗口已满时等待最早的块
+            while pending and (pending[0].done() or len(pending) >= PARSE_WORKERS * 2):
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # 调用方提前停止迭代（如客户端断开）时取消尚未开始的块
+        for future in pending:
+            future.cancel()
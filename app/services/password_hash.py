@@ -0,0 +1,48 @@
+import asyncio
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from app.security import get_password_hash, verify_and_update_password
+
+# 同时计算密码哈希的线程数，默认占用一半 CPU 核，其余留给其他接口
+# （hashlib.pbkdf2_hmac 计算期间释放 GIL，线程即可多核并行）
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 1) // 2))))
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+# 获取密码哈希线程池（首次使用时创建）
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _executor
+
+
+# 关闭密码哈希线程池
+def shutdown_password_hash_executor():
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+atexit.register(shutdown_password_hash_executor)
+
+
+# 在有界线程池中校验密码（异步接口使用，等待期间不占用接口线程池）
+async def verify_password_in_pool(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """返回 (是否正确, 需要更新时的新哈希)"""
+    future = _get_executor().submit(verify_and_update_password, plain_password, hashed_password)
+    return await asyncio.wrap_future(future)
+
+
+# 在有界线程池中计算密码哈希（同步接口使用，限制同时占用的 CPU 核数）
+def hash_password_in_pool(password: str) -> str:
+    return _get_executor().submit(get_password_hash, password).result()
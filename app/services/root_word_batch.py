@@ -0,0 +1,66 @@
+from typing import Callable, List
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models.root_word import RootWord, RootWordStatus
+from app.models.operation_log import RootWordOperationLog, OperationType
+from app.services.unit_of_work import operation_time
+
+
+# 批量变更期间词根状态被并发修改
+class BatchConflictError(Exception):
+    pass
+
+
+# 批量状态变更：一条带状态前置条件的 UPDATE + 一条批量写日志，由调用方提交
+def batch_transition(
+    db: Session,
+    word_ids: List[int],
+    from_status: RootWordStatus,
+    values: dict,
+    operation_type: OperationType,
+    username: str,
+    content: Callable[[str], str],
+    status_message: str
+) -> dict:
+    """返回 {"succeeded": [词根 ID], "failed": [{"word_id", "message"}]}
+
+    先锁定并读取全部目标词根区分可变更与失败的 ID，再以 status 为条件批量更新；
+    更新行数与预期不符说明状态被并发修改，抛出 BatchConflictError 由调用方回滚
+    """
+    word_ids = list(dict.fromkeys(word_ids))
+    rows = db.query(RootWord.id, RootWord.word_name, RootWord.status).filter(
+        RootWord.id.in_(word_ids),
+        RootWord.delete_flag == 0
+    ).with_for_update().all()
+    found = {row.id: row for row in rows}
+
+    succeeded, failed = [], []
+    for word_id in word_ids:
+        row = found.get(word_id)
+        if row is None:
+            failed.append({"word_id": word_id, "message": "词根不存在"})
+        elif row.status != from_status:
+            failed.append({"word_id": word_id, "message": status_message})
+        else:
+            succeeded.append(word_id)
+
+    if succeeded:
+        updated = db.query(RootWord).filter(
+            RootWord.id.in_(succeeded),
+            RootWord.delete_flag == 0,
+            RootWord.status == from_status
+        ).update(values, synchronize_session=False)
+        if updated != len(succeeded):
+            raise BatchConflictError(f"预期更新 {len(succeeded)} 条，实际更新 {updated} 条")
+        now = operation_time()
+        db.execute(insert(RootWordOperationLog), [
+            {
+                "word_id": word_id,
+                "operation_type": operation_type,
+                "operation_user": username,
+                "operation_time": now,
+                "operation_content": content(found[word_id].word_name),
+            }
+            for word_id in succeeded
+        ])
+    return {"succeeded": succeeded, "failed": failed}
@@ -0,0 +1,295 @@
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import and_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from app.models.root_word import RootWord, RootWordStatus
+from app.services.dictionary_version import read_dictionary_version
+from app.utils.dictionary_file import DictionaryFile, write_dictionary_file
+from app.utils.fuzzy_index import Suggestion, TrigramIndex
+from app.utils.root_word_trie import RootWordTrie, Segment, segment_parts
+from app.utils.type_normalizer import CANONICAL_REVISION, canonical_type
+
+logger = logging.getLogger(__name__)
+
+# 支持的数据库引擎
+DB_ENGINES = ("mysql", "doris", "clickhouse")
+
+# 检查词典版本号的最小间隔（秒）：其他 worker 的词根变更最多延迟该时间生效，0 表示每次都检查
+DICTIONARY_VERSION_CHECK_INTERVAL = float(os.getenv("DICTIONARY_VERSION_CHECK_INTERVAL", "1.0"))
+
+# 词典快照文件目录（建议使用 /dev/shm 下的目录）：设置后同一台机器上的 worker 共享按版本号生成的
+# 只读词典文件，只有第一个发现新版本的 worker 查询数据库；为空时每个 worker 在进程内各自加载
+DICTIONARY_SNAPSHOT_DIR = os.getenv("DICTIONARY_SNAPSHOT_DIR", "")
+
+# 映射词典每个 worker 缓存的已解码条目数及键查找结果数（常用词根和字段片段反复出现，
+# 避免每次查询都探测哈希表、解码并新建条目）
+MAPPED_ENTRY_CACHE_SIZE = int(os.getenv("MAPPED_ENTRY_CACHE_SIZE", "4096"))
+MAPPED_LOOKUP_CACHE_SIZE = int(os.getenv("MAPPED_LOOKUP_CACHE_SIZE", "65536"))
+
+# 词典文件名：root_word_dictionary.<词典版本>.<类型规范形式修订号>.bin（旧文件名没有修订号）
+_SNAPSHOT_FILE_RE = re.compile(r"^root_word_dictionary\.(\d+)(?:\.(\d+))?\.bin$")
+
+
+# 词典条目：一个已生效词根及其各引擎的标准类型
+@dataclass(frozen=True)
+class RootWordEntry:
+    word_id: int
+    word_name: str
+    types: Dict[str, str]
+    type_keys: Dict[str, str]
+    remark: Optional[str]
+
+    def standard_type(self, db_engine: str) -> str:
+        """获取指定引擎的标准类型"""
+        return self.types[db_engine]
+
+    def type_matches(self, db_engine: str, field_type: str) -> bool:
+        """判断字段类型是否与指定引擎的标准类型一致（均按规范形式比较）"""
+        return canonical_type(db_engine, field_type) == self.type_keys[db_engine]
+
+
+# 词典快照：按 word_name 索引的只读词根字典及派生索引，整体替换而不原地修改
+class RootWordDictionary:
+    def __init__(self, version: int, entries: Dict[str, RootWordEntry]):
+        self.version = version
+        self.entries = entries
+        self.trie = RootWordTrie(entries.items())
+        self._fuzzy_index: Optional[TrigramIndex] = None
+        self._previous_fuzzy_index: Optional[TrigramIndex] = None
+        self._fuzzy_lock = threading.Lock()
+
+    def get(self, word_name: str) -> Optional[RootWordEntry]:
+        return self.entries.get(word_name)
+
+    def segment(self, field_name: str) -> List[Segment]:
+        """把字段名切分为已知词根序列，未匹配的片段 entry 为 None"""
+        return self.trie.segment(field_name)
+
+    def build_fuzzy_index(self) -> TrigramIndex:
+        """构建本快照的相似词索引（已构建时直接返回）"""
+        if self._fuzzy_index is None:
+            with self._fuzzy_lock:
+                if self._fuzzy_index is None:
+                    self._fuzzy_index = TrigramIndex(self._names())
+                    self._previous_fuzzy_index = None
+        return self._fuzzy_index
+
+    def inherit_fuzzy_index(self, previous: "RootWordDictionary") -> bool:
+        """本快照的索引构建完成前沿用上一个快照的索引，上一个快照没有可用索引时返回 False"""
+        self._previous_fuzzy_index = previous._fuzzy_index or previous._previous_fuzzy_index
+        return self._previous_fuzzy_index is not None
+
+    @property
+    def fuzzy_index(self) -> TrigramIndex:
+        """相似词索引：后台构建完成前返回上一个快照的索引，都没有时在当前线程构建"""
+        index = self._fuzzy_index or self._previous_fuzzy_index
+        if index is None:
+            index = self.build_fuzzy_index()
+        return index
+
+    def suggest(self, word_name: str, limit: int = 3) -> List[Suggestion]:
+        """查找与 word_name 编辑距离最近的已生效词根"""
+        index = self.fuzzy_index
+        if index is self._fuzzy_index:
+            return index.search(word_name, limit=limit)
+        # 沿用上一个快照的索引时排除已废弃或删除的词根（结果会随校验响应缓存到本快照的版本下）
+        return index.search(word_name, limit=limit, accept=self.__contains__)
+
+    def _names(self) -> Iterable[str]:
+        return self.entries.keys()
+
+    def __contains__(self, word_name: str) -> bool:
+        return word_name in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# 映射词典文件的词典快照：条目留在各 worker 共享的只读内存中，查询时只解码命中的条目
+class MappedRootWordDictionary(RootWordDictionary):
+    def __init__(self, file: DictionaryFile):
+        self.version = file.version
+        self.file = file
+        self._fuzzy_index: Optional[TrigramIndex] = None
+        self._previous_fuzzy_index: Optional[TrigramIndex] = None
+        self._fuzzy_lock = threading.Lock()
+        # 按键缓存记录偏移（含不存在的键），按记录偏移缓存解码后的条目（条目不可变，可在线程间共享）
+        self._find = lru_cache(maxsize=MAPPED_LOOKUP_CACHE_SIZE)(file.find)
+        self._entry_at = lru_cache(maxsize=MAPPED_ENTRY_CACHE_SIZE)(self._decode)
+
+    def _decode(self, offset: int) -> RootWordEntry:
+        word_id, (name, mysql_type, doris_type, clickhouse_type, mysql_key, doris_key, clickhouse_key, remark) = (
+            self.file.read(offset)
+        )
+        return RootWordEntry(
+            word_id=word_id,
+            word_name=name,
+            types=dict(zip(DB_ENGINES, (mysql_type, doris_type, clickhouse_type))),
+            type_keys=dict(zip(DB_ENGINES, (mysql_key, doris_key, clickhouse_key))),
+            remark=remark
+        )
+
+    def get(self, word_name: str) -> Optional[RootWordEntry]:
+        offset = self._find(word_name)
+        return self._entry_at(offset) if offset else None
+
+    def _matches(self, parts: List[str], i: int):
+        # 没有前缀树，逐个尝试从 i 开始、不超过最大片段数的候选词根，只查找偏移不解码
+        for j in range(i + 1, min(len(parts), i + self.file.max_parts) + 1):
+            offset = self._find("_".join(parts[i:j]))
+            if offset:
+                yield j, offset
+
+    def segment(self, field_name: str) -> List[Segment]:
+        parts = field_name.split("_")
+        segments = segment_parts(parts, lambda i: self._matches(parts, i))
+        # 只解码最终选中的词根
+        return [Segment(text, self._entry_at(offset) if offset else None) for text, offset in segments]
+
+    def _names(self) -> Iterable[str]:
+        return (fields[0] for _, fields in self.file)
+
+    def __contains__(self, word_name: str) -> bool:
+        return self._find(word_name) != 0
+
+    def __len__(self) -> int:
+        return len(self.file)
+
+
+_lock = threading.Lock()
+_snapshot: Optional[RootWordDictionary] = None
+_checked_at = 0.0
+
+
+# 从数据库构建词典条目（一次查询）
+def _load_entries(db: Session) -> Dict[str, RootWordEntry]:
+    rows = db.query(
+        RootWord.id,
+        RootWord.word_name,
+        RootWord.mysql_type,
+        RootWord.doris_type,
+        RootWord.clickhouse_type,
+        RootWord.remark
+    ).filter(
+        and_(
+            RootWord.delete_flag == 0,
+            RootWord.status == RootWordStatus.EFFECTIVE
+        )
+    ).all()
+
+    entries = {}
+    for word_id, word_name, mysql_type, doris_type, clickhouse_type, remark in rows:
+        types = {
+            "mysql": mysql_type,
+            "doris": doris_type,
+            "clickhouse": clickhouse_type
+        }
+        entries[word_name] = RootWordEntry(
+            word_id=word_id,
+            word_name=word_name,
+            types=types,
+            type_keys={engine: canonical_type(engine, type_) for engine, type_ in types.items()},
+            remark=remark
+        )
+    return entries
+
+
+# 重新加载词典并原子替换快照（词根变更后调用）
+def refresh_root_word_dictionary(db: Optional[Session] = None) -> RootWordDictionary:
+    """重新加载词典快照，快照版本号取自数据库中的词典版本表"""
+    global _snapshot, _checked_at
+    if db is None:
+        from app.database import SessionLocal
+        with SessionLocal() as session:
+            return refresh_root_word_dictionary(session)
+
+    with _lock:
+        # 先读版本号再读词根：期间其他 worker 的提交只会让快照比版本号新，下次检查时多加载一次
+        version = read_dictionary_version(db)
+        if DICTIONARY_SNAPSHOT_DIR:
+            snapshot = _load_mapped_dictionary(db, version)
+        else:
+            snapshot = RootWordDictionary(version, _load_entries(db))
+        # 上一个快照用过相似词索引时，新快照的索引在后台构建，构建完成前沿用旧索引，不阻塞校验请求
+        if _snapshot is not None and snapshot.inherit_fuzzy_index(_snapshot):
+            threading.Thread(
+                target=_build_fuzzy_index, args=(snapshot,), name="root-word-fuzzy-index", daemon=True
+            ).start()
+        _snapshot = snapshot
+        _checked_at = time.monotonic()
+        return _snapshot
+
+
+# 后台构建相似词索引（快照已被更新的快照替换时跳过）
+def _build_fuzzy_index(snapshot: RootWordDictionary):
+    if _snapshot is snapshot:
+        snapshot.build_fuzzy_index()
+
+
+# 映射指定版本的词典文件，文件不存在时从数据库加载并生成
+def _load_mapped_dictionary(db: Session, version: int) -> MappedRootWordDictionary:
+    path = os.path.join(DICTIONARY_SNAPSHOT_DIR, f"root_word_dictionary.{version}.{CANONICAL_REVISION}.bin")
+    try:
+        return MappedRootWordDictionary(DictionaryFile(path))
+    except (FileNotFoundError, ValueError):
+        pass
+    
+    write_dictionary_file(path, version, (
+        (entry.word_id, (
+            entry.word_name,
+            *(entry.types[engine] for engine in DB_ENGINES),
+            *(entry.type_keys[engine] for engine in DB_ENGINES),
+            entry.remark
+        ))
+        for entry in _load_entries(db).values()
+    ))
+    _remove_old_snapshot_files(version)
+    return MappedRootWordDictionary(DictionaryFile(path))
+
+
+# 删除旧版本及按旧规范形式生成的词典文件（已映射的 worker 不受影响，映射在文件删除后仍然有效）
+def _remove_old_snapshot_files(version: int):
+    for name in os.listdir(DICTIONARY_SNAPSHOT_DIR):
+        match = _SNAPSHOT_FILE_RE.match(name)
+        if match and (int(match.group(1)) < version or int(match.group(2) or 0) != CANONICAL_REVISION):
+            try:
+                os.remove(os.path.join(DICTIONARY_SNAPSHOT_DIR, name))
+            except OSError:
+                pass
+
+
+# 其他 worker 变更过词根时重新加载（按间隔节流，间隔内不访问数据库）
+def _reload_if_stale(snapshot: RootWordDictionary) -> RootWordDictionary:
+    global _checked_at
+    now = time.monotonic()
+    if now - _checked_at < DICTIONARY_VERSION_CHECK_INTERVAL:
+        return snapshot
+    # 先占住本轮检查，并发请求继续使用当前快照
+    _checked_at = now
+    from app.database import SessionLocal
+    try:
+        with SessionLocal() as db:
+            if read_dictionary_version(db) == snapshot.version:
+                return snapshot
+            return refresh_root_word_dictionary(db)
+    except SQLAlchemyError:
+        # 数据库暂时不可用时继续使用当前快照，下个间隔再检查
+        logger.exception("检查词典版本失败，继续使用版本 %s 的词典快照", snapshot.version)
+        return snapshot
+
+
+# 获取当前词典快照（首次调用时加载）
+def get_root_word_dictionary() -> RootWordDictionary:
+    """获取词典快照，DDL 校验只读取该快照；每隔 DICTIONARY_VERSION_CHECK_INTERVAL 秒
+    用一次主键查询比对词典版本号，发现其他 worker 的变更后重新加载"""
+    snapshot = _snapshot
+    if snapshot is None:
+        return refresh_root_word_dictionary()
+    return _reload_if_stale(snapshot)
@@ -0,0 +1,166 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Dict, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app.models.root_word import RootWord, RootWordStatus
+from app.models.operation_log import RootWordOperationLog, OperationType
+from app.schemas.root_word import RootWordCreate
+
+# IN 查询每批词根数，避免单条 SQL 参数过多
+IN_BATCH_SIZE = 1000
+
+# 导入文件列名
+IMPORT_COLUMNS = ("word_name", "mysql_type", "doris_type", "clickhouse_type", "remark")
+
+# 逐行导入结果
+CREATED = "created"  # 新建
+UPDATED = "updated"  # 已存在，覆盖类型和注释
+RESTORED = "restored"  # 已删除或已废弃，恢复为已生效
+SKIPPED = "skipped"  # 已存在且未开启覆盖，或内容无变化
+FAILED = "failed"  # 校验失败
+
+
+# 解析导入文件为行字典列表，格式错误时抛出 ValueError
+def parse_import_file(filename: str, content: bytes) -> List[dict]:
+    """支持 CSV（首行为列名）和 JSON（对象数组），编码为 UTF-8"""
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("文件编码需为 UTF-8")
+
+    if filename.lower().endswith(".json"):
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 格式错误: {e}")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON 文件内容需为词根对象数组")
+        return rows
+
+    if filename.lower().endswith(".csv"):
+        reader = csv.DictReader(io.StringIO(text))
+        missing = [column for column in IMPORT_COLUMNS[:4] if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV 缺少列: {', '.join(missing)}")
+        return [
+            {key: (value.strip() if value else None) for key, value in row.items() if key in IMPORT_COLUMNS}
+            for row in reader
+        ]
+
+    raise ValueError("仅支持 .csv 或 .json 文件")
+
+
+# 校验每一行，返回 (有效行, 失败结果)
+def _validate_rows(rows: List[dict]) -> Tuple[Dict[str, Tuple[int, RootWordCreate]], List[dict]]:
+    valid = {}
+    failed = []
+    for row_num, row in enumerate(rows, start=1):
+        try:
+            data = RootWordCreate(**{key: row.get(key) for key in IMPORT_COLUMNS if row.get(key) is not None})
+        except ValidationError as e:
+            message = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            failed.append({
+                "row": row_num, "word_name": row.get("word_name"), "word_id": None, "result": FAILED, "message": message
+            })
+            continue
+        if data.word_name in valid:
+            failed.append({
+                "row": row_num, "word_name": data.word_name, "word_id": None, "result": FAILED,
+                "message": f"与第 {valid[data.word_name][0]} 行词根重复"
+            })
+            continue
+        valid[data.word_name] = (row_num, data)
+    return valid, failed
+
+
+# 一次集合查询取出已存在的词根（分批 IN）
+def _load_existing(db: Session, names: List[str]) -> Dict[str, Row]:
+    existing = {}
+    for i in range(0, len(names), IN_BATCH_SIZE):
+        rows = db.query(
+            RootWord.id, RootWord.word_name, RootWord.mysql_type, RootWord.doris_type,
+            RootWord.clickhouse_type, RootWord.remark, RootWord.status, RootWord.delete_flag
+        ).filter(RootWord.word_name.in_(names[i:i + IN_BATCH_SIZE])).all()
+        existing.update((row.word_name, row) for row in rows)
+    return existing
+
+
+# 批量导入词根（管理员），在调用方的单个事务中执行，由调用方提交
+def import_root_words(db: Session, rows: List[dict], username: str, overwrite: bool = False) -> dict:
+    """新词根直接生效；已删除或已废弃的词根恢复为已生效；已存在的词根仅在 overwrite 时覆盖类型和注释
+
+    已存在查询、插入、更新、写日志均为集合操作，每种 SQL 只执行一次（IN 查询按批）
+    """
+    valid, results = _validate_rows(rows)
+    existing = _load_existing(db, list(valid))
+    now = datetime.utcnow()
+    audit_values = {
+        "status": RootWordStatus.EFFECTIVE,
+        "audit_user": username,
+        "audit_time": now,
+        "audit_remark": "批量导入",
+    }
+
+    inserts, updates, logs = [], [], []
+    for word_name, (row_num, data) in valid.items():
+        result = {"row": row_num, "word_name": word_name, "word_id": None, "result": SKIPPED, "message": ""}
+        results.append(result)
+        values = {
+            "mysql_type": data.mysql_type,
+            "doris_type": data.doris_type,
+            "clickhouse_type": data.clickhouse_type,
+            "remark": data.remark,
+        }
+        current = existing.get(word_name)
+        if current is None:
+            inserts.append(({
+                "word_name": word_name, **values, **audit_values,
+                "apply_user": username, "apply_time": now, "delete_flag": 0
+            }, result))
+            result["result"] = CREATED
+            continue
+        result["word_id"] = current.id
+        if current.delete_flag == 1 or current.status == RootWordStatus.DISCARDED:
+            updates.append({"id": current.id, **values, **audit_values, "delete_flag": 0})
+            logs.append((current.id, OperationType.RECOVER, f"批量导入恢复词根：{word_name}"))
+            result["result"] = RESTORED
+        elif not overwrite:
+            result["message"] = "词根已存在"
+        elif all(getattr(current, key) == value for key, value in values.items()):
+            result["message"] = "内容无变化"
+        else:
+            updates.append({"id": current.id, **values})
+            logs.append((current.id, OperationType.UPDATE, f"批量导入覆盖词根：{word_name}"))
+            result["result"] = UPDATED
+
+    if inserts:
+        db.execute(insert(RootWord), [values for values, _ in inserts])
+        # MySQL 批量插入无法返回自增 ID，按名称回查
+        created = _load_existing(db, [values["word_name"] for values, _ in inserts])
+        for values, result in inserts:
+            result["word_id"] = created[values["word_name"]].id
+            logs.append((result["word_id"], OperationType.CREATE, f"批量导入词根：{values['word_name']}"))
+    if updates:
+        db.execute(update(RootWord), updates)
+    if logs:
+        db.execute(insert(RootWordOperationLog), [
+            {
+                "word_id": word_id,
+                "operation_type": operation_type,
+                "operation_user": username,
+                "operation_time": now,
+                "operation_content": content,
+            }
+            for word_id, operation_type, content in logs
+        ])
+
+    results.sort(key=lambda result: result["row"])
+    summary = {key: 0 for key in (CREATED, UPDATED, RESTORED, SKIPPED, FAILED)}
+    for result in results:
+        summary[result["result"]] += 1
+    return {"total": len(rows), **summary, "results": results}
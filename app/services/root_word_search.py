@@ -0,0 +1,143 @@
+import logging
+import threading
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from app.models.root_word import RootWord
+from app.services.dictionary_version import committed_search_version, read_search_version
+from app.utils.substring_index import SubstringIndex
+
+logger = logging.getLogger(__name__)
+
+# 索引命中数超过该值时退回数据库 LIKE 查询（命中密集时 LIKE + LIMIT 很快就能凑满一页）
+SEARCH_IN_LIMIT = 1000
+
+
+# 词根子串检索索引：覆盖所有未删除词根，word_name 按三元组、remark 按二元组（中文词多为两字）建立
+class RootWordSearchIndex:
+    def __init__(self, rows=(), version: int = 0):
+        rows = list(rows)
+        self.version = version
+        self.word_names = SubstringIndex(3, ((word_id, word_name) for word_id, word_name, _ in rows))
+        self.remarks = SubstringIndex(2, ((word_id, remark) for word_id, _, remark in rows))
+
+    def upsert(self, word_id: int, word_name: str, remark: Optional[str]):
+        self.word_names.upsert(word_id, word_name)
+        self.remarks.upsert(word_id, remark)
+
+    def remove(self, word_id: int):
+        self.word_names.remove(word_id)
+        self.remarks.remove(word_id)
+
+    def search_word_name(self, query: str, limit: Optional[int] = SEARCH_IN_LIMIT) -> Optional[List[int]]:
+        """按词根名称子串查找，返回 None 表示需要退回数据库查询"""
+        return self.word_names.search(query, limit)
+
+    def search_keyword(self, query: str, limit: Optional[int] = SEARCH_IN_LIMIT) -> Optional[List[int]]:
+        """按词根名称或注释子串查找，返回 None 表示需要退回数据库查询"""
+        by_name = self.word_names.search(query, limit)
+        if by_name is None:
+            return None
+        by_remark = self.remarks.search(query, limit)
+        if by_remark is None:
+            return None
+        matched = sorted(set(by_name) | set(by_remark))
+        if limit is not None and len(matched) > limit:
+            return None
+        return matched
+
+
+_lock = threading.Lock()
+_index: Optional[RootWordSearchIndex] = None
+_rebuild_thread: Optional[threading.Thread] = None
+
+
+# 从数据库加载全部未删除词根构建索引（不持有 _lock，构建期间检索照常使用旧索引）
+def _build_index(db: Session) -> RootWordSearchIndex:
+    # 先读版本号再读词根：期间的提交只会让索引比版本号新，之后多重建一次
+    version = read_search_version(db)
+    rows = db.query(RootWord.id, RootWord.word_name, RootWord.remark).filter(
+        RootWord.delete_flag == 0
+    ).all()
+    return RootWordSearchIndex(rows, version)
+
+
+# 原子替换索引，只替换为版本更新的索引（构建期间本 worker 的增量同步可能已让旧索引更新）
+def _install_index(index: RootWordSearchIndex) -> RootWordSearchIndex:
+    global _index
+    with _lock:
+        if _index is None or _index.version < index.version:
+            _index = index
+        return _index
+
+
+def _rebuild_in_background():
+    from app.database import SessionLocal
+    try:
+        with SessionLocal() as db:
+            _install_index(_build_index(db))
+    except Exception:
+        # 失败时保留旧索引，下次检索发现版本号仍不一致时再重建
+        logger.exception("检索索引后台重建失败")
+
+
+# 获取检索索引：首次使用时在当前线程加载；其他 worker 变更过词根（检索版本号不一致）时
+# 在后台线程重建并替换，重建完成前返回 None，由调用方退回数据库查询，避免漏掉其他 worker 的变更
+def get_root_word_search_index(db: Session) -> Optional[RootWordSearchIndex]:
+    global _rebuild_thread
+    index = _index
+    if index is None:
+        return _install_index(_build_index(db))
+    if index.version != read_search_version(db):
+        with _lock:
+            if _rebuild_thread is None or not _rebuild_thread.is_alive():
+                _rebuild_thread = threading.Thread(
+                    target=_rebuild_in_background, name="root-word-search-rebuild", daemon=True
+                )
+                _rebuild_thread.start()
+        return None
+    return index
+
+
+# 判断本 worker 的索引能否增量应用本次提交，不能时由下次 get_root_word_search_index 整体重新加载
+def _can_apply(db: Session) -> bool:
+    global _index
+    if _index is None:
+        return False
+    version = committed_search_version(db)
+    if version is None:
+        # 变更未经 unit_of_work 提交，无法判断索引是否完整，直接丢弃
+        _index = None
+        return False
+    if _index.version != version - 1:
+        # 中间还有其他 worker 的提交未同步
+        return False
+    _index.version = version
+    return True
+
+
+# 词根变更后同步检索索引（索引尚未加载或已过期时无需处理）
+def sync_root_word_search(db: Session, root_word: RootWord):
+    # 与加载互斥，避免加载期间提交的变更丢失
+    with _lock:
+        if not _can_apply(db):
+            return
+        if root_word.delete_flag == 0:
+            _index.upsert(root_word.id, root_word.word_name, root_word.remark)
+        else:
+            _index.remove(root_word.id)
+
+
+# 批量变更后按 id 重新读取并同步检索索引（按批查询，word_ids 为空时只推进索引版本）
+def sync_root_word_search_by_ids(db: Session, word_ids: List[int]):
+    with _lock:
+        if not _can_apply(db):
+            return
+        for i in range(0, len(word_ids), 1000):
+            rows = db.query(RootWord.id, RootWord.word_name, RootWord.remark, RootWord.delete_flag).filter(
+                RootWord.id.in_(word_ids[i:i + 1000])
+            ).all()
+            for word_id, word_name, remark, delete_flag in rows:
+                if delete_flag == 0:
+                    _index.upsert(word_id, word_name, remark)
+                else:
+                    _index.remove(word_id)
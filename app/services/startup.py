@@ -0,0 +1,88 @@
+import logging
+import os
+import time
+from typing import Callable, Dict
+from sqlalchemy.engine import Engine
+
+# 通过 uvicorn 的日志器输出，默认日志配置下即可在 worker 日志中看到
+logger = logging.getLogger("uvicorn.error")
+
+# 运行环境：production 下启动时不执行建表，表结构由 init_db.py / migrate.py 维护
+APP_ENV = os.getenv("APP_ENV", "development")
+
+# 启动时执行的预热阶段（逗号分隔，空字符串表示不预热、首次请求时再加载）：
+# db_pool-连接池，dictionary-词典快照，fuzzy_index-相似词索引，search_index-检索索引。
+# 后两者在每个 worker 内各自构建（需全表查询），设置 DICTIONARY_SNAPSHOT_DIR 共享词典时默认不预热
+WARMUP_PHASES = ("db_pool", "dictionary", "fuzzy_index", "search_index")
+
+
+def _default_warmup_phases() -> str:
+    if os.getenv("DICTIONARY_SNAPSHOT_DIR"):
+        return "db_pool,dictionary"
+    return ",".join(WARMUP_PHASES)
+
+
+STARTUP_WARMUP_PHASES = [
+    phase.strip() for phase in os.getenv("STARTUP_WARMUP_PHASES", _default_warmup_phases()).split(",") if phase.strip()
+]
+
+
+# 预先建立连接池中的连接，首个请求不再承担建连耗时
+def _warm_pool(engine: Engine):
+    size = getattr(engine.pool, "size", None)
+    connections = [engine.connect() for _ in range(size() if callable(size) else 1)]
+    for connection in connections:
+        connection.close()
+
+
+def _warm_dictionary():
+    from app.services.root_word_dictionary import get_root_word_dictionary
+    get_root_word_dictionary()
+
+
+def _warm_fuzzy_index():
+    from app.services.root_word_dictionary import get_root_word_dictionary
+    get_root_word_dictionary().build_fuzzy_index()
+
+
+def _warm_search_index():
+    from app.database import SessionLocal
+    from app.services.root_word_search import get_root_word_search_index
+    with SessionLocal() as db:
+        get_root_word_search_index(db)
+
+
+# 应用启动阶段（在 lifespan 中于线程内执行），返回各阶段耗时（毫秒）
+def run_startup(engine: Engine) -> Dict[str, float]:
+    """建表失败时抛出异常终止启动；预热失败只记录日志，相应缓存在首次使用时再加载"""
+    from app.database import Base
+    warmups: Dict[str, Callable[[], object]] = {
+        "db_pool": lambda: _warm_pool(engine),
+        "dictionary": _warm_dictionary,
+        "fuzzy_index": _warm_fuzzy_index,
+        "search_index": _warm_search_index,
+    }
+    unknown = set(STARTUP_WARMUP_PHASES) - set(warmups)
+    if unknown:
+        raise ValueError(f"未知的预热阶段: {', '.join(sorted(unknown))}")
+    
+    phases: Dict[str, Callable[[], object]] = {}
+    if APP_ENV != "production":
+        phases["create_tables"] = lambda: Base.metadata.create_all(bind=engine)
+    for name in WARMUP_PHASES:
+        if name in STARTUP_WARMUP_PHASES:
+            phases[name] = warmups[name]
+
+    timings = {}
+    for name, phase in phases.items():
+        start = time.perf_counter()
+        try:
+            phase()
+        except Exception:
+            if name == "create_tables":
+                raise
+            logger.exception("启动预热阶段 %s 失败", name)
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info("启动阶段 %s 耗时 %.1fms", name, timings[name])
+    logger.info("启动完成，共耗时 %.1fms", sum(timings.values()))
+    return timings
@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+from sqlalchemy.orm import Session
+from app.models.operation_log import RootWordOperationLog, OperationType
+from app.services import operation_log_writer
+from app.services.dictionary_version import (
+    COMMITTED_SEARCH_VERSION, COMMITTED_VERSION, SEARCH_VERSION_ROW_ID, bump_dictionary_version
+)
+
+# 异步模式下暂存于会话中、待事务提交后入队的操作日志
+_PENDING_LOGS = "pending_operation_logs"
+
+# 标记本次事务没有词根变更（不递增任何版本号），或没有改变已生效词根（只递增检索版本号）
+_UNCHANGED = "root_word_unchanged"
+_EFFECTIVE_UNCHANGED = "effective_root_word_unchanged"
+
+
+# 单事务执行一次词根变更：正常结束时提交一次，异常时回滚
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """词根状态变更与操作日志在同一事务中写入，只提交一次
+    
+    提交前递增检索版本号，改变了已生效词根时还递增词典版本号，提交后记入 db.info 供刷新本地词典和检索索引时使用；
+    异步日志模式下操作日志不进入该事务，提交成功后才交给后台写入器，回滚时一并丢弃
+    """
+    try:
+        yield db
+        unchanged = db.info.pop(_UNCHANGED, False)
+        effective_unchanged = db.info.pop(_EFFECTIVE_UNCHANGED, False) or unchanged
+        search_version = None if unchanged else bump_dictionary_version(db, SEARCH_VERSION_ROW_ID)
+        version = None if effective_unchanged else bump_dictionary_version(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        db.info.pop(_PENDING_LOGS, None)
+        db.info.pop(_UNCHANGED, None)
+        db.info.pop(_EFFECTIVE_UNCHANGED, None)
+        raise
+    for key, value in ((COMMITTED_VERSION, version), (COMMITTED_SEARCH_VERSION, search_version)):
+        if value is None:
+            db.info.pop(key, None)
+        else:
+            db.info[key] = value
+    pending = db.info.pop(_PENDING_LOGS, None)
+    if pending:
+        operation_log_writer.operation_log_writer.submit(pending)
+
+
+# 标记本次 unit_of_work 未变更任何词根（如批量操作全部失败），其他 worker 无需重新加载词典和检索索引
+def mark_unchanged(db: Session):
+    db.info[_UNCHANGED] = True
+
+
+# 标记本次 unit_of_work 只变更了未生效的词根（如申请、删除待审核、驳回），词典快照不变，无需重新加载
+def mark_effective_unchanged(db: Session):
+    db.info[_EFFECTIVE_UNCHANGED] = True
+
+
+# 操作日志时间：由应用统一取 UTC 时间，与 apply_time/audit_time 一致，不依赖数据库的 now()
+def operation_time() -> datetime:
+    return datetime.utcnow()
+
+
+# 记录操作日志：同步模式写入当前事务，异步模式在 unit_of_work 提交后批量写入
+def add_operation_log(db: Session, word_id: int, operation_type: OperationType, username: str, content: str):
+    """两种模式都在调用时记录操作时间，异步写入的延迟不影响日志时间"""
+    if operation_log_writer.OPERATION_LOG_MODE == "async":
+        db.info.setdefault(_PENDING_LOGS, []).append({
+            "word_id": word_id,
+            "operation_type": operation_type,
+            "operation_user": username,
+            "operation_time": operation_time(),
+            "operation_content": content,
+        })
+        return
+    db.add(RootWordOperationLog(
+        word_id=word_id,
+        operation_type=operation_type,
+        operation_user=username,
+        operation_time=operation_time(),
+        operation_content=content
+    ))
@@ -0,0 +1,321 @@
+import re
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+# 词法规则：一次线性扫描切分 DDL，字符串、反引号和注释内部的括号/逗号不参与结构判断
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+      (?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))
+    | (?P<string>'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'|"[^"\\]*(?:(?:\\.|"")[^"\\]*)*")
+    | (?P<backtick>`[^`]*(?:``[^`]*)*`)
+    | (?P<word>\w+)
+    | (?P<lparen>\()
+    | (?P<rparen>\))
+    | (?P<comma>,)
+    | (?P<semicolon>;)
+    | (?P<other>.)
+    )
+    """,
+    re.VERBOSE | re.DOTALL
+)
+
+# 语句边界扫描：只识别字符串、反引号、注释和分号，与 _TOKEN_RE 对分号的判定一致
+_BOUNDARY_RE = re.compile(
+    r"""
+      --[^\n]*|/\*.*?(?:\*/|\Z)
+    | '[^'\\]*(?:(?:\\.|'')[^'\\]*)*'|"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"
+    | `[^`]*(?:``[^`]*)*`
+    | (?P<semicolon>;)
+    """,
+    re.VERBOSE | re.DOTALL
+)
+
+# 字符串内的转义：反斜杠转义或连续两个引号
+_ESCAPE_RES = {
+    "'": re.compile(r"\\(.)|''", re.DOTALL),
+    '"': re.compile(r'\\(.)|""', re.DOTALL)
+}
+
+# CREATE 与 TABLE 之间允许出现的修饰词
+_CREATE_MODIFIERS = {"temporary", "external", "or", "replace"}
+
+# ClickHouse 中不改变取值类型的外层包装，改写类型时保留
+_TYPE_WRAPPER_RE = re.compile(r"\s*(?:nullable|lowcardinality)\s*\(\s*", re.IGNORECASE)
+
+# 表内约束/索引定义的起始关键字
+_CONSTRAINT_KEYWORDS = {"primary", "unique", "foreign", "key", "index", "constraint", "fulltext", "spatial"}
+
+# 词法单元：(类型, 文本, 起始偏移, 结束偏移)
+Token = Tuple[str, str, int, int]
+
+
+# 字段定义：字段名、类型、注释，以及类型在源 DDL 中的偏移 [type_start, type_end)
+class ColumnDefinition(NamedTuple):
+    field_name: str
+    field_type: str
+    field_comment: str
+    type_start: int
+    type_end: int
+
+
+# 建表语句解析结果
+class TableDefinition(NamedTuple):
+    table_name: str
+    database_engine: str
+    fields: list
+
+
+# 词法扫描
+def tokenize(sql: str) -> Iterator[Token]:
+    """逐个产出词法单元，跳过空白和注释"""
+    for match in _TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        start, end = match.span(kind)
+        yield kind, match.group(kind), start, end
+
+
+# 去掉引号并处理转义
+def unquote(text: str) -> str:
+    quote = text[0]
+    body = text[1:-1]
+    if quote == "`":
+        return body.replace("``", "`")
+    if "\\" not in body and quote * 2 not in body:
+        return body
+    return _ESCAPE_RES[quote].sub(lambda m: m.group(1) if m.group(1) is not None else quote, body)
+
+
+# 识别数据库引擎
+def identify_database_engine(ddl_content: str) -> str:
+    """识别DDL语句所属的数据库引擎"""
+    ddl_lower = ddl_content.lower()
+    
+    # ClickHouse 特征 - 特定的MergeTree引擎类型
+    if 'replacingmergetree' in ddl_lower or 'mergetree(' in ddl_lower or 'summingmergetree' in ddl_lower:
+        return 'clickhouse'
+    # Doris 特征
+    elif 'doris' in ddl_lower or 'duplicate key' in ddl_lower or 'engine = olap' in ddl_lower or 'distributed by' in ddl_lower:
+        return 'doris'
+    # MySQL 特征（默认）
+    else:
+        return 'mysql'
+
+
+# 将词法单元迭代器推进到 CREATE TABLE 字段列表的左括号之后，返回表名；未找到时返回 None
+def _seek_column_list(tokens: Iterator[Token]) -> Optional[str]:
+    for kind, text, _, _ in tokens:
+        if kind != "word" or text.lower() != "create":
+            continue
+        # 跳过 CREATE 与 TABLE 之间的修饰词
+        lower = ""
+        for kind, text, _, _ in tokens:
+            lower = text.lower() if kind == "word" else ""
+            if lower not in _CREATE_MODIFIERS:
+                break
+        if lower != "table":
+            continue
+        # 收集表名（跳过 IF NOT EXISTS），直到字段列表的左括号
+        name_parts = []
+        for kind, text, _, _ in tokens:
+            if kind == "lparen":
+                return ".".join(name_parts)
+            if kind == "semicolon":
+                break
+            if kind == "backtick":
+                name_parts.append(unquote(text))
+            elif kind == "word" and (name_parts or text.lower() not in ("if", "not", "exists")):
+                name_parts.append(text)
+    return None
+
+
+# 按顶层逗号切分字段列表，遇到匹配的右括号结束
+def _iter_column_tokens(tokens: Iterator[Token]) -> Iterator[List[Token]]:
+    depth = 0
+    current = []
+    for token in tokens:
+        kind = token[0]
+        if kind == "lparen":
+            depth += 1
+        elif kind == "rparen":
+            if depth == 0:
+                break
+            depth -= 1
+        elif kind == "comma" and depth == 0:
+            if current:
+                yield current
+            current = []
+            continue
+        current.append(token)
+    if current:
+        yield current
+
+
+# 解析单个字段定义；约束定义或无法识别时返回 None
+def _parse_column(column: List[Token], source: str) -> Optional[ColumnDefinition]:
+    if len(column) < 2:
+        return None
+    
+    name_kind, name_text = column[0][0], column[0][1]
+    if name_kind == "word":
+        if name_text.lower() in _CONSTRAINT_KEYWORDS or name_text[0].isdigit():
+            return None
+        field_name = name_text
+    elif name_kind == "backtick":
+        field_name = unquote(name_text)
+    else:
+        return None
+    
+    # 类型：类型名及紧随其后的括号参数，如 varchar(32)、Nullable(String)
+    type_kind, type_text, type_start, type_end = column[1]
+    if type_kind != "word" or not type_text[0].isalpha():
+        return None
+    index = 2
+    if index < len(column) and column[index][0] == "lparen":
+        depth = 0
+        while index < len(column):
+            kind = column[index][0]
+            if kind == "lparen":
+                depth += 1
+            elif kind == "rparen":
+                depth -= 1
+                if depth == 0:
+                    type_end = column[index][3]
+                    index += 1
+                    break
+            index += 1
+        else:
+            type_end = column[-1][3]
+    field_type = source[type_start:type_end]
+    
+    # 注释：顶层 COMMENT 关键字后的字符串
+    field_comment = ""
+    depth = 0
+    for i in range(index, len(column) - 1):
+        kind, text = column[i][0], column[i][1]
+        if kind == "lparen":
+            depth += 1
+        elif kind == "rparen":
+            depth -= 1
+        elif depth == 0 and kind == "word" and text.lower() == "comment":
+            next_kind, next_text = column[i + 1][0], column[i + 1][1]
+            if next_kind in ("string", "backtick"):
+                field_comment = unquote(next_text)
+                break
+    
+    return ColumnDefinition(field_name, field_type, field_comment, type_start, type_end)
+
+
+# 解析一条 CREATE TABLE 的字段列表，返回 (表名, 字段列表)；不是建表语句时返回 None
+# 字段默认为 (字段名, 字段类型, 字段注释) 三元组，with_spans 为 True 时返回 ColumnDefinition
+def _parse_create_table(tokens: Iterator[Token], source: str, debug_info: Optional[dict] = None,
+                        with_spans: bool = False) -> Optional[Tuple[str, list]]:
+    table_name = _seek_column_list(tokens)
+    if table_name is None:
+        if debug_info is not None:
+            debug_info["steps"].append("未能提取表体内容")
+        return None
+    
+    fields = []
+    for i, column in enumerate(_iter_column_tokens(tokens)):
+        field = _parse_column(column, source)
+        if field:
+            fields.append(field if with_spans else field[:3])
+        if debug_info is not None:
+            column_text = source[column[0][2]:column[-1][3]]
+            if i == 0:
+                debug_info["first_field_preview"] = column_text[:100]
+            debug_info["steps"].append(f"处理字段 {i+1}: {column_text[:50]}...")
+            if field:
+                debug_info["steps"].append(f"  成功匹配: {field[0]} - {field[1]} - 注释: {field[2][:20] if field[2] else '无'}")
+            else:
+                debug_info["steps"].append("  跳过约束定义或未匹配到字段名和类型")
+    if debug_info is not None:
+        debug_info["steps"].append(f"解析得到 {len(fields)} 个字段")
+    return table_name, fields
+
+
+# 提取字段信息
+def extract_fields(ddl_content: str, debug_info: Optional[dict] = None) -> list:
+    """从DDL语句中提取字段信息，返回 (字段名, 字段类型, 字段注释) 的列表
+
+    传入 debug_info 字典时记录解析过程，默认不收集任何调试信息
+    """
+    if debug_info is not None:
+        debug_info.setdefault("steps", []).append(f"词法扫描 DDL 长度: {len(ddl_content)}")
+    parsed = _parse_create_table(tokenize(ddl_content), ddl_content, debug_info)
+    return parsed[1] if parsed else []
+
+
+# 提取字段定义及类型偏移
+def extract_columns(ddl_content: str) -> List[ColumnDefinition]:
+    """与 extract_fields 相同，但额外返回每个字段类型在 DDL 中的偏移，用于按位置改写"""
+    parsed = _parse_create_table(tokenize(ddl_content), ddl_content, with_spans=True)
+    return parsed[1] if parsed else []
+
+
+# 按偏移替换文本片段，一次拼接生成新文本
+def replace_spans(source: str, replacements: List[Tuple[int, int, str]]) -> str:
+    """replacements 为 (起始偏移, 结束偏移, 新文本) 列表，片段之间不能重叠"""
+    parts = []
+    position = 0
+    for start, end, text in sorted(replacements):
+        parts.append(source[position:start])
+        parts.append(text)
+        position = end
+    parts.append(source[position:])
+    return "".join(parts)
+
+
+# 去掉字段类型外层的 Nullable(...)、LowCardinality(...) 包装，返回内层类型的偏移
+def unwrap_type_span(source: str, start: int, end: int) -> Tuple[int, int]:
+    """如 LowCardinality(Nullable(String)) 返回 String 的偏移，没有包装时原样返回"""
+    while True:
+        match = _TYPE_WRAPPER_RE.match(source, start, end)
+        if match is None or source[end - 1] != ")":
+            return start, end
+        inner_end = end - 1
+        while inner_end > match.end() and source[inner_end - 1].isspace():
+            inner_end -= 1
+        if inner_end == match.end():
+            return start, end
+        start, end = match.end(), inner_end
+
+
+# 按顶层分号切分多条语句，返回每条语句的词法单元列表
+def split_statements(sql: str) -> Iterator[List[Token]]:
+    """切分多语句脚本（如 mysqldump 导出），字符串和注释中的分号不参与切分"""
+    statement = []
+    for token in tokenize(sql):
+        if token[0] == "semicolon":
+            if statement:
+                yield statement
+            statement = []
+        else:
+            statement.append(token)
+    if statement:
+        yield statement
+
+
+# 逐条解析脚本中的建表语句
+def iter_create_tables(sql: str) -> Iterator[TableDefinition]:
+    """按顺序产出脚本中每条 CREATE TABLE 的表名、数据库引擎和字段，其他语句忽略"""
+    for statement in split_statements(sql):
+        parsed = _parse_create_table(iter(statement), sql)
+        if parsed is None:
+            continue
+        statement_text = sql[statement[0][2]:statement[-1][3]]
+        yield TableDefinition(parsed[0], identify_database_engine(statement_text), parsed[1])
+
+
+# 按语句边界把脚本切成若干块，每块不少于 chunk_size 个字符（最后一块除外）
+def split_script(sql: str, chunk_size: int) -> Iterator[str]:
+    """切分多语句脚本用于并行解析，各块分别解析的结果与整体解析一致；按需逐块产出"""
+    start = 0
+    for match in _BOUNDARY_RE.finditer(sql):
+        if match.lastgroup == "semicolon" and match.end() - start >= chunk_size:
+            yield sql[start:match.end()]
+            start = match.end()
+    if start < len(sql):
+        yield sql[start:]
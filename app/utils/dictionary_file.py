@@ -0,0 +1,131 @@
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+# 文件格式：文件头 | 哈希槽表 | 记录区，整数均为小端
+# 文件头：魔数、版本号、记录数、槽数（2 的幂）、键按下划线切分的最大片段数
+_MAGIC = b"RWD1"
+_HEADER = struct.Struct("<4sQIII")
+# 哈希槽：键的 crc32、记录偏移（0 表示空槽），线性探测，装载率不超过 1/2
+_SLOT = struct.Struct("<II")
+# 记录：整数 id、字段数，随后每个字段为长度 + UTF-8 字节，长度为 _NULL 表示 None；第一个字段为键
+_RECORD = struct.Struct("<IH")
+_LENGTH = struct.Struct("<I")
+_NULL = 0xFFFFFFFF
+
+Record = Tuple[int, Tuple[Optional[str], ...]]
+
+
+def _encode_record(record_id: int, fields: Sequence[Optional[str]]) -> bytes:
+    parts = [_RECORD.pack(record_id, len(fields))]
+    for field in fields:
+        if field is None:
+            parts.append(_LENGTH.pack(_NULL))
+        else:
+            data = field.encode("utf-8")
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+    return b"".join(parts)
+
+
+# 写入只读词典文件：先写临时文件再原子替换，读取方不会看到写了一半的文件
+def write_dictionary_file(path: str, version: int, records: Iterable[Record]):
+    """records 为 (id, (键, 其他字段...))，键必须唯一"""
+    records = list(records)
+    slots = 2
+    while slots < len(records) * 2:
+        slots *= 2
+    table_offset = _HEADER.size
+    offset = table_offset + slots * _SLOT.size
+    table = bytearray(slots * _SLOT.size)
+    body = []
+    max_parts = 0
+    for record_id, fields in records:
+        key = fields[0]
+        max_parts = max(max_parts, key.count("_") + 1)
+        key_hash = zlib.crc32(key.encode("utf-8"))
+        i = key_hash & (slots - 1)
+        while _SLOT.unpack_from(table, i * _SLOT.size)[1]:
+            i = (i + 1) & (slots - 1)
+        _SLOT.pack_into(table, i * _SLOT.size, key_hash, offset)
+        data = _encode_record(record_id, fields)
+        body.append(data)
+        offset += len(data)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, version, len(records), slots, max_parts))
+        f.write(table)
+        for data in body:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+# 以 mmap 只读打开的词典文件，多个进程映射同一文件时共享同一份物理内存
+class DictionaryFile:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buf) < _HEADER.size:
+            raise ValueError(f"词典文件格式错误: {path}")
+        magic, self.version, self._count, self._slots, self.max_parts = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"词典文件格式错误: {path}")
+        self._table = _HEADER.size
+        self._records = self._table + self._slots * _SLOT.size
+
+    def _read(self, offset: int) -> Tuple[Record, int]:
+        buf = self._buf
+        record_id, field_count = _RECORD.unpack_from(buf, offset)
+        offset += _RECORD.size
+        fields = []
+        for _ in range(field_count):
+            length, = _LENGTH.unpack_from(buf, offset)
+            offset += _LENGTH.size
+            if length == _NULL:
+                fields.append(None)
+            else:
+                fields.append(buf[offset:offset + length].decode("utf-8"))
+                offset += length
+        return (record_id, tuple(fields)), offset
+
+    def _key_equals(self, offset: int, key: bytes) -> bool:
+        start = offset + _RECORD.size + _LENGTH.size
+        length, = _LENGTH.unpack_from(self._buf, start - _LENGTH.size)
+        return length == len(key) and self._buf[start:start + length] == key
+
+    def find(self, key: str) -> int:
+        """按键查找记录偏移，不解码记录；键不存在时返回 0"""
+        data = key.encode("utf-8")
+        key_hash = zlib.crc32(data)
+        mask = self._slots - 1
+        i = key_hash & mask
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(self._buf, self._table + i * _SLOT.size)
+            if not offset:
+                return 0
+            if slot_hash == key_hash and self._key_equals(offset, data):
+                return offset
+            i = (i + 1) & mask
+
+    def read(self, offset: int) -> Record:
+        """解码 find 返回的偏移处的记录"""
+        return self._read(offset)[0]
+
+    def get(self, key: str) -> Optional[Record]:
+        """按键查找记录，只解码命中的一条"""
+        offset = self.find(key)
+        return self._read(offset)[0] if offset else None
+
+    def __iter__(self) -> Iterator[Record]:
+        offset = self._records
+        for _ in range(self._count):
+            record, offset = self._read(offset)
+            yield record
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,137 @@
+from array import array
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# 每个长度桶在 q-gram 引理要求之外多扫描的倒排表数，用于提高候选的最少出现次数、减少编辑距离计算
+FILTER_EXTRA = 6
+
+
+# 相似词建议
+class Suggestion(NamedTuple):
+    word: str
+    distance: int
+
+
+# 词的三元组（首尾补位，短词也至少有一个三元组）
+def _trigrams(word: str) -> set:
+    padded = f"$${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# 编辑距离，超过 limit 时提前返回 limit + 1
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    # 去掉公共前后缀，拼写错误通常只影响中间一小段
+    start = 0
+    end_a, end_b = len(a), len(b)
+    while start < end_a and start < end_b and a[start] == b[start]:
+        start += 1
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a) if limit is None else min(len(a), limit + 1)
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    
+    if limit is None:
+        limit = len(a)
+    
+    # 只计算对角线两侧 limit 宽的带状区域
+    big = limit + 1
+    previous = [j if j <= limit else big for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        char_a = a[i - 1]
+        low, high = max(1, i - limit), min(len(b), i + limit)
+        current = [big] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char_a != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+        if min(current[low - 1:high + 1]) > limit:
+            return big
+        previous = current
+    return min(previous[-1], big)
+
+
+# 三元组倒排索引：先按共同三元组数量召回候选，再用编辑距离精排
+# 倒排表按 (三元组, 词长) 分桶，编辑距离不超过 d 的词长度差也不超过 d，查询时只扫描相邻长度的桶
+class TrigramIndex:
+    def __init__(self, words: Iterable[str]):
+        self.words: List[str] = list(words)
+        postings: Dict[Tuple[str, int], array] = {}
+        # 按词长分组的词下标，查询过短、三元组不足以过滤时逐词比较
+        by_length: Dict[int, array] = {}
+        for index, word in enumerate(self.words):
+            length = len(word)
+            by_length.setdefault(length, array("I")).append(index)
+            for gram in _trigrams(word):
+                posting = postings.get((gram, length))
+                if posting is None:
+                    posting = postings[(gram, length)] = array("I")
+                posting.append(index)
+        self._postings = postings
+        self._by_length = by_length
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def search(self, query: str, limit: int = 3, max_distance: Optional[int] = None,
+               max_candidates: Optional[int] = None,
+               accept: Optional[Callable[[str], bool]] = None) -> List[Suggestion]:
+        """返回编辑距离不超过 max_distance（默认按查询长度取 1 或 2）的前 limit 个相似词
+        
+        默认对过滤后的全部候选计算编辑距离，结果与逐词比较一致；指定 max_candidates 时只精排
+        共同三元组最多的前若干个候选，速度更快但可能漏掉真正最相近的词；
+        accept 用于排除索引中已失效的词，返回 False 的词不计入结果
+        """
+        if not self.words or not query:
+            return []
+        if max_distance is None:
+            max_distance = min(2, max(1, len(query) // 4))
+        
+        # q-gram 引理：一次编辑最多破坏 3 个三元组，距离不超过 d 的词最多缺少查询的 3d 个三元组。
+        # 每个长度桶扫描最稀有的 3d + 1 + FILTER_EXTRA 个倒排表计数，缺失的倒排表（桶内无词包含）
+        # 也计入缺少的三元组，由此得到该桶候选词至少应出现的次数；阈值不大于 0 时整桶都是候选
+        grams = _trigrams(query)
+        length = len(query)
+        candidates = []
+        for word_length in range(max(1, length - max_distance), length + max_distance + 1):
+            postings = [self._postings.get((gram, word_length)) for gram in grams]
+            present = sorted((p for p in postings if p is not None), key=len)
+            absent = len(postings) - len(present)
+            present = present[:3 * max_distance + 1 + FILTER_EXTRA]
+            need = len(present) - max(0, 3 * max_distance - absent)
+            if need <= 0:
+                candidates.extend((0, index) for index in self._by_length.get(word_length, ()))
+                continue
+            counts = Counter()
+            for posting in present:
+                counts.update(posting)
+            candidates.extend((count, index) for index, count in counts.items() if count >= need)
+        
+        # 按共同三元组数量从多到少计算编辑距离；凑满 limit 个后只需找距离不超过当前第 limit 名的词
+        candidates.sort(key=lambda c: -c[0])
+        suggestions: List[Suggestion] = []
+        bound = max_distance
+        for _, index in candidates[:max_candidates]:
+            word = self.words[index]
+            if word == query or abs(len(word) - length) > bound:
+                continue
+            distance = edit_distance(query, word, bound)
+            if distance <= bound and (accept is None or accept(word)):
+                suggestions.append(Suggestion(word, distance))
+                if len(suggestions) >= limit:
+                    suggestions.sort(key=lambda s: (s.distance, s.word))
+                    del suggestions[limit:]
+                    bound = suggestions[-1].distance
+        suggestions.sort(key=lambda s: (s.distance, s.word))
+        return suggestions[:limit]
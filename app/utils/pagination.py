@@ -0,0 +1,19 @@
+import base64
+import json
+
+
+# 根据当前页最后一条记录生成游标，对调用方不透明
+def encode_cursor(order_by: str, last_id: int) -> str:
+    raw = json.dumps({"o": order_by, "id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+# 解析游标，返回上一页最后一条记录的 id，格式非法或与排序方式不符时抛出 ValueError
+def decode_cursor(cursor: str, order_by: str) -> int:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["o"] != order_by:
+            raise ValueError("游标排序方式不一致")
+        return int(payload["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"无效的分页游标: {e}") from e
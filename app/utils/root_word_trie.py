@@ -0,0 +1,64 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# 切分结果中的一段：文本及其匹配的词根条目（未匹配时为 None）
+class Segment(NamedTuple):
+    text: str
+    entry: Optional[Any]
+
+
+# 按下划线分词的词根前缀树，用于把字段名切分为已知词根序列
+class RootWordTrie:
+    def __init__(self, items: Iterable[Tuple[str, Any]]):
+        # 节点为 dict：键为词片段，None 键保存以该节点结尾的词根条目
+        self._root: Dict[Optional[str], Any] = {}
+        self.max_depth = 0
+        for word_name, entry in items:
+            parts = word_name.split("_")
+            node = self._root
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[None] = entry
+            self.max_depth = max(self.max_depth, len(parts))
+
+    def _matches(self, parts: List[str], i: int) -> Iterator[Tuple[int, Any]]:
+        # 沿前缀树匹配从 i 开始的所有词根
+        node = self._root
+        for j in range(i, min(len(parts), i + self.max_depth)):
+            node = node.get(parts[j])
+            if node is None:
+                return
+            entry = node.get(None)
+            if entry is not None:
+                yield j + 1, entry
+
+    def segment(self, name: str) -> List[Segment]:
+        """动态规划切分：优先覆盖最多的词片段，其次使用最少（即最长）的词根"""
+        parts = name.split("_")
+        return segment_parts(parts, lambda i: self._matches(parts, i))
+
+
+# 按 matches(i) 给出的候选词根（结束位置, 条目）动态规划切分词片段序列
+def segment_parts(parts: List[str], matches: Callable[[int], Iterable[Tuple[int, Any]]]) -> List[Segment]:
+    """优先覆盖最多的词片段，其次使用最少（即最长）的词根"""
+    n = len(parts)
+    # best[i] = (已覆盖片段数, -段数, 下一个切分位置, 条目)，表示 parts[i:] 的最优切分
+    best: List[Optional[tuple]] = [None] * (n + 1)
+    best[n] = (0, 0, n, None)
+    for i in range(n - 1, -1, -1):
+        # 未匹配的单个片段
+        covered, segments = best[i + 1][0], best[i + 1][1]
+        best[i] = (covered, segments - 1, i + 1, None)
+        for end, entry in matches(i):
+            rest = best[end]
+            candidate = (rest[0] + end - i, rest[1] - 1, end, entry)
+            if candidate[:2] > best[i][:2]:
+                best[i] = candidate
+    
+    result = []
+    i = 0
+    while i < n:
+        _, _, end, entry = best[i]
+        result.append(Segment("_".join(parts[i:end]), entry))
+        i = end
+    return result
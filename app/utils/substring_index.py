@@ -0,0 +1,95 @@
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# n-gram 倒排索引：按子串查找文本 id，忽略大小写
+class SubstringIndex:
+    """倒排表只追加，删除或修改文本后旧倒排项由校验步骤过滤，过期项过多时整体重建"""
+
+    def __init__(self, gram_size: int = 3, items: Iterable[Tuple[int, Optional[str]]] = ()):
+        self.gram_size = gram_size
+        self._texts: Dict[int, str] = {}
+        self._postings: Dict[str, array] = {}
+        self._size = 0
+        self._stale = 0
+        self._lock = threading.Lock()
+        for text_id, text in items:
+            self._size += self._add(text_id, text)
+
+    def _grams(self, text: str) -> set:
+        n = self.gram_size
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def _add(self, text_id: int, text: Optional[str], texts: Optional[dict] = None, postings: Optional[dict] = None):
+        if not text:
+            return 0
+        texts = self._texts if texts is None else texts
+        postings = self._postings if postings is None else postings
+        text = text.lower()
+        texts[text_id] = text
+        grams = self._grams(text)
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                ids = postings[gram] = array("I")
+            ids.append(text_id)
+        return len(grams)
+
+    def _remove(self, text_id: int):
+        text = self._texts.pop(text_id, None)
+        if text is not None:
+            self._stale += len(self._grams(text))
+
+    def _compact(self):
+        """过期倒排项超过一半时重建倒排表"""
+        if self._stale * 2 <= self._size:
+            return
+        texts, postings, size = {}, {}, 0
+        for text_id, text in self._texts.items():
+            size += self._add(text_id, text, texts, postings)
+        # 先替换倒排表再替换文本表，并发查询读到的任一组合都能得到正确结果
+        self._postings = postings
+        self._texts = texts
+        self._size = size
+        self._stale = 0
+
+    def upsert(self, text_id: int, text: Optional[str]):
+        with self._lock:
+            self._remove(text_id)
+            self._size += self._add(text_id, text)
+            self._compact()
+
+    def remove(self, text_id: int):
+        with self._lock:
+            self._remove(text_id)
+            self._compact()
+
+    def search(self, query: str, limit: Optional[int] = None) -> Optional[List[int]]:
+        """返回包含 query 的文本 id（升序）
+
+        query 短于 gram_size 时无法走索引，返回 None；命中数超过 limit 时同样返回 None，由调用方退回数据库查询
+        """
+        query = query.lower()
+        if len(query) < self.gram_size:
+            return None
+        postings = self._postings
+        rarest = None
+        for gram in self._grams(query):
+            candidates = postings.get(gram)
+            if candidates is None:
+                return []
+            if rarest is None or len(candidates) < len(rarest):
+                rarest = candidates
+
+        texts = self._texts
+        matched = set()
+        for text_id in rarest:
+            if query in texts.get(text_id, ""):
+                matched.add(text_id)
+                if limit is not None and len(matched) > limit:
+                    return None
+        return sorted(matched)
+
+    def __len__(self) -> int:
+        return len(self._texts)
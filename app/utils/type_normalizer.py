@@ -0,0 +1,123 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# 规范形式的修订号，规范化规则变化时递增；持久化了规范形式的数据（如词典文件）按修订号区分
+CANONICAL_REVISION = 2
+
+# 类型表达式词法：标识符/数字、字符串、括号和逗号
+_TYPE_TOKEN_RE = re.compile(r"\s*(?:(\w+)|('[^'\\]*(?:(?:\\.|'')[^'\\]*)*')|([(),]))")
+
+# 整数类型的显示宽度不影响存储，int(11) 与 int 等价
+_INTEGER_TYPES = {"tinyint", "smallint", "mediumint", "int", "bigint"}
+
+# 各引擎的类型别名
+_ALIASES = {
+    "mysql": {"integer": "int", "numeric": "decimal", "bool": "tinyint", "boolean": "tinyint"},
+    "doris": {"integer": "int", "numeric": "decimal", "bool": "boolean"},
+    "clickhouse": {
+        "tinyint": "int8", "smallint": "int16", "int": "int32", "integer": "int32", "bigint": "int64",
+        "float": "float32", "double": "float64", "varchar": "string", "char": "string",
+        "text": "string", "blob": "string", "bool": "bool", "boolean": "bool"
+    }
+}
+
+# ClickHouse 中不改变取值类型的包装，比较时去掉（Nullable 只去掉最外层）
+_CLICKHOUSE_WRAPPERS = {"lowcardinality"}
+_CLICKHOUSE_TOP_LEVEL_WRAPPERS = {"nullable", "lowcardinality"}
+
+# 解析结果：(类型名, 参数列表, 修饰词)，参数为嵌套类型或字面量字符串，修饰词为参数之后的 unsigned 等
+TypeNode = Tuple[str, list, Tuple[str, ...]]
+
+
+# 切分类型表达式，含有无法识别的字符时返回 None
+def _tokenize(type_str: str) -> Optional[List[str]]:
+    tokens = []
+    position = 0
+    while position < len(type_str):
+        match = _TYPE_TOKEN_RE.match(type_str, position)
+        if match is None:
+            return None if type_str[position:].strip() else tokens
+        tokens.append(match.group(match.lastindex))
+        position = match.end()
+    return tokens
+
+
+# 解析类型表达式
+def _parse(tokens: List[str], position: int) -> Tuple[TypeNode, int]:
+    name = tokens[position].lower()
+    position += 1
+    # 多词类型名，如 double precision
+    while position < len(tokens) and tokens[position] not in ("(", ")", ","):
+        name = f"{name} {tokens[position].lower()}"
+        position += 1
+    args = []
+    if position < len(tokens) and tokens[position] == "(":
+        position += 1
+        while position < len(tokens) and tokens[position] != ")":
+            if tokens[position] == ",":
+                position += 1
+                continue
+            if tokens[position].startswith("'"):
+                args.append(tokens[position])
+                position += 1
+            else:
+                arg, position = _parse(tokens, position)
+                args.append(arg)
+        position += 1
+    # 参数之后的修饰词，如 int(11) unsigned
+    modifiers = []
+    while position < len(tokens) and tokens[position] not in ("(", ")", ","):
+        modifiers.append(tokens[position].lower())
+        position += 1
+    return (name, args, tuple(modifiers)), position
+
+
+# 规范化解析结果
+def _normalize(node: TypeNode, db_engine: str, top_level: bool = True) -> TypeNode:
+    name, args, modifiers = node
+    name = _ALIASES[db_engine].get(name, name)
+    
+    if db_engine == "clickhouse":
+        wrappers = _CLICKHOUSE_TOP_LEVEL_WRAPPERS if top_level else _CLICKHOUSE_WRAPPERS
+        if name in wrappers and len(args) == 1 and isinstance(args[0], tuple):
+            return _normalize(args[0], db_engine, top_level)
+    
+    args = [_normalize(arg, db_engine, False) if isinstance(arg, tuple) else arg for arg in args]
+    if db_engine != "clickhouse":
+        if name in _INTEGER_TYPES:
+            args = []
+        elif name == "decimal" and db_engine == "mysql" and not args:
+            args = ["10", "0"]
+        elif name == "decimal" and len(args) == 1:
+            args = args + ["0"]
+    return name, args, modifiers
+
+
+# 输出规范形式
+def _render(node) -> str:
+    if not isinstance(node, tuple):
+        return node
+    name, args, modifiers = node
+    if args:
+        name = f"{name}({','.join(_render(arg) for arg in args)})"
+    return " ".join((name,) + modifiers)
+
+
+# 类型规范化（带缓存，不同类型字符串数量有限）
+@lru_cache(maxsize=4096)
+def canonical_type(db_engine: str, type_str: str) -> str:
+    """把类型表达式规范化为可直接比较的形式，如 VARCHAR( 255 ) -> varchar(255)
+    
+    含有无法识别的字符或无法完整解析时不做规范化，只去掉首尾空白并转为小写
+    """
+    tokens = _tokenize(type_str)
+    if not tokens or db_engine not in _ALIASES:
+        return type_str.strip().lower()
+    try:
+        node, position = _parse(tokens, 0)
+    except IndexError:
+        return type_str.strip().lower()
+    if position != len(tokens):
+        return type_str.strip().lower()
+    return _render(_normalize(node, db_engine))
@@ -0,0 +1,53 @@
+"""鉴权开销：每次请求验签 / 查询用户 vs 缓存已验证令牌和用户
+
+用法：python benchmarks/bench_auth.py [调用次数]
+
+直接调用 get_current_user，模拟 CI 机器人复用同一个令牌高频调用 /ddl/check；数据库使用临时 SQLite。
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from datetime import timedelta
+from app import security
+from app.database import Base, SessionLocal, engine
+from app.models.user import User
+
+
+def run(count: int, token: str, cached: bool, lookup: bool) -> float:
+    security.USER_LOOKUP = lookup
+    security._token_cache.maxsize = security.TOKEN_CACHE_SIZE if cached else 0
+    security.USER_CACHE_TTL = 60 if cached else 0
+    security._token_cache.clear()
+    security._user_cache.clear()
+    db = SessionLocal()
+    start = time.perf_counter()
+    for _ in range(count):
+        security.get_current_user(token, db)
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed / count * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(username="ci_bot", password_hash="-", role="user"))
+        db.commit()
+    token = security.create_access_token({"sub": "ci_bot", "role": "user"}, timedelta(minutes=30))
+
+    print(f"调用次数 {count}（单次耗时）")
+    for lookup in (False, True):
+        before = run(count, token, False, lookup)
+        after = run(count, token, True, lookup)
+        label = "验签 + 查询用户" if lookup else "仅验签      "
+        print(f"{label}  不缓存 {before:7.1f}us  缓存 {after:6.1f}us  ({before / after:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""批量审核耗时：逐条调用 /audit vs 一次 /batch-audit
+
+用法：python benchmarks/bench_batch_audit.py [待审核词根数]
+
+直接调用接口函数，数据库使用临时 SQLite；逐条审核每个词根两次提交、每次都刷新词典快照。
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import Base, SessionLocal, engine
+from app.api.root_word import audit_root_word, batch_audit_root_word
+from app.models.root_word import RootWord, RootWordStatus
+from app.schemas.root_word import RootWordAudit, RootWordBatchAudit
+
+ADMIN = {"username": "admin", "role": "admin"}
+
+
+def seed(prefix: str, count: int) -> list:
+    db = SessionLocal()
+    db.bulk_insert_mappings(RootWord, [
+        {
+            "word_name": f"{prefix}_{i}", "mysql_type": "bigint", "doris_type": "bigint",
+            "clickhouse_type": "Int64", "status": RootWordStatus.PENDING_AUDIT, "apply_user": "bench",
+            "delete_flag": 0,
+        }
+        for i in range(count)
+    ])
+    db.commit()
+    word_ids = [word_id for word_id, in db.query(RootWord.id).filter(RootWord.word_name.like(f"{prefix}_%"))]
+    db.close()
+    return word_ids
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    Base.metadata.create_all(bind=engine)
+
+    word_ids = seed("single", count)
+    db = SessionLocal()
+    start = time.perf_counter()
+    for word_id in word_ids:
+        audit_root_word(RootWordAudit(word_id=word_id, audit_result=1), ADMIN, db)
+    one_by_one = time.perf_counter() - start
+    db.close()
+
+    word_ids = seed("batch", count)
+    db = SessionLocal()
+    start = time.perf_counter()
+    batch_audit_root_word(RootWordBatchAudit(word_ids=word_ids, audit_result=1), ADMIN, db)
+    batch = time.perf_counter() - start
+    db.close()
+
+    print(f"待审核词根 {count}")
+    print(f"逐条审核   {one_by_one:8.2f}s")
+    print(f"批量审核   {batch:8.2f}s  ({one_by_one / batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""单 worker 并发吞吐对比：async def 内直接调用同步 Session vs 同步接口交给线程池
+
+用法：python benchmarks/bench_concurrency.py [并发数] [模拟数据库延迟毫秒]
+
+“之前”把现有同步接口包装成 async def 协程（即原来的写法，数据库调用阻塞事件循环），
+“之后”直接使用现有同步接口（FastAPI 在线程池中执行）。数据库使用临时 SQLite，
+每条 SQL 额外 sleep 指定毫秒模拟 MySQL 往返延迟。
+"""
+import asyncio
+import functools
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+import httpx
+from anyio import to_thread
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import create_engine, event
+from app.database import Base, DATABASE_URL, SessionLocal, THREADPOOL_SIZE
+from app.api import root_word
+from app.models.root_word import RootWord, RootWordStatus
+from app.security import create_access_token
+
+
+# 将同步接口包装为阻塞事件循环的协程
+def as_blocking_coroutine(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def build_app(blocking: bool) -> FastAPI:
+    router = APIRouter()
+    for route in root_word.router.routes:
+        endpoint = as_blocking_coroutine(route.endpoint) if blocking else route.endpoint
+        router.add_api_route(route.path, endpoint, methods=list(route.methods), response_model=route.response_model)
+    app = FastAPI()
+    app.include_router(router, prefix="/api/root-word")
+    return app
+
+
+# 连接池与线程池同样大小，避免 SQLite 默认连接池成为瓶颈
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, pool_size=THREADPOOL_SIZE)
+SessionLocal.configure(bind=engine)
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        if db.query(RootWord).count() == 0:
+            db.add_all([
+                RootWord(
+                    word_name=f"word_{i}", mysql_type="bigint", doris_type="bigint",
+                    clickhouse_type="Int64", status=RootWordStatus.EFFECTIVE, apply_user="bench"
+                )
+                for i in range(200)
+            ])
+            db.commit()
+
+
+async def run(app: FastAPI, concurrency: int, rounds: int) -> float:
+    token = create_access_token({"sub": "bench", "role": "user"})
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            response = await client.post("/api/root-word/list", headers=headers, json={"page_num": 1, "page_size": 10})
+            assert response.status_code == 200
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(one() for _ in range(concurrency)))
+        return concurrency * rounds / (time.perf_counter() - start)
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    seed()
+    
+    @event.listens_for(engine, "before_cursor_execute")
+    def simulate_latency(*args):
+        time.sleep(latency_ms / 1000)
+    
+    async def bench():
+        to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+        before = await run(build_app(blocking=True), concurrency, 5)
+        after = await run(build_app(blocking=False), concurrency, 5)
+        print(f"并发数 {concurrency}，模拟数据库延迟 {latency_ms}ms/SQL，线程池 {THREADPOOL_SIZE}")
+        print(f"  async def 阻塞事件循环: {before:8.1f} req/s")
+        print(f"  同步接口 + 线程池:      {after:8.1f} req/s  ({after / before:.1f}x)")
+    
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
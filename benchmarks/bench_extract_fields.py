@@ -0,0 +1,208 @@
+"""extract_fields 性能对比：旧的正则 + 逐字符拼接实现 vs 单遍词法扫描实现
+
+用法：python benchmarks/bench_extract_fields.py
+"""
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.ddl_parser import extract_fields
+
+
+# 旧实现：正则清理注释 + 逐字符拼接切分字段
+def legacy_extract_fields(ddl_content: str) -> list:
+    """从DDL语句中提取字段信息，返回 (字段名, 字段类型, 字段注释) 的列表"""
+    fields = []
+    debug_info = {"steps": []}
+    
+    # 清理DDL内容，移除多余的空白和注释
+    clean_ddl = re.sub(r'--.*$', '', ddl_content, flags=re.MULTILINE)
+    clean_ddl = re.sub(r'/\*.*?\*/', '', clean_ddl, flags=re.DOTALL)
+    clean_ddl = clean_ddl.strip()
+    debug_info["steps"].append(f"清理后的DDL长度: {len(clean_ddl)}")
+    
+    # 查找CREATE TABLE语句中的字段定义部分
+    # 匹配 CREATE TABLE table_name ( 后的内容，支持反引号包裹的表名
+    table_match = re.search(
+        r'create\s+table\s+(?:`?[^`\(]+`?\s*)\((.*)',
+        clean_ddl, 
+        re.DOTALL | re.IGNORECASE
+    )
+    
+    if not table_match:
+        debug_info["steps"].append("未匹配到CREATE TABLE语句")
+        # 尝试更宽松的匹配
+        table_match = re.search(
+            r'create\s+table\s+.*\((.*)',
+            clean_ddl, 
+            re.DOTALL | re.IGNORECASE
+        )
+    
+    if table_match:
+        table_body = table_match.group(1)
+        debug_info["steps"].append(f"提取到表体内容，长度: {len(table_body)}")
+        debug_info["table_body_preview"] = table_body[:200] + "..." if len(table_body) > 200 else table_body
+        
+        # 找到最后一个闭合括号之前的所有内容（排除表级约束和引擎定义）
+        # 找到 ENGINE、PARTITION BY、ORDER BY、SETTINGS 等关键字之前的部分
+        # 注意：COMMENT 在字段级别使用，不应该作为结束标记
+        end_keywords = ['ENGINE', 'PARTITION BY', 'ORDER BY', 'SETTINGS', 'DISTRIBUTED BY']
+        end_pos = len(table_body)
+        for keyword in end_keywords:
+            # 匹配 ') KEYWORD' 或 ')\nKEYWORD' 模式（表级关键字）
+            pattern = re.compile(r'\s*\)\s*' + keyword, re.IGNORECASE)
+            match = pattern.search(table_body)
+            if match:
+                end_pos = min(end_pos, match.start())
+        
+        if end_pos < len(table_body):
+            table_body = table_body[:end_pos]
+            debug_info["steps"].append(f"截断到引擎定义前，新长度: {len(table_body)}")
+        
+        # 分割字段定义，考虑括号内的逗号
+        field_defs = []
+        depth = 0
+        current_field = ""
+        
+        for char in table_body:
+            if char == '(':
+                depth += 1
+                current_field += char
+            elif char == ')':
+                if depth > 0:
+                    depth -= 1
+                current_field += char
+            elif char == ',' and depth == 0:
+                if current_field.strip():
+                    field_defs.append(current_field.strip())
+                current_field = ""
+            else:
+                current_field += char
+        
+        # 添加最后一个字段
+        if current_field.strip():
+            field_defs.append(current_field.strip())
+        
+        debug_info["steps"].append(f"分割得到 {len(field_defs)} 个字段定义")
+        if field_defs:
+            debug_info["first_field_preview"] = field_defs[0][:100] if len(field_defs[0]) > 100 else field_defs[0]
+        
+        # 解析每个字段定义
+        for i, field_def in enumerate(field_defs):
+            field_def = field_def.strip()
+            if not field_def:
+                continue
+            
+            debug_info["steps"].append(f"处理字段 {i+1}: {field_def[:50]}...")
+            
+            # 跳过约束定义
+            if field_def.lower().startswith(('primary key', 'unique', 'foreign key', 'key', 'index', 'constraint')):
+                debug_info["steps"].append(f"  跳过约束定义")
+                continue
+            
+            # 匹配字段名和类型
+            # 字段名可以是：字母数字下划线，或者被反引号包裹
+            # 类型可能包含括号，如 varchar(32)，或者不带括号如 DateTime
+            # ClickHouse 类型可能包含 Nullable() 包装
+            # 需要处理 COMMENT 注释
+            
+            # 提取 COMMENT 内容（支持单引号、双引号、反引号包裹的注释）
+            comment_match = re.search(r"\s+COMMENT\s+(['\"`])(.*?)\1", field_def, flags=re.IGNORECASE)
+            field_comment = comment_match.group(2) if comment_match else ""
+            
+            # 移除 COMMENT 部分用于匹配字段名和类型
+            field_def_no_comment = re.sub(r"\s+COMMENT\s+(['\"`]).*?\1", '', field_def, flags=re.IGNORECASE)
+            
+            field_match = re.match(
+                r'^`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+(Nullable\()?([a-zA-Z][a-zA-Z0-9_]*(?:\([^)]*\))?)(\))?',
+                field_def_no_comment,
+                re.IGNORECASE
+            )
+            
+            if field_match:
+                field_name = field_match.group(1)
+                # 组合类型，包括 Nullable 包装
+                nullable_prefix = field_match.group(2) or ""
+                base_type = field_match.group(3)
+                nullable_suffix = field_match.group(4) or ""
+                field_type = f"{nullable_prefix}{base_type}{nullable_suffix}"
+                # 返回三元组：(字段名, 字段类型, 字段注释)
+                fields.append((field_name, field_type, field_comment))
+                debug_info["steps"].append(f"  成功匹配: {field_name} - {field_type} - 注释: {field_comment[:20] if field_comment else '无'}")
+            else:
+                debug_info["steps"].append(f"  未匹配到字段名和类型")
+    else:
+        debug_info["steps"].append("未能提取表体内容")
+    
+    # 将调试信息附加到函数上，供调用者使用
+    legacy_extract_fields.debug_info = debug_info
+    return fields
+
+
+# 生成指定列数的宽表 DDL
+def build_ddl(columns: int) -> str:
+    lines = []
+    for i in range(columns):
+        if i % 3 == 0:
+            lines.append(f"  `col_{i}_id` bigint(20) NOT NULL COMMENT '字段 {i}，含逗号(括号)'")
+        elif i % 3 == 1:
+            lines.append(f"  col_{i}_amount decimal(18, 2) DEFAULT '0.00' COMMENT '金额 {i}'")
+        else:
+            lines.append(f"  -- 行注释 {i}\n  col_{i}_name varchar(64) DEFAULT NULL")
+    body = ",\n".join(lines)
+    return f"CREATE TABLE `wide_table` (\n{body}\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='宽表'"
+
+
+def measure(func, ddl: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(ddl)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# 统计一次解析的峰值内存
+def peak_memory(func, ddl: str) -> int:
+    tracemalloc.start()
+    func(ddl)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def with_debug(ddl: str) -> list:
+    return extract_fields(ddl, {"steps": []})
+
+
+def main():
+    print(f"{'列数':>8} {'DDL字节':>10} {'旧实现(ms)':>12} {'新实现(ms)':>12} {'旧/列(us)':>10} {'新/列(us)':>10}")
+    for columns in (100, 1000, 5000, 20000):
+        ddl = build_ddl(columns)
+        repeat = 5 if columns <= 1000 else 2
+        assert extract_fields(ddl) == legacy_extract_fields(ddl)
+        legacy = measure(legacy_extract_fields, ddl, repeat)
+        current = measure(extract_fields, ddl, repeat)
+        print(
+            f"{columns:>8} {len(ddl.encode()):>10} {legacy * 1000:>12.2f} {current * 1000:>12.2f} "
+            f"{legacy / columns * 1e6:>10.2f} {current / columns * 1e6:>10.2f}"
+        )
+    
+    print()
+    print(f"{'列数':>8} {'关闭调试(ms)':>14} {'开启调试(ms)':>14} {'关闭峰值(KB)':>14} {'开启峰值(KB)':>14}")
+    for columns in (1000, 20000):
+        ddl = build_ddl(columns)
+        plain = measure(extract_fields, ddl, 3)
+        debug = measure(with_debug, ddl, 3)
+        print(
+            f"{columns:>8} {plain * 1000:>14.2f} {debug * 1000:>14.2f} "
+            f"{peak_memory(extract_fields, ddl) / 1024:>14.0f} {peak_memory(with_debug, ddl) / 1024:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""相似词根建议延迟：10 万词根的三元组索引，随机单字符拼写错误查询
+
+用法：python benchmarks/bench_fuzzy_index.py [词根数]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.fuzzy_index import TrigramIndex
+
+# 词片段组合生成词根，片段高度重复，是三元组索引的不利情况
+PARTS = [
+    "book", "channel", "adviser", "qrcode", "app", "product", "official", "name", "id", "time",
+    "amount", "scan", "share", "online", "seconds", "track", "user", "flow", "knot", "insert",
+    "group", "part", "battery", "level", "agent", "type", "code", "browse", "readers", "create",
+    "sales", "price", "volume", "quantity", "rate", "today", "yesterday", "total", "last", "year",
+    "msg", "resp", "content", "emo", "store", "inventory"
+]
+
+
+def build_words(count: int) -> list:
+    words = set()
+    while len(words) < count:
+        words.add("_".join(random.choice(PARTS) for _ in range(random.randint(2, 4))))
+    return sorted(words)
+
+
+# 随机删除、插入或替换一个字符
+def make_typo(word: str) -> str:
+    i = random.randrange(len(word))
+    char = random.choice("abcdefghijklmnopqrstuvwxyz")
+    op = random.choice("dis")
+    if op == "d":
+        return word[:i] + word[i + 1:]
+    if op == "i":
+        return word[:i] + char + word[i:]
+    return word[:i] + char + word[i + 1:]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(1)
+    words = build_words(count)
+    word_set = set(words)
+    
+    start = time.perf_counter()
+    index = TrigramIndex(words)
+    print(f"词根数 {count}，构建索引 {time.perf_counter() - start:.2f}s")
+    
+    latencies = []
+    hits = 0
+    for _ in range(500):
+        query = make_typo(random.choice(words))
+        if query in word_set:
+            continue
+        start = time.perf_counter()
+        suggestions = index.search(query)
+        latencies.append(time.perf_counter() - start)
+        if suggestions and suggestions[0].distance <= 1:
+            hits += 1
+    
+    latencies.sort()
+    print(f"查询 {len(latencies)} 次，首个建议距离为 1 的比例 {hits / len(latencies):.1%}")
+    print(f"延迟 p50 {latencies[len(latencies) // 2] * 1000:.2f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms  max {latencies[-1] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""词根列表深翻页耗时对比：页码分页（offset + count）vs 游标分页
+
+用法：python benchmarks/bench_list_pagination.py [词根数]
+
+数据库使用临时 SQLite，直接调用 list_root_word 接口函数，分别请求第 1 页、中间页和最后一页。
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import Base, SessionLocal, engine
+from app.api.root_word import list_root_word
+from app.models.root_word import RootWord, RootWordStatus
+from app.schemas.root_word import RootWordListRequest
+from app.utils.pagination import encode_cursor
+
+PAGE_SIZE = 20
+
+
+def seed(count: int):
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    db.bulk_insert_mappings(RootWord, [
+        {
+            "word_name": f"word_{i}", "mysql_type": "bigint", "doris_type": "bigint",
+            "clickhouse_type": "Int64", "status": RootWordStatus.EFFECTIVE, "apply_user": "bench",
+            "delete_flag": 0,
+        }
+        for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def timed(request: RootWordListRequest, repeat: int = 5) -> float:
+    db = SessionLocal()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list_root_word(request, current_user={}, db=db)
+        best = min(best, time.perf_counter() - start)
+    db.close()
+    return best
+
+
+# 游标指向目标页之前的最后一条记录，模拟客户端逐页翻到该页
+def cursor_for_page(page_num: int) -> Optional[str]:
+    if page_num == 1:
+        return None
+    db = SessionLocal()
+    last_id = db.query(RootWord.id).order_by(RootWord.id).offset((page_num - 1) * PAGE_SIZE - 1).limit(1).scalar()
+    db.close()
+    return encode_cursor("id", last_id)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    seed(count)
+    last_page = count // PAGE_SIZE
+    print(f"词根数 {count}，每页 {PAGE_SIZE} 条")
+    print(f"{'页码':>8} {'页码分页(ms)':>14} {'游标分页(ms)':>14}")
+    for page_num in (1, last_page // 2, last_page):
+        offset_time = timed(RootWordListRequest(page_num=page_num, page_size=PAGE_SIZE))
+        cursor_time = timed(RootWordListRequest(page_size=PAGE_SIZE, cursor=cursor_for_page(page_num)))
+        print(f"{page_num:>8} {offset_time * 1000:>14.2f} {cursor_time * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""词根列表单页查询 + 序列化耗时：ORM 对象逐字段复制为 Pydantic 模型 vs 列投影元组 + orjson
+
+用法：python benchmarks/bench_list_serialization.py [每页条数]
+
+“之前”按原实现加载完整 RootWord 对象、构造 RootWordResponse，再由 FastAPI 的 jsonable_encoder + json 序列化；
+“之后”直接调用 list_root_word（列投影 + orjson），另测只请求表格字段的 fields 投影。
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from app.database import Base, SessionLocal, engine
+from app.api.root_word import LIST_FIELDS, list_root_word
+from app.models.root_word import RootWord, RootWordStatus
+from app.schemas.root_word import RootWordListRequest, RootWordResponse
+
+ROWS = 10000
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    db.bulk_insert_mappings(RootWord, [
+        {
+            "word_name": f"word_{i}", "mysql_type": "varchar(64)", "doris_type": "varchar(64)",
+            "clickhouse_type": "String", "remark": f"词根注释 {i}", "status": RootWordStatus.EFFECTIVE,
+            "apply_user": "bench", "audit_user": "admin", "delete_flag": 0,
+        }
+        for i in range(ROWS)
+    ])
+    db.commit()
+    db.close()
+
+
+# 原实现：完整 ORM 对象 -> RootWordResponse -> jsonable_encoder -> json
+def legacy_page(db, page_size: int) -> bytes:
+    root_words = db.query(RootWord).filter(RootWord.delete_flag == 0).offset(0).limit(page_size).all()
+    return legacy_serialize(root_words, page_size)
+
+
+def legacy_serialize(root_words: list, page_size: int) -> bytes:
+    items = [
+        RootWordResponse(
+            id=root_word.id,
+            word_name=root_word.word_name,
+            mysql_type=root_word.mysql_type,
+            doris_type=root_word.doris_type,
+            clickhouse_type=root_word.clickhouse_type,
+            remark=root_word.remark,
+            status=root_word.status,
+            apply_user=root_word.apply_user,
+            apply_time=root_word.apply_time,
+            audit_user=root_word.audit_user,
+            audit_time=root_word.audit_time,
+            audit_remark=root_word.audit_remark,
+            delete_flag=root_word.delete_flag,
+            create_time=root_word.create_time,
+            update_time=root_word.update_time
+        )
+        for root_word in root_words
+    ]
+    content = {"code": 200, "msg": "查询成功", "data": {"list": items, "page_num": 1, "page_size": page_size}}
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False).encode()
+
+
+# 新实现的序列化部分：行元组 -> 字典 -> orjson
+def current_serialize(rows: list, fields: list, page_size: int) -> bytes:
+    content = {"code": 200, "msg": "查询成功", "data": {
+        "list": [dict(zip(fields, row)) for row in rows], "page_num": 1, "page_size": page_size
+    }}
+    return orjson.dumps(content)
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def timed(func, repeat: int = 20) -> float:
+    db = SessionLocal()
+    best = float("inf")
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        func(db)
+        best = min(best, time.perf_counter() - start)
+    db.close()
+    return best
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seed()
+    fields = ["word_name", "mysql_type", "doris_type", "clickhouse_type", "remark", "status", "apply_user", "apply_time"]
+    legacy = timed(lambda db: legacy_page(db, page_size))
+    current = timed(lambda db: list_root_word(RootWordListRequest(page_size=page_size, with_total=False), {}, db).body)
+    projected = timed(lambda db: list_root_word(
+        RootWordListRequest(page_size=page_size, with_total=False, fields=fields), {}, db
+    ).body)
+    print(f"每页 {page_size} 条，查询 + 序列化")
+    print(f"  ORM + Pydantic + json   {legacy * 1000:8.2f}ms")
+    print(f"  列投影 + orjson         {current * 1000:8.2f}ms  ({legacy / current:.1f}x)")
+    print(f"  fields 投影 + orjson    {projected * 1000:8.2f}ms  ({legacy / projected:.1f}x)")
+
+    # 仅序列化：预先取出数据，只统计组装响应和编码 JSON 的耗时
+    db = SessionLocal()
+    root_words = db.query(RootWord).limit(page_size).all()
+    rows = db.query(*(getattr(RootWord, field) for field in LIST_FIELDS)).limit(page_size).all()
+    legacy = min(measure(lambda: legacy_serialize(root_words, page_size)) for _ in range(20))
+    current = min(measure(lambda: current_serialize(rows, list(LIST_FIELDS), page_size)) for _ in range(20))
+    db.close()
+    print("仅序列化")
+    print(f"  Pydantic + json         {legacy * 1000:8.2f}ms")
+    print(f"  orjson                  {current * 1000:8.2f}ms  ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""登录风暴下其他接口的延迟：在接口线程池中校验密码（原实现）vs 在有界密码哈希线程池中校验
+
+用法：python benchmarks/bench_login_storm.py [并发登录数] [探测请求数]
+
+应用在进程内通过 httpx ASGITransport 调用，数据库使用临时 SQLite。发起一批并发登录的同时，
+串行调用 /ddl/check 统计其延迟；无登录时的延迟作为基线。
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+import httpx
+from anyio import to_thread
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+from main import app
+from app.database import Base, SessionLocal, THREADPOOL_SIZE, engine, get_db
+from app.models.user import User
+from app.security import create_access_token, get_password_hash, verify_password
+
+
+# 原实现：同步接口，在接口线程池中查询用户并校验密码
+def legacy_login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    user = db.query(User).filter(User.username == form_data.username).first()
+    if not user or not verify_password(form_data.password, user.password_hash):
+        raise HTTPException(status_code=401)
+    return {"access_token": create_access_token({"sub": user.username, "role": user.role})}
+
+
+app.add_api_route("/bench/legacy-login", legacy_login, methods=["POST"])
+
+DDL = {"ddl_content": "CREATE TABLE t (user_id bigint, user_name varchar(64)) ENGINE=InnoDB"}
+
+
+async def probe(client: httpx.AsyncClient, headers: dict, count: int) -> list:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.post("/api/root-word/ddl/check", headers=headers, json=DDL)
+        assert response.status_code == 200
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+async def storm(login_path: str, logins: int, probes: int) -> tuple:
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench', 'role': 'user'})}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await probe(client, headers, 5)
+        if not login_path:
+            return await probe(client, headers, probes), 0.0
+        start = time.perf_counter()
+        tasks = [
+            asyncio.create_task(client.post(login_path, data={"username": "bench", "password": "bench123"}))
+            for _ in range(logins)
+        ]
+        await asyncio.sleep(0.05)
+        latencies = await probe(client, headers, probes)
+        responses = await asyncio.gather(*tasks)
+        assert all(response.status_code == 200 for response in responses)
+        return latencies, time.perf_counter() - start
+
+
+def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    probes = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.add(User(username="bench", password_hash=get_password_hash("bench123"), role="user"))
+        db.commit()
+
+    print(f"并发登录 {logins}，探测请求 {probes}，接口线程池 {THREADPOOL_SIZE}")
+    for label, path in (("无登录", ""), ("原实现", "/bench/legacy-login"), ("哈希线程池", "/api/auth/login")):
+        latencies, elapsed = asyncio.run(storm(path, logins, probes))
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        suffix = f"  登录全部完成 {elapsed:.2f}s" if path else ""
+        print(f"{label:<6} /ddl/check p50 {p50:7.1f}ms  p99 {p99:7.1f}ms{suffix}")
+
+
+if __name__ == "__main__":
+    main()
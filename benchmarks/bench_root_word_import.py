@@ -0,0 +1,79 @@
+"""批量导入词根耗时：逐条按 /apply 流程写入 vs 集合式导入
+
+用法：python benchmarks/bench_root_word_import.py [词根数]
+
+“逐条”对每个词根执行 存在性查询 -> 插入 -> 提交 -> 写日志 -> 提交（即 /apply 的写法），
+“集合式”调用 import_root_words：一次 IN 查询、批量插入、批量写日志、单个事务。数据库使用临时 SQLite。
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import Base, SessionLocal, engine
+from app.models.operation_log import OperationType, RootWordOperationLog
+from app.models.root_word import RootWord, RootWordStatus
+from app.services.root_word_import import import_root_words
+
+
+def build_rows(prefix: str, count: int) -> list:
+    return [
+        {
+            "word_name": f"{prefix}_{i}", "mysql_type": "bigint", "doris_type": "bigint",
+            "clickhouse_type": "Int64", "remark": f"词根 {i}"
+        }
+        for i in range(count)
+    ]
+
+
+# 逐条写入：与 /apply 相同的查询和提交次数
+def apply_one_by_one(db, rows: list):
+    for row in rows:
+        if db.query(RootWord).filter(RootWord.word_name == row["word_name"]).first():
+            continue
+        root_word = RootWord(
+            **row, status=RootWordStatus.PENDING_AUDIT, apply_user="bench", apply_time=datetime.utcnow()
+        )
+        db.add(root_word)
+        db.commit()
+        db.refresh(root_word)
+        db.add(RootWordOperationLog(
+            word_id=root_word.id, operation_type=OperationType.CREATE,
+            operation_user="bench", operation_content=f"创建词根：{row['word_name']}"
+        ))
+        db.commit()
+
+
+def bulk_import(db, rows: list):
+    import_root_words(db, rows, "bench")
+    db.commit()
+
+
+def timed(func, rows: list) -> float:
+    db = SessionLocal()
+    start = time.perf_counter()
+    func(db, rows)
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    Base.metadata.create_all(bind=engine)
+    one_by_one = timed(apply_one_by_one, build_rows("single", count))
+    bulk = timed(bulk_import, build_rows("bulk", count))
+    # 再次导入同一批词根：全部命中已存在，只有一次集合查询
+    again = timed(bulk_import, build_rows("bulk", count))
+    print(f"词根数 {count}")
+    print(f"逐条写入     {one_by_one:8.2f}s")
+    print(f"集合式导入   {bulk:8.2f}s  ({one_by_one / bulk:.1f}x)")
+    print(f"重复导入     {again:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
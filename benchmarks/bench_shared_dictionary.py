@@ -0,0 +1,100 @@
+"""词典快照：每个 worker 进程内加载 vs 映射共享词典文件
+
+用法：python benchmarks/bench_shared_dictionary.py [词根数] [worker 数]
+
+数据库使用临时 SQLite。分别统计 worker 启动加载词典的耗时、每个 worker 在 Python 堆上的词典内存
+（tracemalloc，映射文件的页在各进程间共享，只计一份）以及校验同一批字段的耗时。
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import Base, SessionLocal, engine
+from app.models.root_word import RootWord, RootWordStatus
+from app.services import root_word_dictionary
+from app.services.ddl_check import check_fields
+from bench_fuzzy_index import build_words
+
+
+def seed(words: list):
+    db = SessionLocal()
+    db.bulk_insert_mappings(RootWord, [
+        {
+            "word_name": word, "mysql_type": "bigint", "doris_type": "bigint", "clickhouse_type": "Int64",
+            "status": RootWordStatus.EFFECTIVE, "apply_user": "bench", "delete_flag": 0, "remark": f"{word} 注释",
+        }
+        for word in words
+    ])
+    db.commit()
+    db.close()
+
+
+# 模拟一个 worker 启动：清空快照后加载，返回 (快照, 耗时)
+def start_worker():
+    root_word_dictionary._snapshot = None
+    start = time.perf_counter()
+    dictionary = root_word_dictionary.get_root_word_dictionary()
+    return dictionary, time.perf_counter() - start
+
+
+# 词典快照占用的 Python 堆内存
+def worker_memory() -> int:
+    root_word_dictionary._snapshot = None
+    tracemalloc.start()
+    dictionary = root_word_dictionary.get_root_word_dictionary()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del dictionary
+    return memory
+
+
+def check_time(dictionary, fields: list) -> float:
+    start = time.perf_counter()
+    for _ in range(10):
+        check_fields(fields, "mysql", dictionary)
+    return (time.perf_counter() - start) / 10
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    random.seed(1)
+    Base.metadata.create_all(bind=engine)
+    words = build_words(count)
+    seed(words)
+    # 一半为完整词根，一半由两个词根拼接（需要切分）
+    fields = [(random.choice(words), "bigint", "") for _ in range(250)]
+    fields += [(f"{random.choice(words)}_{random.choice(words)}", "bigint", "") for _ in range(250)]
+    # 预热进程内缓存（类型规范化等），避免计入第一次加载
+    root_word_dictionary.get_root_word_dictionary()
+
+    root_word_dictionary.DICTIONARY_SNAPSHOT_DIR = ""
+    local, local_start = start_worker()
+    local_memory = worker_memory()
+    local_check = check_time(local, fields)
+
+    snapshot_dir = tempfile.mkdtemp()
+    root_word_dictionary.DICTIONARY_SNAPSHOT_DIR = snapshot_dir
+    _, build_start = start_worker()
+    shared, shared_start = start_worker()
+    shared_memory = worker_memory()
+    shared_check = check_time(shared, fields)
+    file_size = sum(os.path.getsize(os.path.join(snapshot_dir, name)) for name in os.listdir(snapshot_dir))
+
+    mb = 1024 * 1024
+    print(f"词根数 {count}，worker 数 {workers}，校验字段 {len(fields)} 个")
+    print(f"进程内加载  启动 {local_start * 1000:7.1f}ms  每 worker 内存 {local_memory / mb:6.1f}MB"
+          f"  合计 {local_memory * workers / mb:6.1f}MB  校验 {local_check * 1000:6.2f}ms")
+    print(f"共享文件    启动 {shared_start * 1000:7.1f}ms  每 worker 内存 {shared_memory / mb:6.1f}MB"
+          f"  合计 {(shared_memory * workers + file_size) / mb:6.1f}MB  校验 {shared_check * 1000:6.2f}ms")
+    print(f"            首个 worker 生成文件 {build_start * 1000:.1f}ms，文件 {file_size / mb:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
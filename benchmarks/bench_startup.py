@@ -0,0 +1,60 @@
+"""worker 启动与首个请求耗时：启动时预热 vs 首次请求时加载
+
+用法：python benchmarks/bench_startup.py [词根数]
+
+数据库使用临时 SQLite。分别在预热全部阶段 / 不预热时启动应用（执行 lifespan），统计启动耗时和
+首个 /ddl/check 请求（含缺失词根的相似词建议）的耗时。
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+start = time.perf_counter()
+from main import app
+import_time = time.perf_counter() - start
+
+from fastapi.testclient import TestClient
+from app.database import Base, engine
+from app.security import create_access_token
+from app.services import root_word_dictionary, root_word_search, startup
+from bench_shared_dictionary import seed
+from bench_fuzzy_index import build_words
+
+
+def run(warmup: bool, ddl: str) -> tuple:
+    startup.STARTUP_WARMUP_PHASES = list(startup.WARMUP_PHASES) if warmup else []
+    root_word_dictionary._snapshot = None
+    root_word_search._index = None
+    token = create_access_token({"sub": "bench", "role": "admin"})
+    start = time.perf_counter()
+    with TestClient(app) as client:
+        boot = time.perf_counter() - start
+        start = time.perf_counter()
+        client.post("/api/root-word/ddl/check", headers={"Authorization": f"Bearer {token}"}, json={"ddl_content": ddl})
+        first = time.perf_counter() - start
+    return boot, first
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    random.seed(1)
+    Base.metadata.create_all(bind=engine)
+    words = build_words(count)
+    seed(words)
+    columns = ", ".join(f"{word}x bigint" for word in random.sample(words, 20))
+    ddl = f"CREATE TABLE t ({columns}) ENGINE=InnoDB"
+
+    print(f"词根数 {count}，导入 main {import_time * 1000:.0f}ms（不再建表）")
+    for warmup in (False, True):
+        boot, first = run(warmup, ddl)
+        label = "启动预热" if warmup else "首次加载"
+        print(f"{label}  启动 {boot * 1000:7.1f}ms  首个请求 {first * 1000:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""词根子串检索延迟：100 万词根的三元组倒排索引 vs 逐条扫描（相当于 LIKE '%x%' 全表扫描）
+
+用法：python benchmarks/bench_substring_index.py [词根数]
+
+查询词取自随机词根的随机子串；命中数超过 SEARCH_IN_LIMIT 时索引提前放弃，由接口退回 LIKE + LIMIT。
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.root_word_search import SEARCH_IN_LIMIT
+from app.utils.substring_index import SubstringIndex
+from bench_fuzzy_index import build_words
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    random.seed(1)
+    words = build_words(count)
+
+    start = time.perf_counter()
+    index = SubstringIndex(3, enumerate(words))
+    print(f"词根数 {count}，构建索引 {time.perf_counter() - start:.2f}s")
+
+    latencies = []
+    fallbacks = 0
+    for _ in range(300):
+        word = random.choice(words)
+        length = random.randint(6, 12)
+        begin = random.randrange(max(1, len(word) - length))
+        query = word[begin:begin + length]
+        start = time.perf_counter()
+        if index.search(query, SEARCH_IN_LIMIT) is None:
+            fallbacks += 1
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"查询 {len(latencies)} 次，命中过多退回 LIKE 的比例 {fallbacks / len(latencies):.1%}")
+    print(f"索引延迟 p50 {latencies[len(latencies) // 2] * 1000:.2f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms  max {latencies[-1] * 1000:.2f}ms")
+
+    start = time.perf_counter()
+    for _ in range(5):
+        [word for word in words if query in word]
+    print(f"逐条扫描 {(time.perf_counter() - start) / 5 * 1000:.2f}ms/次")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""词根写操作吞吐：先提交变更再提交日志（两次提交）vs 变更与日志单事务提交
+
+用法：python benchmarks/bench_unit_of_work.py [操作次数] [轮数]
+
+对同一个词根交替执行废弃 / 恢复，只统计事务部分（不含词典快照刷新）。数据库使用临时 SQLite 文件，
+默认 synchronous=FULL，每次提交都会落盘，近似 MySQL innodb_flush_log_at_trx_commit=1 的行为。
+落盘耗时波动较大，两种写法每轮交换先后顺序，取各轮耗时的中位数比较。
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+from app.database import Base, SessionLocal, engine
+from app.models.operation_log import OperationType, RootWordOperationLog
+from app.models.root_word import RootWord, RootWordStatus
+from app.services.unit_of_work import add_operation_log, unit_of_work
+
+
+def toggle(root_word: RootWord):
+    if root_word.status == RootWordStatus.EFFECTIVE:
+        root_word.status = RootWordStatus.DISCARDED
+        return OperationType.DISCARD
+    root_word.status = RootWordStatus.EFFECTIVE
+    return OperationType.RECOVER
+
+
+# 原写法：变更提交一次，日志再提交一次
+def two_commits(db, root_word: RootWord):
+    operation_type = toggle(root_word)
+    db.commit()
+    db.add(RootWordOperationLog(
+        word_id=root_word.id, operation_type=operation_type,
+        operation_user="bench", operation_content=f"切换词根：{root_word.word_name}"
+    ))
+    db.commit()
+
+
+def single_commit(db, root_word: RootWord):
+    with unit_of_work(db):
+        operation_type = toggle(root_word)
+        add_operation_log(db, root_word.id, operation_type, "bench", f"切换词根：{root_word.word_name}")
+
+
+def run(func, word_name: str, count: int) -> float:
+    db = SessionLocal()
+    root_word = RootWord(
+        word_name=word_name, mysql_type="int", doris_type="int", clickhouse_type="Int32",
+        status=RootWordStatus.EFFECTIVE, apply_user="bench"
+    )
+    db.add(root_word)
+    db.commit()
+    start = time.perf_counter()
+    for _ in range(count):
+        func(db, root_word)
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    Base.metadata.create_all(bind=engine)
+    timings = {"two_commits": [], "single_commit": []}
+    variants = [("two_commits", two_commits), ("single_commit", single_commit)]
+    for i in range(rounds):
+        for name, func in variants if i % 2 == 0 else reversed(variants):
+            timings[name].append(run(func, f"{name}_{i}", count))
+    before = statistics.median(timings["two_commits"])
+    after = statistics.median(timings["single_commit"])
+    ratios = [b / a for b, a in zip(timings["two_commits"], timings["single_commit"])]
+    print(f"操作次数 {count}，{rounds} 轮取中位数")
+    print(f"两次提交   {before:6.2f}s  {count / before:8.0f} 次/秒")
+    print(f"单事务     {after:6.2f}s  {count / after:8.0f} 次/秒  ({before / after:.2f}x，各轮 {min(ratios):.2f}x ~ {max(ratios):.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 import pymysql
 from sqlalchemy import create_engine
 from app.database import Base, engine
-from app.models import root_word, operation_log, user
+from app.models import root_word, operation_log, user, dictionary_version
 from app.security import get_password_hash
+from app.services.migration import migrate
 
 # 创建数据库
 def create_database():
@@ -26,6 +27,8 @@ def create_database():
 def init_tables():
     # 创建所有表
     Base.metadata.create_all(bind=engine)
+    # 补齐已有表缺少的索引并记录迁移版本
+    migrate(engine)
     print("表结构初始化成功")
 
 # 初始化管理员用户
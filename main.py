@@ -1,16 +1,35 @@
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
+from app.database import engine, THREADPOOL_SIZE
 from app.api import auth, root_word, user
+from app.services.parse_executor import shutdown_parse_executor
+from app.services.operation_log_writer import shutdown_operation_log_writer
+from app.services.password_hash import shutdown_password_hash_executor
+from app.services.startup import run_startup
 
-# 创建数据库表
-Base.metadata.create_all(bind=engine)
+# 应用生命周期
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 同步接口在线程池中执行，设置线程池大小
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # 建表（非生产环境）并预热连接池、词典快照和检索索引，各阶段耗时写入日志
+    app.state.startup_timings = await to_thread.run_sync(run_startup, engine)
+    yield
+    # 关闭 DDL 解析进程池
+    shutdown_parse_executor()
+    # 写完队列中剩余的操作日志
+    shutdown_operation_log_writer()
+    # 关闭密码哈希线程池
+    shutdown_password_hash_executor()
 
 # 创建 FastAPI 应用
 app = FastAPI(
     title="词根管理工具 API",
     description="数据开发团队词根标准化管理工具",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 配置 CORS
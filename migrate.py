@@ -0,0 +1,17 @@
+import sys
+from app.database import engine
+from app.services.migration import applied_versions, load_migrations, migrate
+
+# 执行数据库迁移：python migrate.py [目标版本号]，python migrate.py status 查看迁移状态
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "status":
+        done = set(applied_versions(engine))
+        for migration in load_migrations():
+            mark = "已执行" if migration.version in done else "未执行"
+            print(f"v{migration.version:04d} [{mark}] {migration.description}")
+    else:
+        target = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        applied = migrate(engine, target)
+        for migration in applied:
+            print(f"执行迁移 v{migration.version:04d}: {migration.description}")
+        print(f"数据库迁移完成，本次执行 {len(applied)} 个迁移")
@@ -20,11 +20,12 @@ export const deletePendingRootWord = async (wordId) => {
   }
 }
 
-// DDL 词根校验
-export const checkDDLRootWord = async (ddlContent) => {
+// DDL 词根校验（debug 为 true 时返回解析过程调试信息）
+export const checkDDLRootWord = async (ddlContent, debug = false) => {
   try {
     const response = await axios.post('/api/root-word/ddl/check', {
-      ddl_content: ddlContent
+      ddl_content: ddlContent,
+      debug
     })
     return response.data
   } catch (error) {
@@ -103,3 +104,46 @@ export const updateRootWord = async (updateData) => {
     throw error.response.data
   }
 }
+
+// 批量导入词根（管理员），支持 CSV / JSON 文件
+export const importRootWords = async (file, overwrite = false) => {
+  try {
+    const formData = new FormData()
+    formData.append('file', file)
+    formData.append('overwrite', overwrite)
+    const response = await axios.post('/api/root-word/import', formData)
+    return response.data
+  } catch (error) {
+    throw error.response.data
+  }
+}
+
+// 批量审核词根（管理员）
+export const batchAuditRootWords = async (auditData) => {
+  try {
+    const response = await axios.post('/api/root-word/batch-audit', auditData)
+    return response.data
+  } catch (error) {
+    throw error.response.data
+  }
+}
+
+// 批量废弃已生效词根（管理员）
+export const batchDiscardRootWords = async (wordIds) => {
+  try {
+    const response = await axios.post('/api/root-word/batch-discard', { word_ids: wordIds })
+    return response.data
+  } catch (error) {
+    throw error.response.data
+  }
+}
+
+// 批量恢复废弃词根（管理员）
+export const batchRecoverRootWords = async (wordIds) => {
+  try {
+    const response = await axios.post('/api/root-word/batch-recover', { word_ids: wordIds })
+    return response.data
+  } catch (error) {
+    throw error.response.data
+  }
+}
@@ -1,5 +1,11 @@
+import os
+import tempfile
 import pytest
 from fastapi.testclient import TestClient
+
+# 测试使用本地 SQLite 代替 MySQL，需在导入应用之前设置
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "root_word_manager_test.db"))
+
 from app.database import Base, engine, get_db
 from app.models.user import User
 from app.security import get_password_hash
@@ -8,6 +14,7 @@ from main import app
 # 创建测试数据库表
 @pytest.fixture(scope="session")
 def test_db():
+    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
@@ -21,20 +28,22 @@ def client(test_db):
     db = SessionLocal()
     
     # 创建管理员用户
-    admin_user = User(
-        username="admin",
-        password_hash=get_password_hash("admin123"),
-        role="admin"
-    )
-    db.add(admin_user)
+    if not db.query(User).filter(User.username == "admin").first():
+        admin_user = User(
+            username="admin",
+            password_hash=get_password_hash("admin123"),
+            role="admin"
+        )
+        db.add(admin_user)
     
     # 创建普通用户
-    normal_user = User(
-        username="user",
-        password_hash=get_password_hash("user123"),
-        role="user"
-    )
-    db.add(normal_user)
+    if not db.query(User).filter(User.username == "user").first():
+        normal_user = User(
+            username="user",
+            password_hash=get_password_hash("user123"),
+            role="user"
+        )
+        db.add(normal_user)
     
     db.commit()
     db.close()
@@ -58,3 +67,12 @@ def user_token(client):
         "password": "user123"
     })
     return response.json()["access_token"]
+
+# 替换为独立的操作日志写入器，执行应用关闭流程时只停止该写入器，不影响后续测试
+@pytest.fixture
+def operation_log_writer(monkeypatch):
+    from app.services import operation_log_writer as module
+    writer = module.OperationLogWriter()
+    monkeypatch.setattr(module, "operation_log_writer", writer)
+    yield writer
+    writer.shutdown()
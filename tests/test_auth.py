@@ -22,3 +22,85 @@ def test_login_missing_params(client):
         "username": "admin"
     })
     assert response.status_code == 422
+
+def test_decoded_token_cache(admin_token, monkeypatch):
+    """测试同一令牌只验签一次，过期令牌不缓存"""
+    from datetime import timedelta
+    from app import security
+    from app.utils.ttl_cache import TTLCache
+    
+    calls = []
+    decode = security.jwt.decode
+    
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+    
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    monkeypatch.setattr(security, "_token_cache", TTLCache(16))
+    assert security.decode_access_token(admin_token)["sub"] == "admin"
+    assert security.decode_access_token(admin_token)["sub"] == "admin"
+    assert len(calls) == 1
+    
+    expired = security.create_access_token({"sub": "admin", "role": "admin"}, timedelta(seconds=-1))
+    assert security.decode_access_token(expired) is None
+    assert security.decode_access_token(expired) is None
+    assert len(calls) == 3
+
+def test_user_lookup_cache(client, admin_token, monkeypatch):
+    """测试开启用户查询后角色以数据库为准、查询结果被缓存、删除用户后令牌失效"""
+    from sqlalchemy import event
+    from app import security
+    from app.database import engine
+    from app.utils.ttl_cache import TTLCache
+    
+    monkeypatch.setattr(security, "USER_LOOKUP", True)
+    monkeypatch.setattr(security, "_user_cache", TTLCache(16))
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.post("/api/user/create", headers=headers, json={"username": "lookup_user", "password": "lookup123"})
+    user_id = response.json()["data"]["id"]
+    
+    # 令牌中的角色被篡改无效（这里直接签发一个声明为 admin 的普通用户令牌）
+    token = security.create_access_token({"sub": "lookup_user", "role": "admin"})
+    lookup_headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/user/list", headers=lookup_headers).status_code == 403
+    
+    statements = []
+    
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        assert client.get("/api/user/list", headers=lookup_headers).status_code == 403
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert statements == []
+    
+    client.delete(f"/api/user/delete/{user_id}", headers=headers)
+    assert client.get("/api/user/list", headers=lookup_headers).status_code == 401
+
+def test_login_rehashes_outdated_password(client):
+    """测试密码哈希迭代次数调整后，登录成功时按新参数重新保存哈希"""
+    from passlib.context import CryptContext
+    from app.database import SessionLocal
+    from app.models.user import User
+    from app.security import PASSWORD_HASH_ROUNDS
+    
+    old_hash = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__default_rounds=1000).hash("rehash123")
+    with SessionLocal() as db:
+        db.add(User(username="rehash_user", password_hash=old_hash, role="user"))
+        db.commit()
+    
+    response = client.post("/api/auth/login", data={"username": "rehash_user", "password": "wrong_password"})
+    assert response.status_code == 401
+    with SessionLocal() as db:
+        assert db.query(User).filter(User.username == "rehash_user").one().password_hash == old_hash
+    
+    response = client.post("/api/auth/login", data={"username": "rehash_user", "password": "rehash123"})
+    assert response.status_code == 200
+    assert response.json()["user"]["username"] == "rehash_user"
+    with SessionLocal() as db:
+        new_hash = db.query(User).filter(User.username == "rehash_user").one().password_hash
+    assert new_hash.startswith(f"$pbkdf2-sha256${PASSWORD_HASH_ROUNDS}$")
+    assert client.post("/api/auth/login", data={"username": "rehash_user", "password": "rehash123"}).status_code == 200
@@ -0,0 +1,16 @@
+from app.services.check_cache import DDLCheckCache
+
+def test_check_cache_version_only_moves_forward():
+    """测试携带旧词典版本的请求不回退缓存版本、不清空新版本的结果，也不写入旧结果"""
+    cache = DDLCheckCache(16)
+    cache.put("ddl_a", 2, "v2")
+    
+    assert cache.get("ddl_a", 1) is None
+    cache.put("ddl_b", 1, "v1")
+    assert cache.get("ddl_a", 2) == "v2"
+    assert cache.get("ddl_b", 2) is None
+    assert cache.stats()["dictionary_version"] == 2
+    
+    # 版本前进后旧结果全部失效
+    assert cache.get("ddl_a", 3) is None
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,152 @@
+from app.utils.ddl_parser import extract_fields, identify_database_engine, iter_create_tables
+
+def test_extract_fields_basic():
+    """测试提取字段名、类型和注释"""
+    ddl = """
+    CREATE TABLE IF NOT EXISTS `db`.`t_book` (
+      `book_id` bigint(20) NOT NULL COMMENT '图书ID',
+      book_name varchar(64) DEFAULT NULL COMMENT "书刊名称",
+      price decimal(10, 2),
+      PRIMARY KEY (`book_id`),
+      KEY idx_name (book_name)
+    ) ENGINE=InnoDB COMMENT='图书表'
+    """
+    assert extract_fields(ddl) == [
+        ("book_id", "bigint(20)", "图书ID"),
+        ("book_name", "varchar(64)", "书刊名称"),
+        ("price", "decimal(10, 2)", ""),
+    ]
+
+def test_extract_fields_quotes_and_comments():
+    """测试字符串、注释中的括号、逗号和转义引号不影响字段切分"""
+    ddl = """
+    CREATE TABLE t (
+      -- 行注释, 含逗号 (括号
+      a_id bigint COMMENT 'it''s (a), b',
+      /* 块注释, ) */
+      b_name varchar(32) DEFAULT 'x,y' COMMENT 'say \\'hi\\', ok',
+      `key_id` int COMMENT '以关键字开头的字段名'
+    )
+    """
+    assert extract_fields(ddl) == [
+        ("a_id", "bigint", "it's (a), b"),
+        ("b_name", "varchar(32)", "say 'hi', ok"),
+        ("key_id", "int", "以关键字开头的字段名"),
+    ]
+
+def test_extract_fields_nested_types():
+    """测试 ClickHouse 嵌套类型"""
+    ddl = """
+    CREATE TABLE t (
+      user_id Nullable(UInt64) COMMENT '用户ID',
+      tags Array(LowCardinality(String)),
+      attrs Map(String, Nullable(Decimal(18, 2)))
+    ) ENGINE = ReplacingMergeTree(update_time) ORDER BY (user_id)
+    """
+    assert extract_fields(ddl) == [
+        ("user_id", "Nullable(UInt64)", "用户ID"),
+        ("tags", "Array(LowCardinality(String))", ""),
+        ("attrs", "Map(String, Nullable(Decimal(18, 2)))", ""),
+    ]
+    assert identify_database_engine(ddl) == "clickhouse"
+
+def test_extract_fields_no_create_table():
+    """测试非建表语句不返回字段"""
+    assert extract_fields("SELECT a, b FROM t") == []
+    assert extract_fields("CREATE TABLE t2 LIKE t1; SELECT (a, b)") == []
+
+def test_iter_create_tables_dump():
+    """测试按语句切分 mysqldump 导出并逐表识别引擎"""
+    dump = """
+    /*!40101 SET NAMES utf8mb4 */;
+    DROP TABLE IF EXISTS `t_a`;
+    CREATE TABLE `t_a` (
+      `a_id` bigint COMMENT '分号; 不切分'
+    ) ENGINE=InnoDB;
+    INSERT INTO log VALUES ('CREATE TABLE fake (x int);');
+    CREATE TABLE IF NOT EXISTS ods.t_b (
+      b_id bigint
+    ) ENGINE=OLAP DUPLICATE KEY(b_id) DISTRIBUTED BY HASH(b_id) BUCKETS 8;
+    """
+    tables = list(iter_create_tables(dump))
+    assert [(t.table_name, t.database_engine) for t in tables] == [("t_a", "mysql"), ("ods.t_b", "doris")]
+    assert tables[0].fields == [("a_id", "bigint", "分号; 不切分")]
+    assert tables[1].fields == [("b_id", "bigint", "")]
+
+def test_parse_executor_matches_inline(monkeypatch):
+    """测试进程池解析结果与当前线程解析一致"""
+    from app.services import parse_executor
+    
+    dump = "".join(
+        f"CREATE TABLE t_{i} (\n  a_{i}_id bigint COMMENT '注释; 含分号',\n  b_{i} varchar(32)\n) ENGINE=InnoDB;\n"
+        f"INSERT INTO x VALUES ('a;b');\n"
+        for i in range(200)
+    )
+    inline_tables = list(iter_create_tables(dump))
+    inline_ddl = parse_executor.parse_ddl(dump)
+    
+    monkeypatch.setattr(parse_executor, "PARSE_PROCESS_THRESHOLD", 1024)
+    monkeypatch.setattr(parse_executor, "PARSE_WORKERS", 2)
+    try:
+        assert list(parse_executor.iter_tables(dump)) == inline_tables
+        assert parse_executor.parse_ddl(dump) == inline_ddl
+    finally:
+        parse_executor.shutdown_parse_executor()
+    assert len(inline_tables) == 200
+
+def test_iter_tables_bounded_window(monkeypatch):
+    """测试大脚本按固定大小分块提交解析，在途块数不超过解析进程数的两倍"""
+    from concurrent.futures import ThreadPoolExecutor
+    from app.services import parse_executor
+    
+    pool = ThreadPoolExecutor(max_workers=1)
+    submitted = []
+    
+    class CountingExecutor:
+        def submit(self, fn, *args):
+            submitted.append(args[0])
+            return pool.submit(fn, *args)
+    
+    monkeypatch.setattr(parse_executor, "PARSE_PROCESS_THRESHOLD", 256)
+    monkeypatch.setattr(parse_executor, "PARSE_WORKERS", 1)
+    monkeypatch.setattr(parse_executor, "_get_executor", CountingExecutor)
+    chunk_sizes = []
+    for count in (200, 800):
+        submitted.clear()
+        dump = "".join(f"CREATE TABLE t_{i} (a_{i} bigint) ENGINE=InnoDB;\n" for i in range(count))
+        tables = parse_executor.iter_tables(dump)
+        assert next(tables).table_name == "t_0"
+        assert len(submitted) <= 2
+        assert [table.table_name for table in tables][-1] == f"t_{count - 1}"
+        chunk_sizes.append(max(len(chunk) for chunk in submitted))
+    # 块大小与脚本大小无关
+    assert chunk_sizes[0] == chunk_sizes[1] < 256
+    pool.shutdown()
+
+def test_extract_columns_spans_and_replace():
+    """测试类型偏移及按偏移替换只改写字段类型"""
+    from app.utils.ddl_parser import extract_columns, replace_spans, unwrap_type_span
+    
+    ddl = "CREATE TABLE t (\n  `user_id` Nullable(Int32) COMMENT 'user_id Nullable(Int32)',\n  user_id_bak Nullable(Int32)\n)"
+    columns = extract_columns(ddl)
+    assert [(c.field_name, ddl[c.type_start:c.type_end]) for c in columns] == [
+        ("user_id", "Nullable(Int32)"),
+        ("user_id_bak", "Nullable(Int32)"),
+    ]
+    # 只替换包装内的类型，保留可空性
+    start, end = unwrap_type_span(ddl, columns[0].type_start, columns[0].type_end)
+    replaced = replace_spans(ddl, [(start, end, "UInt64")])
+    assert replaced == "CREATE TABLE t (\n  `user_id` Nullable(UInt64) COMMENT 'user_id Nullable(Int32)',\n  user_id_bak Nullable(Int32)\n)"
+
+def test_unwrap_type_span():
+    """测试去掉 ClickHouse 类型外层包装"""
+    from app.utils.ddl_parser import unwrap_type_span
+    
+    for text, inner in [
+        ("LowCardinality( Nullable(String) )", "String"),
+        ("Nullable(Decimal(18, 2))", "Decimal(18, 2)"),
+        ("Array(Nullable(Int32))", "Array(Nullable(Int32))"),
+        ("Int32", "Int32"),
+    ]:
+        start, end = unwrap_type_span(text, 0, len(text))
+        assert text[start:end] == inner
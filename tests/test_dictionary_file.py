@@ -0,0 +1,62 @@
+from app.utils.dictionary_file import DictionaryFile, write_dictionary_file
+
+def test_dictionary_file_lookup(tmp_path):
+    """测试词典文件按键查找、遍历和 None 字段"""
+    path = str(tmp_path / "dictionary.bin")
+    records = [(i, (f"word_{i}", "bigint", None if i % 2 else "注释")) for i in range(1000)]
+    write_dictionary_file(path, 7, records)
+    
+    file = DictionaryFile(path)
+    assert file.version == 7
+    assert len(file) == 1000
+    assert file.max_parts == 2
+    assert file.get("word_3") == (3, ("word_3", "bigint", None))
+    assert file.get("word_4") == (4, ("word_4", "bigint", "注释"))
+    assert file.get("word_1000") is None
+    assert file.get("") is None
+    assert list(file) == records
+
+def test_mapped_dictionary_matches_in_process(tmp_path, monkeypatch):
+    """测试映射词典文件的快照与进程内快照校验结果一致"""
+    from app.services import root_word_dictionary
+    from app.services.ddl_check import check_fields
+    from app.services.root_word_dictionary import MappedRootWordDictionary, RootWordDictionary, RootWordEntry
+    from app.utils.type_normalizer import CANONICAL_REVISION
+    
+    def entry(word_id, name, type_):
+        types = {"mysql": type_, "doris": type_, "clickhouse": type_}
+        return RootWordEntry(word_id, name, types, {k: v.lower() for k, v in types.items()}, f"{name} 注释")
+    
+    entries = {
+        "dws": entry(1, "dws", "varchar(8)"),
+        "readers_amount": entry(2, "readers_amount", "bigint"),
+        "readers_amount_today": entry(3, "readers_amount_today", "int"),
+        "user_id": entry(4, "user_id", "bigint"),
+    }
+    in_process = RootWordDictionary(1, entries)
+    
+    class Session:
+        pass
+    
+    monkeypatch.setattr(root_word_dictionary, "DICTIONARY_SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(root_word_dictionary, "_load_entries", lambda db: entries)
+    mapped = root_word_dictionary._load_mapped_dictionary(Session(), 1)
+    assert isinstance(mapped, MappedRootWordDictionary)
+    assert len(mapped) == 4 and "user_id" in mapped and "user" not in mapped
+    assert mapped.get("user_id") == entries["user_id"]
+    # 解码后的条目按偏移缓存，重复查询不再新建条目
+    assert mapped.get("user_id") is mapped.get("user_id")
+    assert mapped.file.find("user") == 0
+    
+    fields = [
+        ("dws_readers_amount", "BIGINT", ""),
+        ("dws_readers_amount_today", "int", ""),
+        ("readers_amount_total", "bigint", ""),
+        ("user_idd", "bigint", ""),
+    ]
+    assert check_fields(fields, "mysql", mapped) == check_fields(fields, "mysql", in_process)
+    
+    # 新版本生成后删除旧版本文件及按旧规范形式生成的文件
+    (tmp_path / "root_word_dictionary.2.bin").write_bytes(b"")
+    root_word_dictionary._load_mapped_dictionary(Session(), 2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"root_word_dictionary.2.{CANONICAL_REVISION}.bin"]
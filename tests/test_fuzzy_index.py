@@ -0,0 +1,34 @@
+from app.utils.fuzzy_index import TrigramIndex, edit_distance
+
+def test_edit_distance():
+    """测试编辑距离及提前终止"""
+    assert edit_distance("adviser_ld", "adviser_id") == 1
+    assert edit_distance("scaner_amount", "scaners_amount") == 1
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("book_id", "user_name", limit=2) == 3
+
+def test_trigram_index_search():
+    """测试相似词根建议按编辑距离排序"""
+    index = TrigramIndex(["adviser_id", "advisers_id", "scaners_amount", "scan_amount", "book_name"])
+    assert [s.word for s in index.search("adviser_ld")] == ["adviser_id", "advisers_id"]
+    assert [(s.word, s.distance) for s in index.search("scaner_amount")] == [("scaners_amount", 1), ("scan_amount", 2)]
+    assert index.search("zzz") == []
+    # 短词没有共同三元组也能找到
+    assert [(s.word, s.distance) for s in TrigramIndex(["xb", "abc"]).search("ab")] == [("abc", 1), ("xb", 1)]
+
+def test_trigram_index_matches_brute_force():
+    """测试相似词建议与逐词计算编辑距离的结果一致"""
+    import random
+    rng = random.Random(7)
+    parts = ["book", "user", "order", "name", "id", "time", "amount", "scan", "share", "code", "type", "price"]
+    words = sorted({"_".join(rng.choice(parts) for _ in range(rng.randint(2, 4))) for _ in range(2000)})
+    index = TrigramIndex(words)
+    
+    for _ in range(200):
+        word = rng.choice(words)
+        i = rng.randrange(len(word))
+        query = word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz_") + word[i + 1:]
+        max_distance = min(2, max(1, len(query) // 4))
+        distances = ((edit_distance(query, w, max_distance), w) for w in words if w != query)
+        expected = sorted(d for d in distances if d[0] <= max_distance)[:3]
+        assert [(s.distance, s.word) for s in index.search(query)] == expected
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+from app.api.root_word import list_root_word
+from app.database import Base
+from app.models.operation_log import RootWordOperationLog
+from app.schemas.root_word import RootWordListRequest
+from app.services.migration import applied_versions, migrate
+from app.services.root_word_dictionary import _load_entries
+
+INDEXES = {
+    "root_word": ["ix_root_word_flag_status_name", "ix_root_word_apply_user_flag", "ix_root_word_flag_update_time"],
+    "root_word_operation_log": ["ix_operation_log_word_time"],
+}
+
+@pytest.fixture
+def old_engine(tmp_path):
+    """模拟升级前的库：表已存在但没有联合索引"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for names in INDEXES.values():
+            for name in names:
+                conn.execute(text(f"DROP INDEX {name}"))
+    return engine
+
+def test_migrate_creates_indexes(old_engine):
+    """测试迁移补建索引并记录版本，重复执行不再变更"""
+    applied = migrate(old_engine)
+    assert [migration.version for migration in applied] == [1, 2]
+    assert applied_versions(old_engine) == [1, 2]
+    for table, names in INDEXES.items():
+        existing = {index["name"] for index in inspect(old_engine).get_indexes(table)}
+        assert set(names) <= existing
+    assert migrate(old_engine) == []
+
+def test_queries_use_indexes(old_engine):
+    """测试词典加载和列表查询的执行计划使用联合索引"""
+    migrate(old_engine)
+    statements = []
+    
+    @event.listens_for(old_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append((statement, parameters))
+    
+    def plan_of(run):
+        statements.clear()
+        with sessionmaker(bind=old_engine)() as db:
+            run(db)
+        captured = list(statements)
+        with old_engine.connect() as conn:
+            return [
+                " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+                for statement, parameters in captured
+            ]
+    
+    assert "ix_root_word_flag_status_name" in plan_of(_load_entries)[0]
+    
+    plans = plan_of(lambda db: list_root_word(RootWordListRequest(apply_user="user", with_total=False), {}, db))
+    assert "ix_root_word_apply_user_flag" in plans[0]
+    
+    plans = plan_of(lambda db: list_root_word(RootWordListRequest(order_by="update_time", with_total=False), {}, db))
+    assert "ix_root_word_flag_update_time" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+    
+    plans = plan_of(lambda db: db.query(RootWordOperationLog).filter(
+        RootWordOperationLog.word_id == 1
+    ).order_by(RootWordOperationLog.operation_time.desc()).all())
+    assert "ix_operation_log_word_time" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+def test_migrate_seeds_dictionary_version(old_engine):
+    """测试迁移建立词典版本行，词根变更后版本号递增"""
+    from app.services.dictionary_version import read_dictionary_version
+    from app.services.unit_of_work import unit_of_work
+    
+    migrate(old_engine)
+    with sessionmaker(bind=old_engine)() as db:
+        assert read_dictionary_version(db) == 0
+        with unit_of_work(db):
+            pass
+        assert read_dictionary_version(db) == 1
@@ -0,0 +1,47 @@
+from app.services.operation_log_writer import OperationLogWriter
+
+
+class RecordingWriter(OperationLogWriter):
+    """记录每批写入，前 failures 次写入失败，fail_rows 中的记录始终写入失败"""
+    def __init__(self, failures=0, fail_rows=(), **kwargs):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.fail_rows = set(fail_rows)
+        self.batches = []
+        self.attempts = 0
+
+    def _write(self, rows):
+        self.attempts += 1
+        if self.failures > 0 or any(row["id"] in self.fail_rows for row in rows):
+            self.failures -= 1
+            raise RuntimeError("write failed")
+        self.batches.append([row["id"] for row in rows])
+
+def test_shutdown_drains_in_full_batches():
+    """测试停止后按批写完队列中剩余日志"""
+    writer = RecordingWriter(batch_size=100, flush_interval=10)
+    for i in range(1000):
+        writer._queue.put_nowait({"id": i})
+    writer._stopping.set()
+    writer._ensure_started()
+    writer.shutdown(timeout=5)
+    assert not writer._thread.is_alive()
+    assert [len(batch) for batch in writer.batches] == [100] * 10
+
+def test_failed_batch_retried_in_writer():
+    """测试写入失败的批次在写入线程内重试，成功后不重复写入"""
+    writer = RecordingWriter(failures=1, batch_size=10, flush_interval=0.2, queue_size=3)
+    writer.submit([{"id": i} for i in range(3)])
+    writer.flush()
+    writer.shutdown(timeout=5)
+    assert writer.batches == [[0, 1, 2]]
+
+def test_failing_rows_dropped_after_max_attempts():
+    """测试始终写入失败的记录在达到重试次数后丢弃，其余记录照常写入"""
+    writer = RecordingWriter(fail_rows={1}, batch_size=10, flush_interval=0.01, max_attempts=2)
+    writer.submit([{"id": i} for i in range(3)])
+    writer.flush()
+    writer.shutdown(timeout=5)
+    assert not writer._thread.is_alive()
+    assert writer.batches == [[0], [2]]
+    assert writer.attempts == 2 + 3
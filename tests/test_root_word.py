@@ -1,3 +1,5 @@
+import pytest
+
 def test_apply_root_word(user_token, client):
     """测试申请创建词根"""
     response = client.post(
@@ -55,6 +57,127 @@ def test_list_root_word(user_token, client):
     assert response.json()["code"] == 200
     assert "list" in response.json()["data"]
     assert "total" in response.json()["data"]
+    
+    # 只返回指定字段
+    response = client.post(
+        "/api/root-word/list",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"page_num": 1, "page_size": 10, "fields": ["word_name", "status", "apply_time"]}
+    )
+    for item in response.json()["data"]["list"]:
+        assert set(item) == {"id", "word_name", "status", "apply_time"}
+    
+    response = client.post(
+        "/api/root-word/list",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"page_num": 1, "page_size": 10, "fields": ["password_hash"]}
+    )
+    assert response.status_code == 400
+
+def test_list_root_word_cursor(user_token, client):
+    """测试游标分页遍历词根列表"""
+    for i in range(5):
+        client.post(
+            "/api/root-word/apply",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={
+                "word_name": f"cursor_{i}",
+                "mysql_type": "bigint",
+                "doris_type": "bigint",
+                "clickhouse_type": "UInt64"
+            }
+        )
+    
+    for order_by in ("id", "update_time"):
+        names = []
+        body = {"page_size": 2, "word_name": "cursor_", "order_by": order_by}
+        while True:
+            data = client.post(
+                "/api/root-word/list",
+                headers={"Authorization": f"Bearer {user_token}"},
+                json=body
+            ).json()["data"]
+            names.extend(item["word_name"] for item in data["list"])
+            # 游标分页默认不统计总数
+            assert (data["total"] is None) == ("cursor" in body)
+            if not data["next_cursor"]:
+                break
+            body = {**body, "cursor": data["next_cursor"]}
+        assert sorted(names) == [f"cursor_{i}" for i in range(5)]
+        assert len(names) == 5
+    
+    # 非法游标
+    response = client.post(
+        "/api/root-word/list",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"page_size": 2, "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+def test_list_root_word_keyword(admin_token, client, user_token):
+    """测试按词根名称或注释子串查询，编辑后检索索引同步更新"""
+    response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "word_name": "keyword_code",
+            "mysql_type": "varchar(32)",
+            "doris_type": "varchar(32)",
+            "clickhouse_type": "String",
+            "remark": "检索关键词编码"
+        }
+    )
+    word_id = response.json()["data"]["word_id"]
+    
+    def search(**filters):
+        data = client.post(
+            "/api/root-word/list",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"page_size": 10, **filters}
+        ).json()["data"]
+        return [item["word_name"] for item in data["list"]]
+    
+    assert search(keyword="关键词") == ["keyword_code"]
+    assert search(keyword="WORD_CO") == ["keyword_code"]
+    assert search(word_name="关键词") == []
+    
+    client.put(
+        "/api/root-word/update",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": word_id, "word_name": "keyword_no", "remark": "检索关键词序号"}
+    )
+    assert search(keyword="编码") == []
+    assert search(keyword="序号") == ["keyword_no"]
+    assert search(word_name="word_co") == []
+
+def test_pending_mutation_keeps_dictionary_version(admin_token, client, user_token):
+    """测试申请、驳回待审核词根不递增词典版本号（不重新加载词典），只推进检索版本，列表检索仍可见"""
+    from app.database import SessionLocal
+    from app.services.dictionary_version import read_dictionary_version, read_search_version
+    with SessionLocal() as db:
+        version, search_version = read_dictionary_version(db), read_search_version(db)
+    
+    response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "pending_code", "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}
+    )
+    word_id = response.json()["data"]["word_id"]
+    client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": word_id, "audit_result": 2, "audit_remark": "驳回"}
+    )
+    with SessionLocal() as db:
+        assert read_dictionary_version(db) == version
+        assert read_search_version(db) == search_version + 2
+    
+    data = client.post(
+        "/api/root-word/list",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"page_size": 10, "keyword": "pending_co"}
+    ).json()["data"]
+    assert [item["word_name"] for item in data["list"]] == ["pending_code"]
 
 def test_audit_root_word(admin_token, client, user_token):
     """测试审核词根"""
@@ -96,6 +219,20 @@ def test_check_ddl_root_word(user_token, client):
     assert response.status_code == 200
     assert "compliant_fields" in response.json()["data"]
     assert "non_compliant_fields" in response.json()["data"]
+    assert response.json()["data"]["debug_info"] is None
+    
+    # 显式开启调试时返回解析过程
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "ddl_content": "CREATE TABLE test (test_id bigint, test_name varchar(32))",
+            "debug": True
+        }
+    )
+    assert response.status_code == 200
+    assert "解析得到 2 个字段" in response.json()["data"]["debug_info"]["steps"]
+    assert response.json()["data"]["debug_info"]["first_field_preview"] == "test_id bigint"
 
 def test_replace_ddl_root_word(user_token, client):
     """测试 DDL 词根替换"""
@@ -108,3 +245,534 @@ def test_replace_ddl_root_word(user_token, client):
     )
     assert response.status_code == 200
     assert "replaced_ddl" in response.json()["data"]
+
+def test_check_ddl_uses_dictionary_snapshot(admin_token, client, user_token):
+    """测试 DDL 校验读取词典快照，审核/废弃后自动刷新"""
+    create_response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "word_name": "snapshot_id",
+            "mysql_type": "bigint",
+            "doris_type": "bigint",
+            "clickhouse_type": "UInt64"
+        }
+    )
+    word_id = create_response.json()["data"]["word_id"]
+    ddl = {"ddl_content": "CREATE TABLE t (snapshot_id BIGINT) ENGINE=InnoDB"}
+    
+    # 审核通过后校验合规
+    client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": word_id, "audit_result": 1}
+    )
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json=ddl
+    )
+    assert [f["field_name"] for f in response.json()["data"]["compliant_fields"]] == ["snapshot_id"]
+    
+    # 废弃后校验缺失
+    client.post(
+        f"/api/root-word/discard/{word_id}",
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json=ddl
+    )
+    assert [w["word_name"] for w in response.json()["data"]["missing_root_words"]] == ["snapshot_id"]
+
+def test_check_ddl_no_db_queries(user_token, client, monkeypatch):
+    """测试词典版本检查间隔内 DDL 校验不产生数据库查询"""
+    from sqlalchemy import event
+    from app.database import engine
+    from app.services import root_word_dictionary
+    
+    monkeypatch.setattr(root_word_dictionary, "DICTIONARY_VERSION_CHECK_INTERVAL", 60)
+    root_word_dictionary.get_root_word_dictionary()
+    statements = []
+    
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        response = client.post(
+            "/api/root-word/ddl/check",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"ddl_content": "CREATE TABLE t (a_id bigint, b_id bigint, c_id bigint)"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+    assert response.status_code == 200
+    assert statements == []
+
+def test_check_ddl_batch(user_token, client):
+    """测试多语句 DDL 批量校验"""
+    response = client.post(
+        "/api/root-word/ddl/check-batch",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "ddl_content": "CREATE TABLE t1 (x_id bigint); DROP TABLE t0; CREATE TABLE t2 (y_id int, z_id int);"
+        }
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["table_count"] == 2
+    assert [t["table_name"] for t in data["tables"]] == ["t1", "t2"]
+    assert [w["word_name"] for w in data["missing_root_words"]] == ["x_id", "y_id", "z_id"]
+
+def test_check_ddl_stream(user_token, client):
+    """测试流式 NDJSON 批量校验"""
+    import json
+    response = client.post(
+        "/api/root-word/ddl/check-stream",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "ddl_content": "CREATE TABLE t1 (x_id bigint); CREATE TABLE t2 (y_id int);"
+        }
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == ["table", "table", "summary"]
+    assert [line["table_name"] for line in lines[:2]] == ["t1", "t2"]
+    assert lines[-1]["table_count"] == 2
+
+def test_replace_ddl_rewrites_type_spans(admin_token, client, user_token):
+    """测试 DDL 替换按字段类型偏移改写，不影响注释和其他字段"""
+    create_response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "word_name": "spanprice",
+            "mysql_type": "decimal(18,2)",
+            "doris_type": "decimal(18,2)",
+            "clickhouse_type": "Decimal(18, 2)"
+        }
+    )
+    client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": create_response.json()["data"]["word_id"], "audit_result": 1}
+    )
+    
+    response = client.post(
+        "/api/root-word/ddl/replace",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "ddl_content": "CREATE TABLE t (`spanprice` int COMMENT 'spanprice int', other_col int)"
+        }
+    )
+    data = response.json()["data"]
+    assert data["replaced_ddl"] == "CREATE TABLE t (`spanprice` decimal(18,2) COMMENT 'spanprice int', other_col int)"
+    assert [f["field_name"] for f in data["replaced_fields"]] == ["spanprice"]
+    
+    # ClickHouse 的 Nullable 包装保留，只替换内层类型
+    response = client.post(
+        "/api/root-word/ddl/replace",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={
+            "ddl_content": "CREATE TABLE t (spanprice Nullable(Int32)) ENGINE = MergeTree() ORDER BY tuple()"
+        }
+    )
+    data = response.json()["data"]
+    assert data["database_engine"] == "clickhouse"
+    assert data["replaced_ddl"] == "CREATE TABLE t (spanprice Nullable(Decimal(18, 2))) ENGINE = MergeTree() ORDER BY tuple()"
+    assert data["replaced_fields"][0]["new_type"] == "Nullable(Decimal(18, 2))"
+
+def test_check_and_replace_agree_on_partial_match(admin_token, client, user_token):
+    """测试只有部分片段是词根的字段：校验报告缺失，替换不改写类型"""
+    create_response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "partial_id", "mysql_type": "bigint", "doris_type": "bigint", "clickhouse_type": "Int64"}
+    )
+    client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": create_response.json()["data"]["word_id"], "audit_result": 1}
+    )
+    ddl = {"ddl_content": "CREATE TABLE t (x_w_1_partial_id int, partial_id int) ENGINE=InnoDB"}
+    
+    data = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json=ddl
+    ).json()["data"]
+    assert [w["word_name"] for w in data["missing_root_words"]] == ["x_w_1_partial_id"]
+    
+    data = client.post(
+        "/api/root-word/ddl/replace",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json=ddl
+    ).json()["data"]
+    assert data["replaced_ddl"] == "CREATE TABLE t (x_w_1_partial_id int, partial_id bigint) ENGINE=InnoDB"
+    assert [f["field_name"] for f in data["replaced_fields"]] == ["partial_id"]
+
+def test_check_ddl_result_cache(admin_token, client, user_token):
+    """测试相同 DDL 命中结果缓存，词根变化后失效"""
+    ddl = {"ddl_content": "CREATE TABLE t (cache_id bigint)"}
+    headers = {"Authorization": f"Bearer {user_token}"}
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    
+    client.post("/api/root-word/ddl/check", headers=headers, json=ddl)
+    before = client.get("/api/root-word/ddl/cache-stats", headers=admin_headers).json()["data"]
+    response = client.post("/api/root-word/ddl/check", headers=headers, json={"ddl_content": ddl["ddl_content"] + "\n"})
+    after = client.get("/api/root-word/ddl/cache-stats", headers=admin_headers).json()["data"]
+    assert after["hits"] == before["hits"] + 1
+    assert [w["word_name"] for w in response.json()["data"]["missing_root_words"]] == ["cache_id"]
+    
+    # 词根生效后缓存失效
+    create_response = client.post(
+        "/api/root-word/apply",
+        headers=headers,
+        json={"word_name": "cache_id", "mysql_type": "bigint", "doris_type": "bigint", "clickhouse_type": "Int64"}
+    )
+    client.post(
+        "/api/root-word/audit",
+        headers=admin_headers,
+        json={"word_id": create_response.json()["data"]["word_id"], "audit_result": 1}
+    )
+    response = client.post("/api/root-word/ddl/check", headers=headers, json=ddl)
+    assert [f["field_name"] for f in response.json()["data"]["compliant_fields"]] == ["cache_id"]
+
+def test_import_root_words(admin_token, client, user_token):
+    """测试批量导入词根：新建、文件内重复、校验失败、跳过与覆盖"""
+    csv_content = (
+        "word_name,mysql_type,doris_type,clickhouse_type,remark\n"
+        "import_a,bigint,bigint,Int64,导入词根A\n"
+        "import_b,varchar(64),varchar(64),String,\n"
+        "import_a,int,int,Int32,重复\n"
+        ",int,int,Int32,缺少名称\n"
+    )
+    response = client.post(
+        "/api/root-word/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("roots.csv", csv_content.encode(), "text/csv")}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["created"], data["failed"]) == (4, 2, 2)
+    assert [item["result"] for item in data["results"]] == ["created", "created", "failed", "failed"]
+    
+    # 导入的词根直接生效，DDL 校验立即可用
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"ddl_content": "CREATE TABLE t (import_a bigint)"}
+    )
+    assert response.json()["data"]["compliant_fields"][0]["field_name"] == "import_a"
+    
+    # 普通用户无权导入
+    response = client.post(
+        "/api/root-word/import",
+        headers={"Authorization": f"Bearer {user_token}"},
+        files={"file": ("roots.csv", csv_content.encode(), "text/csv")}
+    )
+    assert response.status_code == 403
+    
+    json_content = '[{"word_name": "import_a", "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}]'
+    response = client.post(
+        "/api/root-word/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("roots.json", json_content.encode(), "application/json")}
+    )
+    assert response.json()["data"]["skipped"] == 1
+    response = client.post(
+        "/api/root-word/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("roots.json", json_content.encode(), "application/json")},
+        data={"overwrite": "true"}
+    )
+    assert response.json()["data"]["updated"] == 1
+    
+    response = client.post(
+        "/api/root-word/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("roots.txt", b"import_c", "text/plain")}
+    )
+    assert response.status_code == 400
+
+def test_batch_audit_discard_recover(admin_token, client, user_token):
+    """测试批量审核、废弃、恢复，返回成功与失败的词根 ID"""
+    word_ids = []
+    for name in ("batch_a", "batch_b"):
+        response = client.post(
+            "/api/root-word/apply",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"word_name": name, "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}
+        )
+        word_ids.append(response.json()["data"]["word_id"])
+    
+    def batch(action, ids, **extra):
+        response = client.post(
+            f"/api/root-word/batch-{action}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            json={"word_ids": ids, **extra}
+        )
+        assert response.status_code == 200
+        return response.json()["data"]
+    
+    data = batch("audit", word_ids + [999999], audit_result=1)
+    assert data["succeeded"] == word_ids
+    assert data["failed"] == [{"word_id": 999999, "message": "词根不存在"}]
+    
+    # 已审核的词根不能再次审核，全部失败时不递增词典版本号
+    from app.database import SessionLocal
+    from app.services.dictionary_version import read_dictionary_version
+    with SessionLocal() as db:
+        version = read_dictionary_version(db)
+    data = batch("audit", word_ids, audit_result=1)
+    assert data["succeeded"] == [] and len(data["failed"]) == 2
+    with SessionLocal() as db:
+        assert read_dictionary_version(db) == version
+    
+    assert batch("discard", word_ids)["succeeded"] == word_ids
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"ddl_content": "CREATE TABLE t (batch_a int)"}
+    )
+    assert response.json()["data"]["missing_root_words"]
+    
+    assert batch("recover", word_ids[:1])["succeeded"] == word_ids[:1]
+    response = client.post(
+        "/api/root-word/batch-recover",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_ids": word_ids}
+    )
+    assert response.status_code == 403
+
+def test_mutation_rolls_back_without_log(admin_token, client, user_token, monkeypatch):
+    """测试写操作日志失败时词根变更一并回滚"""
+    response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "uow_word", "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}
+    )
+    word_id = response.json()["data"]["word_id"]
+    
+    def broken_log(*args, **kwargs):
+        raise RuntimeError("日志写入失败")
+    
+    monkeypatch.setattr("app.api.root_word.add_operation_log", broken_log)
+    with pytest.raises(RuntimeError):
+        client.post(
+            "/api/root-word/audit",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            json={"word_id": word_id, "audit_result": 1}
+        )
+    
+    data = client.post(
+        "/api/root-word/list",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "uow_word", "fields": ["status"]}
+    ).json()["data"]
+    assert data["list"][0]["status"] == "pending_audit"
+
+def test_async_operation_log(admin_token, client, user_token, monkeypatch):
+    """测试异步操作日志在事务提交后批量写入，回滚的变更不记录日志"""
+    from app.database import SessionLocal
+    from app.models.operation_log import RootWordOperationLog
+    from app.services import operation_log_writer
+    
+    writer = operation_log_writer.OperationLogWriter(batch_size=10, flush_interval=0.05)
+    monkeypatch.setattr(operation_log_writer, "OPERATION_LOG_MODE", "async")
+    monkeypatch.setattr(operation_log_writer, "operation_log_writer", writer)
+    
+    response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "async_log_word", "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}
+    )
+    word_id = response.json()["data"]["word_id"]
+    response = client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": word_id, "audit_result": 1}
+    )
+    assert response.json()["code"] == 200
+    
+    # 重复审核失败，不产生日志
+    response = client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": word_id, "audit_result": 1}
+    )
+    assert response.status_code == 400
+    
+    writer.shutdown()
+    with SessionLocal() as db:
+        logs = db.query(RootWordOperationLog).filter(RootWordOperationLog.word_id == word_id).all()
+    assert sorted(log.operation_type.value for log in logs) == ["audit", "create"]
+    assert all(log.operation_time is not None for log in logs)
+
+def test_operation_time_same_clock_in_both_modes(client, user_token, monkeypatch, operation_log_writer):
+    """测试同步和异步日志模式的操作时间都由应用按 UTC 记录，与申请时间一致"""
+    from app.database import SessionLocal
+    from app.models.operation_log import RootWordOperationLog
+    from app.models.root_word import RootWord
+    from app.services import operation_log_writer as writer_module
+    
+    word_ids = []
+    for mode in ("sync", "async"):
+        monkeypatch.setattr(writer_module, "OPERATION_LOG_MODE", mode)
+        response = client.post(
+            "/api/root-word/apply",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"word_name": f"{mode}_time_word", "mysql_type": "int", "doris_type": "int", "clickhouse_type": "Int32"}
+        )
+        word_ids.append(response.json()["data"]["word_id"])
+    
+    operation_log_writer.shutdown()
+    with SessionLocal() as db:
+        for word_id in word_ids:
+            apply_time = db.get(RootWord, word_id).apply_time
+            log = db.query(RootWordOperationLog).filter(RootWordOperationLog.word_id == word_id).one()
+            assert abs((log.operation_time.replace(tzinfo=None) - apply_time).total_seconds()) < 5
+    
+    # 同步模式也由应用显式记录时间，不使用数据库默认值
+    from app.models.operation_log import OperationType
+    from app.services.unit_of_work import add_operation_log
+    monkeypatch.setattr(writer_module, "OPERATION_LOG_MODE", "sync")
+    with SessionLocal() as db:
+        add_operation_log(db, word_ids[0], OperationType.CREATE, "tester", "")
+        assert [log.operation_time is not None for log in db.new] == [True]
+
+def test_reload_after_other_worker_change(admin_token, client, user_token, monkeypatch):
+    """测试其他 worker 提交的词根变更通过词典版本号被本 worker 发现并重新加载"""
+    from app.database import SessionLocal
+    from app.models.root_word import RootWord, RootWordStatus
+    from app.services import root_word_dictionary
+    from app.services.unit_of_work import unit_of_work
+    
+    monkeypatch.setattr(root_word_dictionary, "DICTIONARY_VERSION_CHECK_INTERVAL", 0)
+    ddl = {"ddl_content": "CREATE TABLE t (other_worker_id BIGINT) ENGINE=InnoDB"}
+    
+    def check():
+        return client.post(
+            "/api/root-word/ddl/check",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json=ddl
+        ).json()["data"]
+    
+    def search():
+        return client.post(
+            "/api/root-word/list",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"word_name": "other_worker", "fields": ["word_name"]}
+        ).json()["data"]["list"]
+    
+    assert [w["word_name"] for w in check()["missing_root_words"]] == ["other_worker_id"]
+    assert search() == []
+    
+    # 模拟其他 worker：直接写库并递增词典版本号，不刷新本进程的快照和索引
+    with SessionLocal() as db, unit_of_work(db):
+        db.add(RootWord(
+            word_name="other_worker_id", mysql_type="bigint", doris_type="bigint", clickhouse_type="Int64",
+            status=RootWordStatus.EFFECTIVE, apply_user="admin"
+        ))
+    
+    assert [f["field_name"] for f in check()["compliant_fields"]] == ["other_worker_id"]
+    
+    # 索引在后台重建，重建完成前退回数据库查询，其他 worker 的变更立即可查到
+    from app.services import root_word_search
+    assert [item["word_name"] for item in search()] == ["other_worker_id"]
+    root_word_search._rebuild_thread.join()
+    assert root_word_search._index.search_word_name("other_worker") is not None
+    assert [item["word_name"] for item in search()] == ["other_worker_id"]
+
+def test_shared_dictionary_snapshot(admin_token, client, user_token, monkeypatch, tmp_path):
+    """测试共享词典文件：worker 启动时映射已有文件，不重新查询词根表"""
+    from sqlalchemy import event
+    from app.database import engine
+    from app.services import root_word_dictionary
+    from app.utils.type_normalizer import CANONICAL_REVISION
+    
+    monkeypatch.setattr(root_word_dictionary, "DICTIONARY_SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(root_word_dictionary, "_snapshot", None)
+    response = client.post(
+        "/api/root-word/apply",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"word_name": "shared_id", "mysql_type": "bigint", "doris_type": "bigint", "clickhouse_type": "Int64"}
+    )
+    client.post(
+        "/api/root-word/audit",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"word_id": response.json()["data"]["word_id"], "audit_result": 1}
+    )
+    version = root_word_dictionary.get_root_word_dictionary().version
+    assert [p.name for p in tmp_path.iterdir()] == [f"root_word_dictionary.{version}.{CANONICAL_REVISION}.bin"]
+    
+    # 模拟新启动的 worker
+    monkeypatch.setattr(root_word_dictionary, "_snapshot", None)
+    statements = []
+    
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        dictionary = root_word_dictionary.get_root_word_dictionary()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert isinstance(dictionary, root_word_dictionary.MappedRootWordDictionary)
+    assert len(statements) == 1 and "root_word_dictionary_version" in statements[0]
+    
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"ddl_content": "CREATE TABLE t (shared_id BIGINT) ENGINE=InnoDB"}
+    )
+    assert [f["field_name"] for f in response.json()["data"]["compliant_fields"]] == ["shared_id"]
+
+def test_startup_warmup(admin_token, monkeypatch, operation_log_writer):
+    """测试应用启动阶段预热词典快照与检索索引并记录各阶段耗时"""
+    from fastapi.testclient import TestClient
+    from app.services import root_word_dictionary, root_word_search, startup
+    from main import app
+    
+    monkeypatch.setattr(startup, "APP_ENV", "development")
+    monkeypatch.setattr(startup, "STARTUP_WARMUP_PHASES", list(startup.WARMUP_PHASES))
+    monkeypatch.setattr(root_word_dictionary, "_snapshot", None)
+    monkeypatch.setattr(root_word_search, "_index", None)
+    with TestClient(app) as client:
+        timings = app.state.startup_timings
+        assert list(timings) == ["create_tables", "db_pool", "dictionary", "fuzzy_index", "search_index"]
+        assert root_word_dictionary._snapshot is not None
+        assert root_word_dictionary._snapshot._fuzzy_index is not None
+        assert root_word_search._index is not None
+        assert client.get("/health").status_code == 200
+
+def test_check_ddl_survives_version_probe_error(user_token, client, monkeypatch):
+    """测试检查词典版本时数据库出错，DDL 校验继续使用当前快照"""
+    from sqlalchemy.exc import OperationalError
+    from app.services import root_word_dictionary
+    
+    root_word_dictionary.get_root_word_dictionary()
+    
+    def broken_read(db):
+        raise OperationalError("SELECT version", {}, Exception("连接断开"))
+    
+    monkeypatch.setattr(root_word_dictionary, "DICTIONARY_VERSION_CHECK_INTERVAL", 0)
+    monkeypatch.setattr(root_word_dictionary, "read_dictionary_version", broken_read)
+    response = client.post(
+        "/api/root-word/ddl/check",
+        headers={"Authorization": f"Bearer {user_token}"},
+        json={"ddl_content": "CREATE TABLE t (probe_id bigint) ENGINE=InnoDB"}
+    )
+    assert response.status_code == 200
+
+def test_startup_warmup_phases_default(monkeypatch):
+    """测试共享词典文件时默认不在每个 worker 内预热相似词索引和检索索引"""
+    from app.services import startup
+    
+    monkeypatch.delenv("DICTIONARY_SNAPSHOT_DIR", raising=False)
+    assert startup._default_warmup_phases() == "db_pool,dictionary,fuzzy_index,search_index"
+    monkeypatch.setenv("DICTIONARY_SNAPSHOT_DIR", "/dev/shm/root_word_manager")
+    assert startup._default_warmup_phases() == "db_pool,dictionary"
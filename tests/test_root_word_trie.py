@@ -0,0 +1,71 @@
+from app.utils.root_word_trie import RootWordTrie
+
+ROOTS = ["sales_price_last_year", "sales_price", "price", "readers_amount_today", "readers_amount", "amount", "user_id", "dws"]
+
+def build_trie():
+    return RootWordTrie((name, name) for name in ROOTS)
+
+def test_segment_longest_match():
+    """测试优先使用最长的复合词根"""
+    trie = build_trie()
+    assert [s.text for s in trie.segment("sales_price_last_year")] == ["sales_price_last_year"]
+    assert [s.text for s in trie.segment("dws_readers_amount_today")] == ["dws", "readers_amount_today"]
+    assert [s.text for s in trie.segment("sales_price_amount")] == ["sales_price", "amount"]
+
+def test_segment_prefers_coverage():
+    """测试优先覆盖更多片段，未匹配片段单独成段"""
+    trie = build_trie()
+    # sales_price_last 不是词根，回退为 sales_price + last + amount
+    segments = trie.segment("sales_price_last_amount")
+    assert [(s.text, s.entry) for s in segments] == [("sales_price", "sales_price"), ("last", None), ("amount", "amount")]
+    assert [s.entry for s in trie.segment("book_name")] == [None, None]
+
+def test_check_fields_compound_root_words():
+    """测试字段由多个词根组成时以最后一个词根的类型校验"""
+    from app.services.ddl_check import check_fields
+    from app.services.root_word_dictionary import RootWordDictionary, RootWordEntry
+    
+    def entry(word_id, name, type_):
+        types = {"mysql": type_, "doris": type_, "clickhouse": type_}
+        return RootWordEntry(word_id, name, types, {k: v.lower() for k, v in types.items()}, None)
+    
+    dictionary = RootWordDictionary(1, {"dws": entry(1, "dws", "varchar(8)"), "readers_amount": entry(2, "readers_amount", "bigint")})
+    result = check_fields(
+        [("dws_readers_amount", "BIGINT", ""), ("ods_readers_amount", "bigint", "")],
+        "mysql",
+        dictionary
+    )
+    assert [(f["field_name"], f["root_word"], f["root_words"]) for f in result["compliant_fields"]] == [
+        ("dws_readers_amount", "readers_amount", ["dws", "readers_amount"])
+    ]
+    assert result["non_compliant_fields"][0]["matched_root_words"] == ["readers_amount"]
+    assert [w["word_name"] for w in result["missing_root_words"]] == ["ods_readers_amount"]
+
+def test_fuzzy_index_inherited_until_built():
+    """测试新快照的相似词索引构建完成前沿用上一个快照的索引"""
+    from app.services.root_word_dictionary import RootWordDictionary, RootWordEntry
+    
+    def entries(*names):
+        types = {"mysql": "bigint", "doris": "bigint", "clickhouse": "Int64"}
+        return {name: RootWordEntry(i, name, types, types, None) for i, name in enumerate(names)}
+    
+    old = RootWordDictionary(1, entries("user_id", "order_id"))
+    assert [s.word for s in old.suggest("usr_id")] == ["user_id"]
+    
+    new = RootWordDictionary(2, entries("user_id", "order_id", "order_idx"))
+    assert new.inherit_fuzzy_index(old)
+    assert new.fuzzy_index is old.fuzzy_index
+    assert [s.word for s in new.suggest("ordr_idx")] == ["order_id"]
+    # 旧索引中已失效的词根不作为建议
+    discarded = RootWordDictionary(3, entries("user_id", "order_idx"))
+    assert discarded.inherit_fuzzy_index(old)
+    assert discarded.suggest("ordr_id") == []
+    discarded.build_fuzzy_index()
+    assert [s.word for s in discarded.suggest("ordr_idx")] == ["order_idx"]
+    
+    new.build_fuzzy_index()
+    assert new.fuzzy_index is not old.fuzzy_index
+    assert [s.word for s in new.suggest("ordr_idx")] == ["order_idx", "order_id"]
+    
+    # 上一个快照没用过相似词索引时无需后台构建
+    assert not RootWordDictionary(3, {}).inherit_fuzzy_index(RootWordDictionary(2, {}))
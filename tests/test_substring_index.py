@@ -0,0 +1,23 @@
+from app.utils.substring_index import SubstringIndex
+
+def test_substring_index_search():
+    """测试子串查找忽略大小写，过短查询返回 None"""
+    index = SubstringIndex(3, [(1, "user_id"), (2, "User_Name"), (3, "book_id"), (4, None)])
+    assert index.search("user") == [1, 2]
+    assert index.search("_ID") == [1, 3]
+    assert index.search("zzz") == []
+    assert index.search("id") is None
+    assert index.search("_id", limit=1) is None
+
+def test_substring_index_upsert_and_remove():
+    """测试更新与删除后旧倒排项不再命中，并在过期项过多时重建"""
+    index = SubstringIndex(2, [(1, "图书编号"), (2, "图书名称")])
+    index.upsert(1, "用户编号")
+    assert index.search("图书") == [2]
+    assert index.search("编号") == [1]
+    index.remove(2)
+    assert index.search("图书") == []
+    for i in range(10):
+        index.upsert(1, f"用户编号{i}")
+    assert index.search("编号9") == [1]
+    assert len(index) == 1
@@ -0,0 +1,34 @@
+from app.utils.type_normalizer import canonical_type
+
+def test_canonical_type_mysql():
+    """测试 MySQL/Doris 类型规范化"""
+    assert canonical_type("mysql", "VARCHAR( 255 )") == canonical_type("mysql", "varchar(255)")
+    assert canonical_type("mysql", "decimal(10, 2)") == "decimal(10,2)"
+    assert canonical_type("mysql", "bigint(20)") == canonical_type("mysql", "BIGINT")
+    assert canonical_type("mysql", "integer") == "int"
+    assert canonical_type("doris", "decimal(18)") == "decimal(18,0)"
+    assert canonical_type("mysql", "varchar(32)") != canonical_type("mysql", "varchar(64)")
+
+def test_canonical_type_clickhouse():
+    """测试 ClickHouse 包装类型和别名规范化"""
+    assert canonical_type("clickhouse", "Nullable(String)") == canonical_type("clickhouse", "String")
+    assert canonical_type("clickhouse", "LowCardinality(Nullable(String))") == "string"
+    assert canonical_type("clickhouse", "BIGINT") == canonical_type("clickhouse", "Int64")
+    assert canonical_type("clickhouse", "Decimal(18, 2)") == "decimal(18,2)"
+    # 只去掉最外层 Nullable
+    assert canonical_type("clickhouse", "Array(Nullable(Int64))") != canonical_type("clickhouse", "Array(Int64)")
+
+def test_canonical_type_modifiers():
+    """测试整数显示宽度与 unsigned 等修饰词"""
+    assert canonical_type("mysql", "int(11) unsigned") == "int unsigned"
+    assert canonical_type("mysql", "INT(11) UNSIGNED") == canonical_type("mysql", "int unsigned")
+    assert canonical_type("mysql", "bigint(20) unsigned zerofill") == "bigint unsigned zerofill"
+    assert canonical_type("mysql", "int unsigned") != canonical_type("mysql", "int")
+    assert canonical_type("mysql", "decimal(10, 2) unsigned") == "decimal(10,2) unsigned"
+    assert canonical_type("mysql", "double precision") == "double precision"
+
+def test_canonical_type_unparsed():
+    """测试含无法识别字符或无法完整解析的类型不做规范化"""
+    assert canonical_type("mysql", "decimal(10,-2)") == "decimal(10,-2)"
+    assert canonical_type("mysql", "decimal(10,-2)") != canonical_type("mysql", "decimal(10,2)")
+    assert canonical_type("mysql", " Varchar(32)) ") == "varchar(32))"